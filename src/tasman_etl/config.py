@@ -79,6 +79,12 @@ class Settings:  # pragma: no cover - compatibility shim
         """
         load_env()
         self.dq_enforce: bool = env_bool("DQ_ENFORCE", True)
+        self.dq_engine: str = str(env("DQ_ENGINE", "native")).lower()
+        self.load_mode: str = str(env("LOAD_MODE", "bulk")).lower()
+        self.load_pipeline: bool = env_bool("LOAD_PIPELINE", True)
+        self.load_prepare: bool = env_bool("LOAD_PREPARE", True)
+        self.normalise_strict: bool = env_bool("NORMALISE_STRICT", False)
+        self.raw_json_mode: str = str(env("RAW_JSON_MODE", "trimmed")).lower()
         self.db_url: str = db_url()
 
 
@@ -0,0 +1,9 @@
+BEGIN;
+
+-- SHA-256 of the normalised job content (job, details, children; lineage excluded).
+-- Loaders skip the rewrite of unchanged postings and only touch their lineage columns.
+-- Existing rows start NULL, so each is rewritten once on its next load.
+ALTER TABLE public.job
+  ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMIT;
@@ -0,0 +1,13 @@
+BEGIN;
+
+-- Per-search high-water mark for incremental runs (INCREMENTAL=true): the newest
+-- publication_start_date loaded by a search, used to request only recent postings
+-- (DatePosted) on its next run. search_key is the normalised search parameters.
+CREATE TABLE IF NOT EXISTS public.search_watermark (
+  search_key             TEXT PRIMARY KEY,
+  high_water             TIMESTAMPTZ NOT NULL,
+  last_run_id            TEXT NOT NULL,
+  updated_at             TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+COMMIT;
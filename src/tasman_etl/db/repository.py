@@ -4,28 +4,131 @@ This module contains database repository functions for managing job data.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+import hashlib
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TypeVar
 
 import psycopg
+from psycopg import sql
 from psycopg.types.json import Json
+from pydantic_core import to_json
 
-from tasman_etl.models import (
-    JobCategoryRecord,
-    JobDetailsRecord,
-    JobGradeRecord,
-    JobLocationRecord,
-    JobRecord,
+from tasman_etl.transform import (
+    CATEGORY_COLUMNS,
+    DETAILS_COLUMNS,
+    GRADE_COLUMNS,
+    JOB_COLUMNS,
+    LOCATION_COLUMNS,
+    Bundle,
+    PageRows,
+    content_item,
+    page_rows_from_bundles,
 )
 
+_T = TypeVar("_T")
 
-@dataclass(frozen=True)
-class PageBundle:
-    job: JobRecord
-    details: JobDetailsRecord
-    locations: list[JobLocationRecord]
-    categories: list[JobCategoryRecord]
-    grades: list[JobGradeRecord]
+# Loader strategies selectable by the runner (LOAD_MODE env var)
+LOAD_MODES: tuple[str, ...] = ("bulk", "copy", "row")
+
+# Lineage columns change on every run; they are excluded from the content hash and are the
+# only columns touched for unchanged postings.
+_LINEAGE_COLUMNS: tuple[str, ...] = ("source_event_time", "ingest_run_id")
+
+# ON CONFLICT predicate of every job upsert: rewrite only if the content changed, and never
+# with a posting older than the stored one (replaying past bronze pages must not regress
+# newer rows). Unknown times do not block a write.
+_JOB_CHANGED = (
+    "job.content_hash IS DISTINCT FROM EXCLUDED.content_hash\n"
+    "      AND NOT coalesce(job.source_event_time > EXCLUDED.source_event_time, false)"
+)
+
+# Columns written to ``job`` by the loaders (the hash is computed here, not on JobRecord)
+_JOB_LOAD_COLUMNS: tuple[str, ...] = (*JOB_COLUMNS, "content_hash")
+
+# Positions of the hashed / raw_json / lineage values within a JOB_COLUMNS row (raw_json is
+# hashed through ``content_item``, not as stored)
+_HASHED_IDX: tuple[int, ...] = tuple(
+    i for i, c in enumerate(JOB_COLUMNS) if c not in (*_LINEAGE_COLUMNS, "raw_json")
+)
+_RAW_JSON_IDX = JOB_COLUMNS.index("raw_json")
+_LINEAGE_IDX: tuple[int, ...] = tuple(JOB_COLUMNS.index(c) for c in _LINEAGE_COLUMNS)
+
+
+# One job with its details and children (the transform's Bundle, loaded as-is)
+PageBundle = Bundle
+
+
+@dataclass
+class LoadResult:
+    """
+    Outcome of a load: job_id per position_id plus change-detection counts.
+
+    ``unchanged`` postings matched the stored content hash, so only their lineage columns
+    were touched (no raw_json/details rewrite, no child delete/insert). Postings older than
+    the stored row (by source_event_time, e.g. a replayed bronze page) also count as
+    unchanged and are left alone entirely, lineage included.
+    ``child_rows_written`` counts child rows actually inserted, updated or deleted.
+    """
+
+    job_ids: dict[str, int] = field(default_factory=dict)
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    child_rows_written: int = 0
+
+    def record(self, position_id: str, job_id: int, outcome: str) -> None:
+        """
+        Record one job's outcome.
+
+        :param position_id: The job's position_id.
+        :param job_id: The job's surrogate key.
+        :param outcome: One of "inserted", "updated" or "unchanged".
+        """
+        self.job_ids[position_id] = job_id
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+def content_hash(bundle: PageBundle) -> str:
+    """
+    Hash a bundle's content: its job, details and child rows except lineage columns, plus
+    the part of raw_json no column holds (see ``transform.content_item``).
+
+    Hashing the normalised rows rather than only ``raw_json`` means a change to the
+    transform logic also counts as a change, so such postings are rewritten once. Search-
+    specific item keys (RelevanceRank) are not hashed, so a posting that only moved in the
+    result order stays unchanged.
+
+    :param bundle: The job bundle.
+    :return: The hex SHA-256 digest.
+    """
+    return _content_hashes(page_rows_from_bundles([bundle]))[0]
+
+
+def _content_hashes(rows: PageRows) -> list[str]:
+    """
+    Compute ``content_hash`` for every job of a column-oriented batch.
+
+    :param rows: The batch.
+    :return: One hex SHA-256 digest per job, in batch order.
+    """
+    locs, cats, grades = (rows.children(t) for t in ("locations", "categories", "grades"))
+    out = []
+    for i, (job, details) in enumerate(zip(rows.rows("job"), rows.rows("details"), strict=True)):
+        doc = (
+            [job[k] for k in _HASHED_IDX],
+            content_item(job[_RAW_JSON_IDX]),
+            details,
+            locs[i],
+            cats[i],
+            [g[0] for g in grades[i]],
+        )
+        raw = json.dumps(doc, sort_keys=True, separators=(",", ":"), default=str)
+        out.append(hashlib.sha256(raw.encode("utf-8")).hexdigest())
+    return out
 
 
 def upsert_page(
@@ -33,323 +136,930 @@ def upsert_page(
     bundle: PageBundle,
     *,
     statement_timeout: str = "5s",
+    result: LoadResult | None = None,
+    pipeline: bool = True,
+    prepare: bool = True,
 ) -> int:
     """
     Upsert one job and fully synchronise its children in a single txn.
-    Returns job_id.
+    Returns job_id. If the content hash is unchanged, only lineage columns are touched.
 
     :param conn: The database connection.
     :param bundle: The job bundle to upsert.
     :param statement_timeout: The statement timeout to use.
+    :param result: Optional accumulator for inserted/updated/unchanged counts.
+    :param pipeline: Send the job's statements in psycopg pipeline mode (see ``upsert_rows``).
+    :param prepare: Use server-side prepared statements (see ``upsert_rows``).
     :return: The job ID of the upserted job.
     """
-    with conn.transaction(), conn.cursor() as cur:  # combined contexts (SIM117)
+    rows = page_rows_from_bundles([bundle])
+    jobs, details, locs, cats, grades = _row_tuples(rows)
+    with (
+        _auto_prepare(conn, prepare),
+        conn.pipeline() if pipeline else nullcontext() as pipe,
+        conn.transaction(),
+        _row_cursors(conn) as (cur, writes),
+    ):
         # keep the txn bounded (LOCAL scope for this txn)
-        cur.execute("SET LOCAL statement_timeout = '5s'")  # literal, not a %s param
+        cur.execute(
+            sql.SQL("SET LOCAL statement_timeout = {}").format(sql.Literal(statement_timeout))
+        )
+        return _upsert_one(
+            cur,
+            writes,
+            (jobs[0], _content_hashes(rows)[0], details[0], locs[0], cats[0], grades[0]),
+            result,
+            pipe=pipe,
+            prepare=prepare,
+        )
+
 
-        job_id = _upsert_job(cur, bundle.job)
+def upsert_rows(
+    conn: psycopg.Connection,
+    rows: PageRows,
+    *,
+    statement_timeout: str = "5s",
+    pipeline: bool = True,
+    prepare: bool = True,
+) -> LoadResult:
+    """
+    Load a batch job by job, one transaction each (the row-by-row loader).
 
-        # Replace children for determinism
-        cur.execute("DELETE FROM job_location WHERE job_id = %s;", (job_id,))
-        cur.execute("DELETE FROM job_category WHERE job_id = %s;", (job_id,))
-        cur.execute("DELETE FROM job_grade WHERE job_id = %s;", (job_id,))
+    Same end state as calling ``upsert_page`` per job in order, but values are bound
+    positionally from the batch's row tuples: no DTO is built, dumped or turned into a
+    dict per row.
 
-        _insert_locations(cur, job_id, bundle.locations)
-        _insert_categories(cur, job_id, bundle.categories)
-        _insert_grades(cur, job_id, bundle.grades)
+    With ``pipeline`` the statements are sent in psycopg pipeline mode, so a job costs
+    three round trips (job upsert, child/details writes, commit folded into the next job)
+    instead of one per statement. With ``prepare`` the fixed statement texts are parsed and
+    planned once per connection; turn it off behind a transaction-pooling PgBouncer (no
+    statement of the load is then prepared, not even by psycopg's auto-prepare). The
+    cursors are opened once per batch and reused for every job.
 
-        _upsert_details(cur, job_id, bundle.details)
+    :param conn: The database connection.
+    :param rows: The batch to load.
+    :param statement_timeout: The statement timeout to use (per job txn).
+    :param pipeline: Use pipeline mode (default: True).
+    :param prepare: Use server-side prepared statements (default: True).
+    :return: job_id per position_id and inserted/updated/unchanged counts.
+    """
+    result = LoadResult()
+    hashes = _content_hashes(rows)
+    jobs, details, locs, cats, grades = _row_tuples(rows)
+    set_timeout = sql.SQL("SET LOCAL statement_timeout = {}").format(sql.Literal(statement_timeout))
+    with (
+        _auto_prepare(conn, prepare),
+        conn.pipeline() if pipeline else nullcontext() as pipe,
+        _row_cursors(conn) as (cur, writes),
+    ):
+        for i, job in enumerate(jobs):
+            with conn.transaction():
+                cur.execute(set_timeout)
+                _upsert_one(
+                    cur,
+                    writes,
+                    (job, hashes[i], details[i], locs[i], cats[i], grades[i]),
+                    result,
+                    pipe=pipe,
+                    prepare=prepare,
+                )
+    return result
 
-        return job_id
+
+@contextmanager
+def _auto_prepare(conn: psycopg.Connection, prepare: bool) -> Iterator[None]:
+    """
+    Switch off psycopg's automatic statement preparation for a block if ``prepare`` is off.
+
+    ``executemany`` takes no ``prepare`` flag and prepares a statement once it has run
+    ``prepare_threshold`` times, so the connection's threshold is cleared for the block.
+
+    :param conn: The database connection.
+    :param prepare: Whether prepared statements are allowed.
+    """
+    if prepare:
+        yield
+        return
+    saved = conn.prepare_threshold
+    conn.prepare_threshold = None
+    try:
+        yield
+    finally:
+        conn.prepare_threshold = saved
+
+
+@contextmanager
+def _row_cursors(
+    conn: psycopg.Connection,
+) -> Iterator[tuple[psycopg.Cursor, tuple[psycopg.Cursor, ...]]]:
+    """
+    Open the cursors of the row loader: one for the job/details statements and one per
+    child write (each keeps its row count until the pipeline results arrive).
+
+    :param conn: The database connection.
+    :return: (job cursor, six child-write cursors), closed on exit.
+    """
+    with ExitStack() as stack:
+        cur, *writes = (stack.enter_context(conn.cursor()) for _ in range(7))
+        yield cur, tuple(writes)
+
+
+def upsert_pages(
+    conn: psycopg.Connection,
+    pages: Sequence[PageBundle] | PageRows,
+    *,
+    statement_timeout: str = "30s",
+    chunk_size: int = 500,
+) -> LoadResult:
+    """
+    Upsert a whole page (or several pages) with set-based statements in a single txn.
+
+    Statement count is fixed per chunk (job, details, three child deletes, three child inserts)
+    rather than growing with the number of jobs and child rows, so load time is dominated by
+    server-side work instead of round trips. Duplicate position_ids are collapsed (last wins),
+    matching the end state of calling ``upsert_page`` for each bundle in order.
+
+    Jobs whose content hash matches the stored one are left alone apart from their lineage
+    columns; details and children are only rewritten for inserted/updated jobs.
+
+    :param conn: The database connection.
+    :param pages: The job bundles, or the same rows already column-oriented.
+    :param statement_timeout: The statement timeout to use (per statement, txn-local).
+    :param chunk_size: Max jobs per multi-row statement (keeps bind params under the PG limit).
+    :return: job_id per position_id and inserted/updated/unchanged counts.
+    """
+    rows = pages if isinstance(pages, PageRows) else page_rows_from_bundles(pages)
+    latest = _latest(rows)
+    result = LoadResult()
+    if not latest:
+        return result
+
+    hashes = _content_hashes(rows)
+    jobs, details, locs, cats, grades = _row_tuples(rows)
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("SET LOCAL statement_timeout = {}").format(sql.Literal(statement_timeout))
+        )
+        for chunk in _chunks(latest, chunk_size):
+            upserted = _upsert_jobs_bulk(cur, [_job_load_row(jobs[i], hashes[i]) for i in chunk])
+            same = [_lineage(jobs[i]) for i in chunk if jobs[i][0] not in upserted]
+            for pid, job_id in _touch_lineage(cur, same).items():
+                result.record(pid, job_id, "unchanged")
+            for pid, (job_id, inserted) in upserted.items():
+                result.record(pid, job_id, "inserted" if inserted else "updated")
+
+            changed = [i for i in chunk if jobs[i][0] in upserted]
+            if changed:
+                ids = [upserted[jobs[i][0]][0] for i in changed]
+                _upsert_details_bulk(
+                    cur, [(jid, *details[i]) for jid, i in zip(ids, changed, strict=True)]
+                )
+                result.child_rows_written += _sync_children_bulk(
+                    cur,
+                    ids,
+                    [locs[i] for i in changed],
+                    [cats[i] for i in changed],
+                    [grades[i] for i in changed],
+                )
+    return result
+
+
+def copy_pages(
+    conn: psycopg.Connection,
+    pages: Sequence[PageBundle] | PageRows,
+    *,
+    statement_timeout: str = "5min",
+) -> LoadResult:
+    """
+    Load rows by streaming them with COPY into temp staging tables, then merging.
+
+    Intended for backfills: rows go over the wire once via ``cursor.copy()`` into
+    ``ON COMMIT DROP`` temp tables (not WAL-logged), and each target table is then
+    synchronised with a single ``INSERT ... SELECT ... ON CONFLICT`` statement.
+    End state matches ``upsert_pages`` (children are synchronised, last duplicate wins, and
+    unchanged content hashes only touch lineage columns).
+
+    :param conn: The database connection.
+    :param pages: The job bundles, or the same rows already column-oriented.
+    :param statement_timeout: The statement timeout to use (per statement, txn-local).
+    :return: job_id per position_id and inserted/updated/unchanged counts.
+    """
+    rows = pages if isinstance(pages, PageRows) else page_rows_from_bundles(pages)
+    latest = _latest(rows)
+    if not latest:
+        return LoadResult()
+
+    hashes = _content_hashes(rows)
+    jobs, details, locs, cats, grades = _row_tuples(rows)
+    with conn.transaction(), conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("SET LOCAL statement_timeout = {}").format(sql.Literal(statement_timeout))
+        )
+        _create_staging_tables(cur)
+
+        _copy_rows(
+            cur,
+            "stg_job",
+            _JOB_LOAD_COLUMNS,
+            (_job_load_row(jobs[i], hashes[i]) for i in latest),
+        )
+        _copy_rows(
+            cur,
+            "stg_job_details",
+            ("position_id", *DETAILS_COLUMNS),
+            ((jobs[i][0], *details[i]) for i in latest),
+        )
+        _copy_rows(
+            cur,
+            "stg_job_location",
+            ("position_id", *LOCATION_COLUMNS),
+            ((jobs[i][0], *loc) for i in latest for loc in locs[i]),
+        )
+        _copy_rows(
+            cur,
+            "stg_job_category",
+            ("position_id", *CATEGORY_COLUMNS, "ord"),
+            ((*row, k) for k, row in enumerate((jobs[i][0], *c) for i in latest for c in cats[i])),
+        )
+        _copy_rows(
+            cur,
+            "stg_job_grade",
+            ("position_id", *GRADE_COLUMNS),
+            ((jobs[i][0], *g) for i in latest for g in grades[i]),
+        )
+
+        return _merge_staging(cur, expected=len(latest))
 
 
 # ---------- helpers ----------
 
 
-def _upsert_job(cur: psycopg.Cursor, j: JobRecord) -> int:
+def _row_tuples(
+    rows: PageRows,
+) -> tuple[list[tuple], list[tuple], list[list[tuple]], list[list[tuple]], list[list[tuple]]]:
     """
-    Upsert a job record into the database.
+    Materialise a batch's row tuples once, children grouped per job.
 
-    :param cur: The database cursor.
-    :param j: The job record to upsert.
-    :return: The job ID of the upserted job.
+    :param rows: The batch.
+    :return: (job rows, details rows, locations, categories, grades), in batch order.
+    """
+    return (
+        list(rows.rows("job")),
+        list(rows.rows("details")),
+        rows.children("locations"),
+        rows.children("categories"),
+        rows.children("grades"),
+    )
+
+
+def _upsert_one(
+    cur: psycopg.Cursor,
+    writes: Sequence[psycopg.Cursor],
+    job_rows: tuple[tuple, str, tuple, Sequence[tuple], Sequence[tuple], Sequence[tuple]],
+    result: LoadResult | None,
+    *,
+    pipe: psycopg.Pipeline | None = None,
+    prepare: bool = True,
+) -> int:
+    """
+    Upsert one job from its row tuples and synchronise its details and children.
+
+    :param cur: The database cursor (inside the job's transaction).
+    :param writes: Six cursors for the child writes (see ``_row_cursors``).
+    :param job_rows: (job row in JOB_COLUMNS order, content hash, details row in
+        DETAILS_COLUMNS order, LOCATION_COLUMNS rows, (code, name) rows, (code,) rows).
+    :param result: Optional accumulator for inserted/updated/unchanged counts.
+    :param pipe: The active pipeline, if the statements are pipelined.
+    :param prepare: Use server-side prepared statements.
+    :return: The job ID.
     """
-    sql = """
-    INSERT INTO job (
-        position_id,
-        matched_object_id,
-        position_uri,
-        position_title,
-        organization_name,
-        department_name,
-        apply_uri,
-        position_location_display,
-        pay_min,
-        pay_max,
-        pay_rate_interval_code,
-        qualification_summary,
-        publication_start_date,
-        application_close_date,
-        position_start_date,
-        position_end_date,
-        remote_indicator,
-        telework_eligible,
-        source_event_time,
-        ingest_run_id,
-        raw_json
+    job, content_hash, details, locations, categories, grades = job_rows
+    pid = job[0]
+    upserted = _upsert_job(cur, _job_load_row(job, content_hash), prepare=prepare)
+    if upserted is None:
+        job_id = _touch_lineage(cur, [_lineage(job)], prepare=prepare)[pid]
+        if result is not None:
+            result.record(pid, job_id, "unchanged")
+        return job_id
+    job_id, inserted = upserted
+    if result is not None:
+        result.record(pid, job_id, "inserted" if inserted else "updated")
+
+    # Sync children by key: delete removed keys only; upserts skip identical rows.
+    # One cursor per write so each row count survives until the results arrive.
+    writes[0].execute(
+        "DELETE FROM job_location WHERE job_id = %s AND NOT (loc_idx = ANY(%s::smallint[]));",
+        (job_id, [x[0] for x in locations]),
+        prepare=prepare,
     )
-    VALUES (
-        %(position_id)s,
-        %(matched_object_id)s,
-        %(position_uri)s,
-        %(position_title)s,
-        %(organization_name)s,
-        %(department_name)s,
-        %(apply_uri)s,
-        %(position_location_display)s,
-        %(pay_min)s,
-        %(pay_max)s,
-        %(pay_rate_interval_code)s,
-        %(qualification_summary)s,
-        %(publication_start_date)s,
-        %(application_close_date)s,
-        %(position_start_date)s,
-        %(position_end_date)s,
-        %(remote_indicator)s,
-        %(telework_eligible)s,
-        %(source_event_time)s,
-        %(ingest_run_id)s,
-        %(raw_json)s
+    writes[1].execute(
+        "DELETE FROM job_category WHERE job_id = %s AND NOT (code = ANY(%s::text[]));",
+        (job_id, [c[0] for c in categories]),
+        prepare=prepare,
     )
+    writes[2].execute(
+        "DELETE FROM job_grade WHERE job_id = %s AND NOT (code = ANY(%s::text[]));",
+        (job_id, [g[0] for g in grades]),
+        prepare=prepare,
+    )
+    _insert_locations(writes[3], [(job_id, *x) for x in locations])
+    _insert_categories(writes[4], [(job_id, *c) for c in categories])
+    _insert_grades(writes[5], [(job_id, *g) for g in grades])
+    _upsert_details(cur, (job_id, *details), prepare=prepare)
+    if pipe is not None:
+        pipe.sync()
+
+    if result is not None:
+        # The cursors are reused across jobs: skip the inserts this job had nothing for
+        ran = (True, True, True, bool(locations), bool(categories), bool(grades))
+        result.child_rows_written += sum(
+            max(w.rowcount, 0) for w, r in zip(writes, ran, strict=True) if r
+        )
+    return job_id
+
+
+def _upsert_job(
+    cur: psycopg.Cursor, row: tuple, *, prepare: bool = True
+) -> tuple[int, bool] | None:
+    """
+    Upsert a job row into the database unless its content hash is unchanged (or the stored
+    row is newer).
+
+    :param cur: The database cursor.
+    :param row: The row tuple in _JOB_LOAD_COLUMNS order.
+    :param prepare: Use a server-side prepared statement.
+    :return: (job_id, inserted) or None if the stored row already has this content hash or
+        is newer.
+    """
+    stmt = f"""
+    INSERT INTO job ({", ".join(_JOB_LOAD_COLUMNS)})
+    VALUES {_values_sql(1, len(_JOB_LOAD_COLUMNS))}
     ON CONFLICT (position_id) DO UPDATE SET
-        matched_object_id = EXCLUDED.matched_object_id,
-        position_uri = EXCLUDED.position_uri,
-        position_title = EXCLUDED.position_title,
-        organization_name = EXCLUDED.organization_name,
-        department_name = EXCLUDED.department_name,
-        apply_uri = EXCLUDED.apply_uri,
-        position_location_display = EXCLUDED.position_location_display,
-        pay_min = EXCLUDED.pay_min,
-        pay_max = EXCLUDED.pay_max,
-        pay_rate_interval_code = EXCLUDED.pay_rate_interval_code,
-        qualification_summary = EXCLUDED.qualification_summary,
-        publication_start_date = EXCLUDED.publication_start_date,
-        application_close_date = EXCLUDED.application_close_date,
-        position_start_date = EXCLUDED.position_start_date,
-        position_end_date = EXCLUDED.position_end_date,
-        remote_indicator = EXCLUDED.remote_indicator,
-        telework_eligible = EXCLUDED.telework_eligible,
-        source_event_time = EXCLUDED.source_event_time,
-        ingest_run_id = EXCLUDED.ingest_run_id,
-        raw_json = EXCLUDED.raw_json,
+        {_set_excluded(_JOB_LOAD_COLUMNS[1:])},
         updated_at = now()
-    RETURNING job_id;
+    WHERE {_JOB_CHANGED}
+    RETURNING job_id, (xmax = 0) AS inserted;
+    """
+    cur.execute(stmt, row, prepare=prepare)
+    fetched = cur.fetchone()
+    if fetched is None:  # identical hash or newer stored row: the WHERE skipped the update
+        return None
+    return int(fetched[0]), bool(fetched[1])
+
+
+def _touch_lineage(
+    cur: psycopg.Cursor,
+    jobs: Sequence[tuple[str, datetime | None, str | None]],
+    *,
+    prepare: bool | None = None,
+) -> dict[str, int]:
     """
+    Refresh only the lineage columns of unchanged jobs (no raw_json or updated_at rewrite).
+
+    Lineage never moves backwards: a job whose stored source_event_time is newer keeps it
+    (and its ingest_run_id), but is still reported.
+
+    :param cur: The database cursor.
+    :param jobs: (position_id, source_event_time, ingest_run_id) per unchanged job.
+    :param prepare: Use a server-side prepared statement (default: psycopg decides).
+    :return: Mapping of position_id -> job_id.
+    """
+    if not jobs:
+        return {}
     cur.execute(
-        sql,
-        {
-            **j.model_dump(mode="python"),
-            "raw_json": Json(j.raw_json),  # ensure proper JSONB
-        },
+        """
+        WITH u AS (
+            SELECT * FROM unnest(%s::text[], %s::timestamptz[], %s::text[])
+                AS u(position_id, source_event_time, ingest_run_id)
+        ), touched AS (
+            UPDATE job AS j SET
+                source_event_time = u.source_event_time,
+                ingest_run_id = u.ingest_run_id
+            FROM u
+            WHERE j.position_id = u.position_id
+              AND NOT coalesce(j.source_event_time > u.source_event_time, false)
+        )
+        SELECT j.position_id, j.job_id FROM job j JOIN u USING (position_id);
+        """,
+        tuple(map(list, zip(*jobs, strict=True))),
+        prepare=prepare,
     )
-    row = cur.fetchone()
-    if row is None:
+    job_ids = {str(pid): int(jid) for pid, jid in cur.fetchall()}
+    if len(job_ids) != len(jobs):
         raise RuntimeError(
-            "Upsert of job failed to return job_id (no row from RETURNING). "
-            "Verify SQL still ends with 'RETURNING job_id;' and that ON CONFLICT uses DO UPDATE."
+            f"Lineage update matched {len(job_ids)} of {len(jobs)} unchanged jobs "
+            "(row deleted concurrently?)."
         )
-    return int(row[0])
+    return job_ids
 
 
-def _insert_locations(cur: psycopg.Cursor, job_id: int, rows: Sequence[JobLocationRecord]) -> None:
+def _insert_locations(cur: psycopg.Cursor, rows: Sequence[tuple]) -> None:
     """
-    Insert or update job location records for a specific job.
+    Insert or update one job's location rows (identical rows are skipped).
 
-    :param cur: The database cursor.
-    :param job_id: The ID of the job to update.
-    :param rows: The job location records to upsert.
+    :param cur: The database cursor (its rowcount is the number of rows written).
+    :param rows: (job_id, *LOCATION_COLUMNS) row tuples.
     """
     if not rows:
         return
-    sql = """
-    INSERT INTO job_location (
-        job_id, loc_idx, location_name, country_code, country_sub_division_code,
-        city_name, latitude, longitude
+    cur.executemany(
+        f"""
+        INSERT INTO job_location (job_id, {", ".join(LOCATION_COLUMNS)})
+        VALUES {_values_sql(1, len(LOCATION_COLUMNS) + 1)}
+        ON CONFLICT (job_id, loc_idx) DO UPDATE SET
+            {_set_excluded(LOCATION_COLUMNS[1:])},
+            updated_at = now()
+        WHERE {_changed("job_location", LOCATION_COLUMNS[1:])};
+        """,
+        rows,
     )
-    VALUES (
-        %(job_id)s, %(loc_idx)s, %(location_name)s, %(country_code)s, %(country_sub_division_code)s,
-        %(city_name)s, %(latitude)s, %(longitude)s
+
+
+def _insert_categories(cur: psycopg.Cursor, rows: Sequence[tuple]) -> None:
+    """
+    Insert or update one job's category rows (identical rows are skipped).
+
+    :param cur: The database cursor (its rowcount is the number of rows written).
+    :param rows: (job_id, code, name) row tuples.
+    """
+    if not rows:
+        return
+    cur.executemany(
+        """
+        INSERT INTO job_category (job_id, code, name)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (job_id, code) DO UPDATE SET
+            name = EXCLUDED.name,
+            updated_at = now()
+        WHERE job_category.name IS DISTINCT FROM EXCLUDED.name;
+        """,
+        rows,
     )
-    ON CONFLICT (job_id, loc_idx) DO UPDATE SET
-        location_name = EXCLUDED.location_name,
-        country_code = EXCLUDED.country_code,
-        country_sub_division_code = EXCLUDED.country_sub_division_code,
-        city_name = EXCLUDED.city_name,
-        latitude = EXCLUDED.latitude,
-        longitude = EXCLUDED.longitude,
+
+
+def _insert_grades(cur: psycopg.Cursor, rows: Sequence[tuple]) -> None:
+    """
+    Insert one job's grade rows (existing codes are left alone).
+
+    :param cur: The database cursor (its rowcount is the number of rows written).
+    :param rows: (job_id, code) row tuples.
+    """
+    if not rows:
+        return
+    cur.executemany(
+        """
+        INSERT INTO job_grade (job_id, code)
+        VALUES (%s, %s)
+        ON CONFLICT (job_id, code) DO NOTHING;
+        """,
+        rows,
+    )
+
+
+def _upsert_details(cur: psycopg.Cursor, row: tuple, *, prepare: bool = True) -> None:
+    """
+    Upsert one job's 1:1 job_details row.
+
+    :param cur: The database cursor.
+    :param row: The (job_id, *DETAILS_COLUMNS) row tuple.
+    :param prepare: Use a server-side prepared statement.
+    """
+    stmt = f"""
+    INSERT INTO job_details (job_id, {", ".join(DETAILS_COLUMNS)})
+    VALUES {_values_sql(1, len(DETAILS_COLUMNS) + 1)}
+    ON CONFLICT (job_id) DO UPDATE SET
+        {_set_excluded(DETAILS_COLUMNS)},
         updated_at = now();
     """
-    for r in rows:
-        cur.execute(sql, {"job_id": job_id, **r.model_dump(mode="python")})
+    cur.execute(stmt, row, prepare=prepare)
+
+
+# ---------- set-based helpers (upsert_pages / copy_pages) ----------
+
+
+def _latest(rows: PageRows) -> list[int]:
+    """
+    Pick the last occurrence of each position_id (first-seen order), like loading in order.
+
+    :param rows: The batch.
+    :return: Job indices into the batch.
+    """
+    return list({pid: i for i, pid in enumerate(rows.job["position_id"])}.values())
+
+
+def _chunks(items: list[_T], size: int) -> Iterator[list[_T]]:
+    """
+    Yield successive fixed-size chunks of a list.
+
+    :param items: The items to chunk.
+    :param size: The maximum chunk size.
+    :return: An iterator over the chunks.
+    """
+    for start in range(0, len(items), max(1, size)):
+        yield items[start : start + size]
+
+
+def _values_sql(n_rows: int, n_cols: int) -> str:
+    """
+    Build a multi-row VALUES placeholder list, e.g. "(%s,%s),(%s,%s)".
+
+    :param n_rows: The number of rows.
+    :param n_cols: The number of columns per row.
+    :return: The placeholder SQL fragment.
+    """
+    row = "(" + ",".join(["%s"] * n_cols) + ")"
+    return ",".join([row] * n_rows)
+
+
+def _set_excluded(cols: Sequence[str]) -> str:
+    """
+    Build the ``col = EXCLUDED.col`` list for an ON CONFLICT DO UPDATE clause.
+
+    :param cols: The columns to update.
+    :return: The SET list SQL fragment.
+    """
+    return ",\n        ".join(f"{c} = EXCLUDED.{c}" for c in cols)
+
+
+def _changed(table: str, cols: Sequence[str]) -> str:
+    """
+    Build an ON CONFLICT ... WHERE predicate that is true only if a column value differs.
+
+    :param table: The target table name.
+    :param cols: The non-key columns to compare.
+    :return: The predicate SQL fragment.
+    """
+    stored = ", ".join(f"{table}.{c}" for c in cols)
+    incoming = ", ".join(f"EXCLUDED.{c}" for c in cols)
+    return f"({stored}) IS DISTINCT FROM ({incoming})"
 
 
-def _insert_categories(cur: psycopg.Cursor, job_id: int, rows: Sequence[JobCategoryRecord]) -> None:
+def _job_load_row(job: tuple, content_hash: str) -> tuple:
     """
-    Insert or update job category records for a specific job.
+    Extend a JOB_COLUMNS row to _JOB_LOAD_COLUMNS.
+
+    :param job: The row tuple in JOB_COLUMNS order.
+    :param content_hash: The job's content hash.
+    :return: The row tuple (raw_json wrapped so it binds as JSONB).
+    """
+    # raw_json is the last JOB_COLUMNS column, followed by content_hash; pydantic-core
+    # serialises it straight to the bytes sent for the parameter (no str round trip)
+    return (*job[:-1], Json(job[-1], dumps=to_json), content_hash)
+
+
+def _lineage(job: tuple) -> tuple:
+    """
+    :param job: The row tuple in JOB_COLUMNS order.
+    :return: (position_id, source_event_time, ingest_run_id).
+    """
+    return (job[0], *(job[k] for k in _LINEAGE_IDX))
+
+
+def _upsert_jobs_bulk(cur: psycopg.Cursor, rows: Sequence[tuple]) -> dict[str, tuple[int, bool]]:
+    """
+    Upsert many job rows with one multi-row INSERT ... ON CONFLICT, skipping rows whose
+    stored content hash already matches.
 
     :param cur: The database cursor.
-    :param job_id: The ID of the job to update.
-    :param rows: The job category records to upsert.
+    :param rows: Row tuples in _JOB_LOAD_COLUMNS order (unique position_ids).
+    :return: Mapping of position_id -> (job_id, inserted) for inserted/updated jobs only.
     """
-    if not rows:
-        return
-    sql = """
-    INSERT INTO job_category (job_id, code, name)
-    VALUES (%(job_id)s, %(code)s, %(name)s)
-    ON CONFLICT (job_id, code) DO UPDATE SET
-        name = EXCLUDED.name,
+    stmt = f"""
+    INSERT INTO job ({", ".join(_JOB_LOAD_COLUMNS)})
+    VALUES {_values_sql(len(rows), len(_JOB_LOAD_COLUMNS))}
+    ON CONFLICT (position_id) DO UPDATE SET
+        {_set_excluded(_JOB_LOAD_COLUMNS[1:])},
+        updated_at = now()
+    WHERE {_JOB_CHANGED}
+    RETURNING position_id, job_id, (xmax = 0) AS inserted;
+    """
+    cur.execute(stmt, [v for row in rows for v in row])
+    return {str(pid): (int(jid), bool(ins)) for pid, jid, ins in cur.fetchall()}
+
+
+def _upsert_details_bulk(cur: psycopg.Cursor, rows: Sequence[tuple]) -> None:
+    """
+    Upsert the 1:1 job_details rows for many jobs with one multi-row statement.
+
+    :param cur: The database cursor.
+    :param rows: (job_id, *DETAILS_COLUMNS) row tuples.
+    """
+    stmt = f"""
+    INSERT INTO job_details ({", ".join(("job_id", *DETAILS_COLUMNS))})
+    VALUES {_values_sql(len(rows), len(DETAILS_COLUMNS) + 1)}
+    ON CONFLICT (job_id) DO UPDATE SET
+        {_set_excluded(DETAILS_COLUMNS)},
         updated_at = now();
     """
-    for r in rows:
-        cur.execute(sql, {"job_id": job_id, **r.model_dump(mode="python")})
+    cur.execute(stmt, [v for row in rows for v in row])
 
 
-def _insert_grades(cur: psycopg.Cursor, job_id: int, rows: Sequence[JobGradeRecord]) -> None:
+def _sync_children_bulk(
+    cur: psycopg.Cursor,
+    ids: Sequence[int],
+    locations: Sequence[Sequence[tuple]],
+    categories: Sequence[Sequence[tuple]],
+    grades: Sequence[Sequence[tuple]],
+) -> int:
     """
-    Insert or update job grade records for a specific job.
+    Diff location/category/grade rows for many jobs against what is stored.
+
+    Keys no longer present are deleted, new keys inserted and existing keys updated only
+    if a value changed, so re-loading a posting with the same children writes nothing.
 
     :param cur: The database cursor.
-    :param job_id: The ID of the job to update.
-    :param rows: The job grade records to upsert.
+    :param ids: The job_id of each job to synchronise.
+    :param locations: Per job, its LOCATION_COLUMNS row tuples.
+    :param categories: Per job, its (code, name) row tuples.
+    :param grades: Per job, its (code,) row tuples.
+    :return: The number of child rows inserted, updated or deleted.
     """
-    if not rows:
-        return
-    sql = """
-    INSERT INTO job_grade (job_id, code)
-    VALUES (%(job_id)s, %(code)s)
-    ON CONFLICT (job_id, code) DO NOTHING;
-    """
-    for r in rows:
-        cur.execute(sql, {"job_id": job_id, **r.model_dump(mode="python")})
-
-
-def _upsert_details(cur: psycopg.Cursor, job_id: int, d: JobDetailsRecord) -> None:
-    sql = """
-    INSERT INTO job_details (
-        job_id,
-        job_summary,
-        low_grade,
-        high_grade,
-        promotion_potential,
-        organization_codes,
-        relocation,
-        hiring_path,
-        mco_tags,
-        total_openings,
-        agency_marketing_statement,
-        travel_code,
-        apply_online_url,
-        detail_status_url,
-        major_duties,
-        education,
-        requirements,
-        evaluations,
-        how_to_apply,
-        what_to_expect_next,
-        required_documents,
-        benefits,
-        benefits_url,
-        benefits_display_default_text,
-        other_information,
-        key_requirements,
-        within_area,
-        commute_distance,
-        service_type,
-        announcement_closing_type,
-        agency_contact_email,
-        security_clearance,
-        drug_test_required,
-        position_sensitivity,
-        adjudication_type,
-        financial_disclosure,
-        bargaining_unit_status
+    ids = list(ids)
+    loc_rows = [(jid, *loc) for jid, rows in zip(ids, locations, strict=True) for loc in rows]
+    loc_cols: tuple[list, ...] = tuple(map(list, zip(*loc_rows, strict=True))) or tuple(
+        [] for _ in range(len(LOCATION_COLUMNS) + 1)
+    )
+    # (job_id, code) -> name; collapses repeated codes like per-row ON CONFLICT would
+    cats: dict[tuple[int, str], str | None] = {
+        (jid, code): name for jid, rows in zip(ids, categories, strict=True) for code, name in rows
+    }
+    codes: dict[tuple[int, str], None] = {
+        (jid, g[0]): None for jid, rows in zip(ids, grades, strict=True) for g in rows
+    }
+    cat_keys = ([k[0] for k in cats], [k[1] for k in cats])
+    grade_keys = ([k[0] for k in codes], [k[1] for k in codes])
+
+    written = 0
+    # 1) delete only the keys that disappeared
+    cur.execute(
+        """
+        DELETE FROM job_location t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM unnest(%s::bigint[], %s::smallint[]) AS k(job_id, loc_idx)
+            WHERE k.job_id = t.job_id AND k.loc_idx = t.loc_idx
+          );
+        """,
+        (ids, loc_cols[0], loc_cols[1]),
     )
-    VALUES (
-        %(job_id)s,
-        %(job_summary)s,
-        %(low_grade)s,
-        %(high_grade)s,
-        %(promotion_potential)s,
-        %(organization_codes)s,
-        %(relocation)s,
-        %(hiring_path)s,
-        %(mco_tags)s,
-        %(total_openings)s,
-        %(agency_marketing_statement)s,
-        %(travel_code)s,
-        %(apply_online_url)s,
-        %(detail_status_url)s,
-        %(major_duties)s,
-        %(education)s,
-        %(requirements)s,
-        %(evaluations)s,
-        %(how_to_apply)s,
-        %(what_to_expect_next)s,
-        %(required_documents)s,
-        %(benefits)s,
-        %(benefits_url)s,
-        %(benefits_display_default_text)s,
-        %(other_information)s,
-        %(key_requirements)s,
-        %(within_area)s,
-        %(commute_distance)s,
-        %(service_type)s,
-        %(announcement_closing_type)s,
-        %(agency_contact_email)s,
-        %(security_clearance)s,
-        %(drug_test_required)s,
-        %(position_sensitivity)s,
-        %(adjudication_type)s,
-        %(financial_disclosure)s,
-        %(bargaining_unit_status)s
+    written += cur.rowcount
+    cur.execute(
+        """
+        DELETE FROM job_category t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM unnest(%s::bigint[], %s::text[]) AS k(job_id, code)
+            WHERE k.job_id = t.job_id AND k.code = t.code
+          );
+        """,
+        (ids, *cat_keys),
     )
-    ON CONFLICT (job_id) DO UPDATE SET
-        job_summary = EXCLUDED.job_summary,
-        low_grade = EXCLUDED.low_grade,
-        high_grade = EXCLUDED.high_grade,
-        promotion_potential = EXCLUDED.promotion_potential,
-        organization_codes = EXCLUDED.organization_codes,
-        relocation = EXCLUDED.relocation,
-        hiring_path = EXCLUDED.hiring_path,
-        mco_tags = EXCLUDED.mco_tags,
-        total_openings = EXCLUDED.total_openings,
-        agency_marketing_statement = EXCLUDED.agency_marketing_statement,
-        travel_code = EXCLUDED.travel_code,
-        apply_online_url = EXCLUDED.apply_online_url,
-        detail_status_url = EXCLUDED.detail_status_url,
-        major_duties = EXCLUDED.major_duties,
-        education = EXCLUDED.education,
-        requirements = EXCLUDED.requirements,
-        evaluations = EXCLUDED.evaluations,
-        how_to_apply = EXCLUDED.how_to_apply,
-        what_to_expect_next = EXCLUDED.what_to_expect_next,
-        required_documents = EXCLUDED.required_documents,
-        benefits = EXCLUDED.benefits,
-        benefits_url = EXCLUDED.benefits_url,
-        benefits_display_default_text = EXCLUDED.benefits_display_default_text,
-        other_information = EXCLUDED.other_information,
-        key_requirements = EXCLUDED.key_requirements,
-        within_area = EXCLUDED.within_area,
-        commute_distance = EXCLUDED.commute_distance,
-        service_type = EXCLUDED.service_type,
-        announcement_closing_type = EXCLUDED.announcement_closing_type,
-        agency_contact_email = EXCLUDED.agency_contact_email,
-        security_clearance = EXCLUDED.security_clearance,
-        drug_test_required = EXCLUDED.drug_test_required,
-        position_sensitivity = EXCLUDED.position_sensitivity,
-        adjudication_type = EXCLUDED.adjudication_type,
-        financial_disclosure = EXCLUDED.financial_disclosure,
-        bargaining_unit_status = EXCLUDED.bargaining_unit_status,
-        updated_at = now();
+    written += cur.rowcount
+    cur.execute(
+        """
+        DELETE FROM job_grade t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM unnest(%s::bigint[], %s::text[]) AS k(job_id, code)
+            WHERE k.job_id = t.job_id AND k.code = t.code
+          );
+        """,
+        (ids, *grade_keys),
+    )
+    written += cur.rowcount
+
+    # 2) upsert the rest; identical rows hit the WHERE and are not rewritten
+    if loc_cols[0]:
+        cur.execute(
+            f"""
+            INSERT INTO job_location (job_id, {", ".join(LOCATION_COLUMNS)})
+            SELECT * FROM unnest(
+                %s::bigint[], %s::smallint[], %s::text[], %s::text[], %s::text[],
+                %s::text[], %s::numeric[], %s::numeric[]
+            )
+            ON CONFLICT (job_id, loc_idx) DO UPDATE SET
+                {_set_excluded(LOCATION_COLUMNS[1:])},
+                updated_at = now()
+            WHERE {_changed("job_location", LOCATION_COLUMNS[1:])};
+            """,
+            loc_cols,
+        )
+        written += cur.rowcount
+    if cats:
+        cur.execute(
+            """
+            INSERT INTO job_category (job_id, code, name)
+            SELECT * FROM unnest(%s::bigint[], %s::text[], %s::text[])
+            ON CONFLICT (job_id, code) DO UPDATE SET
+                name = EXCLUDED.name,
+                updated_at = now()
+            WHERE job_category.name IS DISTINCT FROM EXCLUDED.name;
+            """,
+            (*cat_keys, list(cats.values())),
+        )
+        written += cur.rowcount
+    if codes:
+        cur.execute(
+            """
+            INSERT INTO job_grade (job_id, code)
+            SELECT * FROM unnest(%s::bigint[], %s::text[])
+            ON CONFLICT (job_id, code) DO NOTHING;
+            """,
+            grade_keys,
+        )
+        written += cur.rowcount
+    return written
+
+
+def _create_staging_tables(cur: psycopg.Cursor) -> None:
     """
-    cur.execute(sql, {"job_id": job_id, **d.model_dump(mode="python")})
+    Create per-transaction temp staging tables typed from the target tables.
+
+    Children are keyed by position_id (job_id is unknown until the job merge); category
+    rows also carry their staging order, so a code listed twice resolves to the last name.
+
+    :param cur: The database cursor.
+    """
+    cur.execute(
+        f"""
+        CREATE TEMP TABLE stg_job ON COMMIT DROP AS
+            SELECT {", ".join(_JOB_LOAD_COLUMNS)} FROM job WITH NO DATA;
+        CREATE TEMP TABLE stg_job_details ON COMMIT DROP AS
+            SELECT NULL::text AS position_id, {", ".join(DETAILS_COLUMNS)}
+            FROM job_details WITH NO DATA;
+        CREATE TEMP TABLE stg_job_location ON COMMIT DROP AS
+            SELECT NULL::text AS position_id, {", ".join(LOCATION_COLUMNS)}
+            FROM job_location WITH NO DATA;
+        CREATE TEMP TABLE stg_job_category ON COMMIT DROP AS
+            SELECT NULL::text AS position_id, {", ".join(CATEGORY_COLUMNS)}, NULL::int AS ord
+            FROM job_category WITH NO DATA;
+        CREATE TEMP TABLE stg_job_grade ON COMMIT DROP AS
+            SELECT NULL::text AS position_id, {", ".join(GRADE_COLUMNS)}
+            FROM job_grade WITH NO DATA;
+        """
+    )
+
+
+def _copy_rows(
+    cur: psycopg.Cursor, table: str, cols: Sequence[str], rows: Iterable[Sequence]
+) -> None:
+    """
+    Stream rows into a staging table with COPY FROM STDIN.
+
+    :param cur: The database cursor.
+    :param table: The staging table name.
+    :param cols: The column names, in row order.
+    :param rows: The rows to write.
+    """
+    stmt = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table), sql.SQL(", ").join(map(sql.Identifier, cols))
+    )
+    with cur.copy(stmt) as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def _merge_staging(cur: psycopg.Cursor, *, expected: int) -> LoadResult:
+    """
+    Merge the staging tables into job, job_details and the child tables.
+
+    Only jobs whose content hash changed (or that are new) get their details and children
+    rewritten; the rest only have their lineage columns refreshed (never to older values).
+
+    :param cur: The database cursor.
+    :param expected: The number of distinct jobs staged (sanity check).
+    :return: job_id per position_id and inserted/updated/unchanged counts.
+    """
+    result = LoadResult()
+    cur.execute(
+        f"""
+        INSERT INTO job ({", ".join(_JOB_LOAD_COLUMNS)})
+        SELECT {", ".join(_JOB_LOAD_COLUMNS)} FROM stg_job
+        ON CONFLICT (position_id) DO UPDATE SET
+            {_set_excluded(_JOB_LOAD_COLUMNS[1:])},
+            updated_at = now()
+        WHERE {_JOB_CHANGED}
+        RETURNING position_id, job_id, (xmax = 0) AS inserted;
+        """
+    )
+    for pid, jid, inserted in cur.fetchall():
+        result.record(str(pid), int(jid), "inserted" if inserted else "updated")
+    ids = list(result.job_ids.values())
+
+    cur.execute(
+        """
+        WITH touched AS (
+            UPDATE job AS j SET
+                source_event_time = s.source_event_time,
+                ingest_run_id = s.ingest_run_id
+            FROM stg_job s
+            WHERE j.position_id = s.position_id AND NOT (j.job_id = ANY(%(ids)s::bigint[]))
+              AND NOT coalesce(j.source_event_time > s.source_event_time, false)
+        )
+        SELECT j.position_id, j.job_id
+        FROM job j JOIN stg_job s USING (position_id)
+        WHERE NOT (j.job_id = ANY(%(ids)s::bigint[]));
+        """,
+        {"ids": ids},
+    )
+    for pid, jid in cur.fetchall():
+        result.record(str(pid), int(jid), "unchanged")
+    if len(result.job_ids) != expected:
+        raise RuntimeError(
+            f"COPY merge of job returned {len(result.job_ids)} rows for {expected} staged jobs."
+        )
+
+    cur.execute(
+        f"""
+        INSERT INTO job_details (job_id, {", ".join(DETAILS_COLUMNS)})
+        SELECT j.job_id, {", ".join(f"s.{c}" for c in DETAILS_COLUMNS)}
+        FROM stg_job_details s JOIN job j USING (position_id)
+        WHERE j.job_id = ANY(%s::bigint[])
+        ON CONFLICT (job_id) DO UPDATE SET
+            {_set_excluded(DETAILS_COLUMNS)},
+            updated_at = now();
+        """,
+        (ids,),
+    )
+
+    # Sync children by key: delete keys missing from staging, then upsert changed rows only
+    cur.execute(
+        """
+        DELETE FROM job_location t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM stg_job_location s JOIN job j USING (position_id)
+            WHERE j.job_id = t.job_id AND s.loc_idx = t.loc_idx
+          );
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+    cur.execute(
+        """
+        DELETE FROM job_category t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM stg_job_category s JOIN job j USING (position_id)
+            WHERE j.job_id = t.job_id AND s.code = t.code
+          );
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+    cur.execute(
+        """
+        DELETE FROM job_grade t
+        WHERE t.job_id = ANY(%s::bigint[])
+          AND NOT EXISTS (
+            SELECT 1 FROM stg_job_grade s JOIN job j USING (position_id)
+            WHERE j.job_id = t.job_id AND s.code = t.code
+          );
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+
+    cur.execute(
+        f"""
+        INSERT INTO job_location (job_id, {", ".join(LOCATION_COLUMNS)})
+        SELECT j.job_id, {", ".join(f"s.{c}" for c in LOCATION_COLUMNS)}
+        FROM stg_job_location s JOIN job j USING (position_id)
+        WHERE j.job_id = ANY(%s::bigint[])
+        ON CONFLICT (job_id, loc_idx) DO UPDATE SET
+            {_set_excluded(LOCATION_COLUMNS[1:])},
+            updated_at = now()
+        WHERE {_changed("job_location", LOCATION_COLUMNS[1:])};
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+    # DISTINCT ON: a job may list the same code twice; one statement cannot update a row twice.
+    # The last listing wins, as in upsert_pages.
+    cur.execute(
+        """
+        INSERT INTO job_category (job_id, code, name)
+        SELECT DISTINCT ON (j.job_id, s.code) j.job_id, s.code, s.name
+        FROM stg_job_category s JOIN job j USING (position_id)
+        WHERE j.job_id = ANY(%s::bigint[])
+        ORDER BY j.job_id, s.code, s.ord DESC
+        ON CONFLICT (job_id, code) DO UPDATE SET
+            name = EXCLUDED.name,
+            updated_at = now()
+        WHERE job_category.name IS DISTINCT FROM EXCLUDED.name;
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+    cur.execute(
+        """
+        INSERT INTO job_grade (job_id, code)
+        SELECT j.job_id, s.code
+        FROM stg_job_grade s JOIN job j USING (position_id)
+        WHERE j.job_id = ANY(%s::bigint[])
+        ON CONFLICT (job_id, code) DO NOTHING;
+        """,
+        (ids,),
+    )
+    result.child_rows_written += cur.rowcount
+    return result
@@ -3,25 +3,15 @@ from __future__ import annotations
 import contextlib
 import threading
 from collections.abc import Iterable
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import great_expectations as gx
 import pandas as pd
-from tasman_etl.models import JobLocationRecord, JobRecord
-
-
-@dataclass(frozen=True)
-class RuleOutcome:
-    name: str
-    success: bool
-    details: str | None = None
 
+from tasman_etl.dq.result import RuleOutcome, ValidationResult
+from tasman_etl.models import JobLocationRecord, JobRecord
 
-@dataclass(frozen=True)
-class ValidationResult:
-    passed: bool
-    rules: list[RuleOutcome]
+__all__ = ["RuleOutcome", "ValidationResult", "validate_page_jobs"]
 
 
 def _jobs_dataframe(rows: Iterable[JobRecord]) -> pd.DataFrame:
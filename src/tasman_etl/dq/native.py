@@ -0,0 +1,145 @@
+"""
+Vectorised page validator implementing the Great Expectations rule set without GX.
+
+Same rules, rule names, order and ``details`` (unexpected count on failure) as
+``tasman_etl.dq.gx.validate.validate_page_jobs``, but computed with NumPy array
+expressions over columns pulled once from the records (or taken as-is from a
+column-oriented ``PageRows`` batch), so there is no per-page context/datasource/validator
+setup and no DataFrame built with per-row helpers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from tasman_etl.dq.result import RuleOutcome, ValidationResult
+from tasman_etl.models import JobLocationRecord, JobRecord
+from tasman_etl.transform import PageRows
+
+_URL_SCHEMES = ("http://", "https://")  # == regex ^https?:// used by the GX suite
+
+# Job columns the rules read
+_CHECKED_COLUMNS: tuple[str, ...] = (
+    "position_id",
+    "position_title",
+    "position_uri",
+    "pay_min",
+    "pay_max",
+    "apply_uri",
+)
+
+
+def _is_null(values: np.ndarray) -> np.ndarray:
+    """
+    Null mask for an object column (same null semantics as GX's pandas backend).
+
+    :param values: The column values.
+    :return: A boolean mask, True where the value is null.
+    """
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+def _has_scheme(urls: list[str]) -> np.ndarray:
+    """
+    Vectorised ``startswith(("http://", "https://"))`` over a list of strings.
+
+    :param urls: The URLs to check.
+    :return: A boolean mask, True where the URL has an http(s) scheme.
+    """
+    if not urls:
+        return np.zeros(0, dtype=bool)
+    arr = np.asarray(urls, dtype=str)
+    ok = np.zeros(arr.shape, dtype=bool)
+    for scheme in _URL_SCHEMES:
+        ok |= np.char.startswith(arr, scheme)
+    return ok
+
+
+def _outcome(name: str, unexpected: int) -> RuleOutcome:
+    """
+    Build a rule outcome from an unexpected-value count.
+
+    :param name: The rule (expectation type) name.
+    :param unexpected: The number of rows violating the rule.
+    :return: The RuleOutcome.
+    """
+    ok = unexpected == 0
+    return RuleOutcome(name=name, success=ok, details=None if ok else str(unexpected))
+
+
+def validate_page_jobs_native(
+    jobs: Sequence[JobRecord],
+    locations: Sequence[JobLocationRecord],
+) -> ValidationResult:
+    """
+    Validate a page of normalised jobs + child rows with vectorised column checks.
+
+    :param jobs: The list of JobRecord objects.
+    :param locations: The list of JobLocationRecord objects.
+    :return: A ValidationResult indicating the outcome of the validation.
+    """
+    columns = {c: [getattr(j, c) for j in jobs] for c in _CHECKED_COLUMNS}
+    return _validate_columns(columns, len(locations))
+
+
+def validate_page_rows_native(rows: PageRows) -> ValidationResult:
+    """
+    Validate a column-oriented page batch (no per-row access at all).
+
+    :param rows: The page's rows.
+    :return: A ValidationResult indicating the outcome of the validation.
+    """
+    return _validate_columns(rows.job, len(rows.locations["loc_idx"]))
+
+
+def _validate_columns(job: Mapping[str, Sequence[Any]], n_locations: int) -> ValidationResult:
+    """
+    Run the rule set over job columns.
+
+    :param job: Job column name -> values (at least _CHECKED_COLUMNS).
+    :param n_locations: The number of location rows on the page.
+    :return: A ValidationResult indicating the outcome of the validation.
+    """
+    rules: list[RuleOutcome] = []
+
+    has_loc = n_locations > 0
+    rules.append(RuleOutcome(name="has_at_least_one_location", success=has_loc))
+    n = len(job["position_id"])
+    if not n:
+        rules.append(RuleOutcome(name="non_empty_jobs_page", success=False, details="no jobs"))
+        return ValidationResult(passed=False, rules=rules)
+
+    position_id = np.empty(n, dtype=object)
+    position_title = np.empty(n, dtype=object)
+    position_id[:] = job["position_id"]
+    position_title[:] = job["position_title"]
+    # Null pay -> NaN, so comparisons below are False (GX skips nulls in between checks)
+    pay_min = np.array([np.nan if v is None else v for v in job["pay_min"]], dtype=float)
+    pay_max = np.array([np.nan if v is None else v for v in job["pay_max"]], dtype=float)
+
+    uri_ok = _has_scheme(list(job["position_uri"]))
+
+    # apply_uri is a list per job: flatten, check once, then count jobs with any bad URL
+    apply_uri = job["apply_uri"]
+    counts = np.fromiter((len(a) for a in apply_uri), dtype=np.intp, count=n)
+    owners = np.repeat(np.arange(n), counts)
+    bad_apply = owners[~_has_scheme([u for a in apply_uri for u in a])]
+
+    rules.extend(
+        [
+            _outcome("expect_column_values_to_not_be_null", int(_is_null(position_id).sum())),
+            _outcome("expect_column_values_to_not_be_null", int(_is_null(position_title).sum())),
+            _outcome("expect_column_values_to_match_regex", int((~uri_ok).sum())),
+            _outcome("expect_column_values_to_be_between", int((pay_min < 0).sum())),
+            _outcome("expect_column_values_to_be_between", int((pay_max < 0).sum())),
+            _outcome("expect_column_values_to_be_in_set", int(np.unique(bad_apply).size)),
+            _outcome("expect_column_values_to_be_in_set", int((pay_min > pay_max).sum())),
+        ]
+    )
+
+    passed = has_loc and all(r.success for r in rules[1:])
+    return ValidationResult(passed=passed, rules=rules)
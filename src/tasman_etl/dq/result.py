@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    name: str
+    success: bool
+    details: str | None = None
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    passed: bool
+    rules: list[RuleOutcome]
@@ -0,0 +1,115 @@
+"""
+Page validation entry point: picks the native (default) or Great Expectations engine.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+
+from tasman_etl.config import get_settings
+from tasman_etl.dq.native import validate_page_jobs_native, validate_page_rows_native
+from tasman_etl.dq.result import ValidationResult
+from tasman_etl.models import JobLocationRecord, JobRecord
+from tasman_etl.transform import PageRows
+
+logger = logging.getLogger("tasman.dq")
+
+# native: vectorised checks (hot path) | gx: Great Expectations only
+# audit: gate on native, also run GX and log any rule that disagrees
+DQ_ENGINES: tuple[str, ...] = ("native", "gx", "audit")
+
+
+def validate_page_rows(rows: PageRows, *, engine: str | None = None) -> ValidationResult:
+    """
+    Validate a column-oriented page batch with the configured engine.
+
+    The native engine reads the columns directly; GX (and audit) need the records, so the
+    batch is materialised as DTOs for those engines only.
+
+    :param rows: The page's rows.
+    :param engine: One of DQ_ENGINES (default: None -> Settings / DQ_ENGINE).
+    :return: A ValidationResult indicating the outcome of the validation.
+    """
+    engine = _resolve_engine(engine)
+    if engine == "native":
+        return validate_page_rows_native(rows)
+    bundles = rows.bundles()
+    return validate_page_jobs(
+        [b.job for b in bundles],
+        [loc for b in bundles for loc in b.locations],
+        engine=engine,
+    )
+
+
+def validate_page_jobs(
+    jobs: list[JobRecord],
+    locations: list[JobLocationRecord],
+    *,
+    engine: str | None = None,
+) -> ValidationResult:
+    """
+    Validate a page of normalised jobs + child rows with the configured engine.
+
+    GX is imported lazily, so the native engine never pays its import or context cost.
+
+    :param jobs: The list of JobRecord objects.
+    :param locations: The list of JobLocationRecord objects.
+    :param engine: One of DQ_ENGINES (default: None -> Settings / DQ_ENGINE).
+    :return: A ValidationResult indicating the outcome of the validation.
+    """
+    engine = _resolve_engine(engine)
+    if engine == "gx":
+        from tasman_etl.dq.gx.validate import validate_page_jobs as validate_gx
+
+        return validate_gx(jobs, locations)
+
+    result = validate_page_jobs_native(jobs, locations)
+    if engine == "audit":
+        _audit(result, jobs, locations)
+    return result
+
+
+def _resolve_engine(engine: str | None) -> str:
+    """
+    Resolve and check the DQ engine name.
+
+    :param engine: One of DQ_ENGINES, or None for Settings / DQ_ENGINE.
+    :return: The engine name.
+    """
+    if engine is None:
+        engine = get_settings().dq_engine
+    if engine not in DQ_ENGINES:
+        raise RuntimeError(f"invalid DQ_ENGINE {engine!r}; expected one of {DQ_ENGINES}")
+    return engine
+
+
+def _audit(
+    native: ValidationResult,
+    jobs: Sequence[JobRecord],
+    locations: Sequence[JobLocationRecord],
+) -> None:
+    """
+    Re-run the page through GX and log rules whose outcome differs from the native run.
+
+    :param native: The native validation result (the one that gates the load).
+    :param jobs: The list of JobRecord objects.
+    :param locations: The list of JobLocationRecord objects.
+    """
+    from tasman_etl.dq.gx.validate import validate_page_jobs as validate_gx
+
+    gx = validate_gx(list(jobs), list(locations))
+    ours = [(r.name, r.success, r.details) for r in native.rules]
+    theirs = [(r.name, r.success, r.details) for r in gx.rules]
+    if native.passed != gx.passed or sorted(ours) != sorted(theirs):
+        logger.warning(
+            "dq.audit_mismatch",
+            extra={
+                "native_passed": native.passed,
+                "gx_passed": gx.passed,
+                "native_only": sorted(set(ours) - set(theirs)),
+                "gx_only": sorted(set(theirs) - set(ours)),
+            },
+        )
+    else:
+        logger.debug("dq.audit_ok", extra={"rules": len(ours)})
@@ -0,0 +1,278 @@
+"""
+An optional on-disk cache of API responses, for local development and CI replays.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+_SUFFIX = ".json.gz"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    One stored response plus the validators needed to revalidate it.
+    """
+
+    status: int
+    headers: dict[str, str]
+    payload: dict[str, Any]
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def response_dict(self) -> dict[str, Any]:
+        """
+        Rebuild the client's response dictionary.
+
+        :return: The status, headers and payload, as ``fetch_search_page`` returns them.
+        """
+        return {"status": self.status, "headers": dict(self.headers), "payload": self.payload}
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Get the headers that ask the server to revalidate this response.
+
+        :return: If-None-Match / If-Modified-Since (empty if the server sent no validators).
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Gzipped JSON responses on disk, keyed by endpoint + normalised request params.
+
+    Environment variables (``from_env``):
+      * USAJOBS_CACHE_DIR     (unset: no cache)
+      * USAJOBS_CACHE_TTL     (default: 3600 – seconds an entry is served without a request)
+      * USAJOBS_CACHE_MAX_MB  (default: 256 – size bound of the directory)
+
+    A fresh entry is served without touching the network or the rate limiter. A stale
+    entry that came with an ``ETag`` / ``Last-Modified`` is revalidated with
+    ``If-None-Match`` / ``If-Modified-Since``; a 304 serves it again and restarts its TTL.
+    The directory is kept under ``max_bytes`` by evicting the least recently used entries
+    (file mtime, bumped on every hit). Safe to share across fetch threads: entries are
+    written to a temp file and renamed into place.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        ttl_s: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialise the cache (creating the directory if needed).
+
+        :param root: The cache directory.
+        :param ttl_s: Seconds an entry is served without a request.
+        :param max_bytes: Upper bound on the total size of the stored entries.
+        :param clock: Wall clock (seconds since the epoch); injectable for tests.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._size = sum(p.stat().st_size for p in self.root.glob(f"*{_SUFFIX}"))
+        self._counts = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0}
+
+    @classmethod
+    def from_env(cls) -> ResponseCache | None:
+        """
+        Build the cache from environment variables.
+
+        :return: The cache, or None if USAJOBS_CACHE_DIR is not set.
+        """
+        root = os.getenv("USAJOBS_CACHE_DIR")
+        if not root:
+            return None
+        return cls(
+            root,
+            ttl_s=float(os.getenv("USAJOBS_CACHE_TTL", "3600")),
+            max_bytes=int(float(os.getenv("USAJOBS_CACHE_MAX_MB", "256")) * 1024 * 1024),
+        )
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any]) -> str:
+        """
+        Derive the cache key of a request.
+
+        Parameter names are case-insensitive and their order does not matter; values are
+        compared with surrounding and repeated whitespace collapsed. Unset (None) values
+        are dropped.
+
+        :param url: The endpoint URL.
+        :param params: The query parameters.
+        :return: A hex digest naming the entry.
+        """
+        normalised = sorted(
+            (str(k).lower(), " ".join(str(v).split())) for k, v in params.items() if v is not None
+        )
+        return hashlib.sha256(json.dumps([url, normalised]).encode()).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Look up an entry (fresh or stale) and mark it as recently used.
+
+        :param key: The cache key (see ``key``).
+        :return: The stored response, or None (also for an unreadable entry, which is
+            dropped).
+        """
+        path = self._path(key)
+        try:
+            doc = from_json(gzip.decompress(path.read_bytes()))
+            entry = CachedResponse(
+                status=int(doc["status"]),
+                headers=dict(doc.get("headers") or {}),
+                payload=doc["payload"],
+                stored_at=float(doc["stored_at"]),
+                etag=doc.get("etag"),
+                last_modified=doc.get("last_modified"),
+            )
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, TypeError, EOFError):
+            self._remove(path)
+            self._count("misses")
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)  # LRU order
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """
+        Check whether an entry may be served without a request (and count it as a hit).
+
+        :param entry: The stored response.
+        :return: True if it is younger than the TTL.
+        """
+        fresh = self._clock() - entry.stored_at < self.ttl_s
+        self._count("hits" if fresh else "misses")
+        return fresh
+
+    def put(
+        self,
+        key: str,
+        response_dict: Mapping[str, Any],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """
+        Store a response, evicting least recently used entries beyond ``max_bytes``.
+
+        :param key: The cache key (see ``key``).
+        :param response_dict: The client's response dictionary (status, headers, payload).
+        :param etag: The response's ETag header (optional).
+        :param last_modified: The response's Last-Modified header (optional).
+        """
+        doc = {
+            "status": response_dict.get("status", 200),
+            "headers": response_dict.get("headers") or {},
+            "payload": response_dict["payload"],
+            "stored_at": self._clock(),
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        body = gzip.compress(to_json(doc), compresslevel=5, mtime=0)
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            with self._lock:
+                old = path.stat().st_size if path.exists() else 0
+                os.replace(tmp, path)
+                self._size += len(body) - old
+                self._counts["stored"] += 1
+        except BaseException:
+            self._remove(Path(tmp))
+            raise
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def revalidated(self, key: str, entry: CachedResponse) -> None:
+        """
+        Restart an entry's TTL after the server confirmed it unchanged (HTTP 304).
+
+        :param key: The cache key (see ``key``).
+        :param entry: The stored response.
+        """
+        self._count("revalidated")
+        self.put(key, entry.response_dict(), etag=entry.etag, last_modified=entry.last_modified)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the cache counters.
+
+        :return: hits, misses, revalidated, stored, evicted and the current size in bytes.
+        """
+        with self._lock:
+            return {**self._counts, "bytes": self._size}
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _remove(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        if path.suffix != ".tmp":
+            with self._lock:
+                self._size -= size
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used entries until the directory fits in ``max_bytes``.
+        """
+        entries = []
+        for p in self.root.glob(f"*{_SUFFIX}"):
+            try:
+                st = p.stat()
+            except OSError:  # evicted by another thread
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+        with self._lock:
+            self._size = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            with self._lock:
+                if self._size <= self.max_bytes:
+                    return
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            with self._lock:
+                self._size -= size
+                self._counts["evicted"] += 1
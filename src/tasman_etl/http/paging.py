@@ -0,0 +1,115 @@
+"""
+Page planning for USAJOBS Search: the page size a run asks for and the exact pages it needs.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# The Search API serves at most 500 results per page
+MAX_RESULTS_PER_PAGE = 500
+
+
+@dataclass(frozen=True)
+class PagePlan:
+    """
+    The pages of one search, planned from the total reported on its first page.
+
+    ``pages`` lists every page the search requests (the first one included), so a
+    concurrent fetcher can submit them all up front and never asks for a page past the end.
+    """
+
+    results_per_page: int
+    total: int | None  # SearchResultCountAll (None: only NumberOfPages was reported)
+    pages: tuple[int, ...]
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the plan for run logs.
+
+        :return: total_results, planned_pages and results_per_page.
+        """
+        return {
+            "total_results": self.total,
+            "planned_pages": len(self.pages),
+            "results_per_page": self.results_per_page,
+        }
+
+
+def page_size_for(
+    results_per_page: int, pages: int | Iterable[int] | None
+) -> tuple[int, int | Iterable[int] | None]:
+    """
+    Raise the page size so a search needs as few requests as possible.
+
+    A page count is a budget of ``pages * results_per_page`` results; it is re-split
+    evenly into the fewest pages of at most ``MAX_RESULTS_PER_PAGE``, so the run asks for
+    the same results in fewer requests. All pages (None) use the maximum page size.
+    Explicit page numbers only make sense at the page size they were chosen for and are
+    left alone.
+
+    :param results_per_page: The requested page size.
+    :param pages: Max page count (int), explicit page numbers, or None for all pages.
+    :return: The (results_per_page, pages) to fetch with.
+    """
+    if pages is None:
+        return MAX_RESULTS_PER_PAGE, None
+    if not isinstance(pages, int) or pages < 1:
+        return results_per_page, pages
+    budget = pages * results_per_page
+    count = math.ceil(budget / MAX_RESULTS_PER_PAGE)
+    return math.ceil(budget / count), count
+
+
+def plan_pages(
+    payload: dict | None, *, results_per_page: int, wanted: list[int] | None
+) -> PagePlan | None:
+    """
+    Plan a search's pages from its first page.
+
+    The last page is ``ceil(SearchResultCountAll / results_per_page)``, falling back to
+    ``UserArea.NumberOfPages`` when the total is missing.
+
+    :param payload: The raw payload of the first page fetched.
+    :param results_per_page: The page size the search is fetched with.
+    :param wanted: The requested page numbers, sorted (None: all pages).
+    :return: The plan, or None if the payload reports neither the total nor a page count.
+    """
+    total = _count_all(payload)
+    last = max(1, math.ceil(total / results_per_page)) if total is not None else None
+    if last is None:
+        last = _number_of_pages(payload)
+        if last is None:
+            return None
+    first = wanted[0] if wanted else 1
+    rest = [p for p in (wanted or range(1, last + 1)) if first < p <= last]
+    return PagePlan(results_per_page=results_per_page, total=total, pages=(first, *rest))
+
+
+def _count_all(payload: dict | None) -> int | None:
+    """
+    Read ``SearchResult.SearchResultCountAll`` from a raw Search payload.
+
+    :param payload: The raw response payload.
+    :return: The total number of matching results, or None if absent/unparseable.
+    """
+    try:
+        return int((payload or {})["SearchResult"]["SearchResultCountAll"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _number_of_pages(payload: dict | None) -> int | None:
+    """
+    Read ``SearchResult.UserArea.NumberOfPages`` from a raw Search payload.
+
+    :param payload: The raw response payload.
+    :return: The total number of pages, or None if absent/unparseable.
+    """
+    try:
+        return int(((payload or {})["SearchResult"]["UserArea"] or {})["NumberOfPages"])
+    except (KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,246 @@
+"""
+An adaptive token-bucket rate limiter for outbound API requests.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+# Reset values above this are epoch timestamps rather than "seconds until reset".
+_EPOCH_THRESHOLD = 1_000_000_000
+_EPS = 1e-9  # float slack so a refill that lands a hair under one token still counts
+
+
+class RateLimited(RuntimeError):
+    """
+    Raised for an HTTP 429; ``retry_after`` is the server-requested wait in seconds.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request to one API host.
+
+    ``acquire()`` blocks until a request may be sent; ``observe()`` feeds each response
+    back so the bucket adapts to what the server reports:
+
+      * ``X-RateLimit-Remaining`` caps the tokens on hand; once it drops to ``burst`` or
+        below, the refill rate is slowed to spread the remaining quota over the time left
+        until ``X-RateLimit-Reset``, and at 0 all callers wait for the reset.
+      * HTTP 429 pauses all callers for ``Retry-After`` (seconds or HTTP date) and halves
+        the rate; successful responses restore it additively up to ``max_rate``.
+
+    Without rate-limit headers it behaves as a plain ``max_rate``/``burst`` bucket.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 10.0,
+        burst: int = 5,
+        *,
+        min_rate: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialise the rate limiter.
+
+        :param max_rate: Max sustained requests per second (default: 10.0)
+        :param burst: Bucket capacity, i.e. requests allowed back-to-back (default: 5)
+        :param min_rate: Floor for the adaptive rate after throttling (default: 0.2)
+        :param clock: Monotonic clock (injectable for tests)
+        :param wall_clock: Epoch clock used for epoch-style reset headers
+        :param sleep: Sleep function (injectable for tests)
+        """
+        if max_rate <= 0:
+            raise RuntimeError(f"Rate limit must be positive, got {max_rate}")
+        self.max_rate = float(max_rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.capacity = float(max(1, burst))
+        self.rate = self.max_rate
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.waited_s = 0.0
+        self.throttled = 0
+
+    def acquire(self) -> float:
+        """
+        Take one token, blocking while the bucket is empty or a server pause is active.
+
+        :return: The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1 - _EPS:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        self.waited_s += waited
+                        return waited
+                    wait = max(1e-3, (1 - self._tokens) / self.rate)
+            self._sleep(wait)
+            waited += wait
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> float | None:
+        """
+        Adapt the bucket to one response's status and rate-limit headers.
+
+        :param status: The HTTP status code.
+        :param headers: The response headers (case-insensitive mapping or plain dict).
+        :return: The pause in seconds if the response was a 429, else None.
+        """
+        h = {k.lower(): v for k, v in headers.items()}
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            reset_s = self._reset_delay(h.get("x-ratelimit-reset"))
+            remaining = _to_float(h.get("x-ratelimit-remaining"))
+
+            if status == 429:
+                delay = _retry_after(h.get("retry-after"), self._wall_clock())
+                if delay is None:
+                    delay = reset_s if reset_s is not None else 1.0 / self.rate
+                self.throttled += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._pause(now, delay)
+                return delay
+
+            if remaining is not None:
+                self._tokens = min(self._tokens, max(0.0, remaining))
+                if remaining <= 0:
+                    self._pause(now, reset_s if reset_s is not None else 1.0)
+                elif remaining <= self.capacity and reset_s:
+                    self.rate = min(self.max_rate, max(remaining / reset_s, 1e-3))
+                else:
+                    self._recover()
+            else:
+                self._recover()
+            return None
+
+    def stats(self) -> dict[str, float | int]:
+        """
+        Summarise limiter behaviour for run logs.
+
+        :return: Current rate, total wait and number of 429s seen.
+        """
+        with self._lock:
+            return {
+                "rate_rps": round(self.rate, 3),
+                "waited_s": round(self.waited_s, 3),
+                "throttled": self.throttled,
+            }
+
+    def _refill(self, now: float) -> None:
+        """
+        Add tokens for the time elapsed since the last refill (caller holds the lock).
+
+        :param now: The current monotonic time.
+        """
+        if now <= self._updated:  # still inside a server pause
+            return
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _pause(self, now: float, delay: float) -> None:
+        """
+        Block every caller for ``delay`` seconds and drain the bucket (caller holds the lock).
+
+        :param now: The current monotonic time.
+        :param delay: The pause length in seconds.
+        """
+        self._blocked_until = max(self._blocked_until, now + max(0.0, delay))
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._blocked_until)  # no refill while paused
+
+    def _recover(self) -> None:
+        """
+        Additively raise the rate back towards ``max_rate`` (caller holds the lock).
+        """
+        self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+    def _reset_delay(self, value: str | None) -> float | None:
+        """
+        Parse ``X-RateLimit-Reset`` as seconds-until-reset or an epoch timestamp.
+
+        :param value: The raw header value.
+        :return: Seconds until the quota resets, or None if absent/invalid.
+        """
+        v = _to_float(value)
+        if v is None:
+            return None
+        if v > _EPOCH_THRESHOLD:
+            v -= self._wall_clock()
+        return max(0.0, v)
+
+
+def _to_float(value: str | None) -> float | None:
+    """
+    Parse a numeric header value.
+
+    :param value: The raw header value.
+    :return: The parsed number, or None if absent/invalid.
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _retry_after(value: str | None, now: float) -> float | None:
+    """
+    Parse ``Retry-After`` (delta seconds or an HTTP date).
+
+    :param value: The raw header value.
+    :param now: The current epoch time.
+    :return: Seconds to wait, or None if absent/invalid.
+    """
+    seconds = _to_float(value)
+    if seconds is not None:
+        return max(0.0, seconds)
+    if not value:
+        return None
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+
+_SHARED: dict[str, RateLimiter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_limiter(host: str, max_rate: float = 10.0, burst: int = 5) -> RateLimiter:
+    """
+    Get the process-wide limiter for an API host, creating it on first use.
+
+    Every client talking to the same host shares one bucket, so parallel fetch threads
+    and concurrent searches stay within a single quota.
+
+    :param host: The API host.
+    :param max_rate: Max requests per second (only used when first created).
+    :param burst: Bucket capacity (only used when first created).
+    :return: The shared RateLimiter.
+    """
+    with _SHARED_LOCK:
+        limiter = _SHARED.get(host)
+        if limiter is None:
+            limiter = _SHARED[host] = RateLimiter(max_rate=max_rate, burst=burst)
+        return limiter
@@ -7,10 +7,20 @@ from __future__ import annotations
 import logging
 import os
 import random
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import requests
+from pydantic_core import from_json
+from requests.adapters import HTTPAdapter
+
+from tasman_etl.http.cache import ResponseCache
+from tasman_etl.http.paging import PagePlan, page_size_for, plan_pages
+from tasman_etl.http.ratelimit import RateLimited, RateLimiter, shared_limiter
 
 logger = logging.getLogger("tasman.usajobs")
 
@@ -22,12 +32,24 @@ class UsaJobsClient:
       * USAJOBS_HOST          (default: data.usajobs.gov)
       * USAJOBS_USER_AGENT    (required – registered email)
       * USAJOBS_AUTH_KEY      (required – API key)
+      * USAJOBS_POOL_SIZE     (default: 8 – keep-alive connections kept per host)
+      * USAJOBS_MAX_RPS       (default: 10 – ceiling for the shared per-host rate limiter)
+      * USAJOBS_BURST         (default: 5 – requests the limiter allows back-to-back)
+      * USAJOBS_CACHE_DIR     (unset: no response cache; see ``ResponseCache``)
 
     Features:
       * Explicit Accept header (vendor + JSON) to avoid empty bodies.
+      * One pooled keep-alive ``requests.Session`` per client (gzip transfer encoding), so
+        pages and retries reuse TCP/TLS connections instead of handshaking per request.
       * Exponential backoff with jitter on network / HTTP >=500.
+      * Shared adaptive token bucket per host, paced by X-RateLimit-Remaining/Reset; HTTP 429
+        pauses every caller for Retry-After and is retried instead of returned.
       * Structured debug logging of attempts, latency, and headers.
       * Raises RuntimeError on persistent empty/invalid JSON despite 200.
+      * Bounded-parallel multi-page fetch (``fetch_search_pages``), yielded in page order,
+        over the exact page set planned from SearchResultCountAll on page 1.
+      * Optional on-disk response cache (TTL, LRU size bound, ETag / Last-Modified
+        revalidation) so repeated development and CI runs skip the API.
     """
 
     def __init__(
@@ -38,6 +60,10 @@ class UsaJobsClient:
         base_url: str | None = None,
         timeout: float = 15.0,
         accept: str | None = None,
+        session: requests.Session | None = None,
+        pool_size: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
         """
         Initialise the USAJOBS API client.
@@ -48,6 +74,10 @@ class UsaJobsClient:
         :param base_url: The base URL for API requests (optional)
         :param timeout: The request timeout in seconds (default: 15.0)
         :param accept: The Accept header for API requests (optional)
+        :param session: A preconfigured requests.Session to use (optional)
+        :param pool_size: Max pooled connections per host (default: USAJOBS_POOL_SIZE or 8)
+        :param rate_limiter: Limiter to pace requests (default: the shared one for the host)
+        :param cache: On-disk response cache (default: from USAJOBS_CACHE_DIR, if set)
         """
         try:  # load .env lazily if available
             from tasman_etl.config import load_env
@@ -56,7 +86,7 @@ class UsaJobsClient:
         except Exception:
             pass
 
-        self.host = host or os.getenv("USAJOBS_HOST", "data.usajobs.gov")
+        self.host: str = host or os.getenv("USAJOBS_HOST") or "data.usajobs.gov"
         self.user_agent = user_agent or os.getenv("USAJOBS_USER_AGENT")
         self.auth_key = auth_key or os.getenv("USAJOBS_AUTH_KEY")
         self.base_url = base_url or f"https://{self.host}/api/search"
@@ -71,7 +101,73 @@ class UsaJobsClient:
             "User-Agent": self.user_agent,
             "Authorization-Key": self.auth_key,
             "Accept": accept or "application/hr+json, application/json;q=0.9, */*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        self.pool_size = pool_size or int(os.getenv("USAJOBS_POOL_SIZE", "8"))
+        self._http = session or _build_session(self.pool_size)
+        self.rate_limiter = rate_limiter or shared_limiter(
+            self.host,
+            max_rate=float(os.getenv("USAJOBS_MAX_RPS", "10")),
+            burst=int(os.getenv("USAJOBS_BURST", "5")),
+        )
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+
+        # Latency metrics (shared across fetch threads)
+        self._metrics_lock = threading.Lock()
+        self._requests = 0
+        self._latency_first_ms: float | None = None
+        self._latency_total_ms = 0.0
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+        self._http.close()
+
+    def connection_stats(self) -> dict[str, Any]:
+        """
+        Summarise request latency and connection reuse for this client.
+
+        ``latency_ms_first`` includes the DNS + TCP + TLS handshake; with keep-alive the
+        later requests (``latency_ms_avg_warm``) skip it, and ``connections_opened`` stays
+        well below ``requests``.
+
+        :return: A dictionary of HTTP metrics.
+        """
+        with self._metrics_lock:
+            n = self._requests
+            first = self._latency_first_ms
+            total = self._latency_total_ms
+        stats: dict[str, Any] = {
+            "requests": n,
+            "latency_ms_first": round(first, 1) if first is not None else None,
+            "latency_ms_avg_warm": (
+                round((total - first) / (n - 1), 1) if first is not None and n > 1 else None
+            ),
         }
+        try:  # urllib3 pool counters (best effort: custom sessions may not expose them)
+            adapter = self._http.get_adapter(self.base_url)
+            if isinstance(adapter, HTTPAdapter):
+                pool = adapter.poolmanager.connection_from_url(self.base_url)
+                stats["connections_opened"] = pool.num_connections
+        except Exception:
+            pass
+        stats["rate_limit"] = self.rate_limiter.stats()
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+    def _record_latency(self, latency_ms: float) -> None:
+        """
+        Record one request's latency in the client metrics.
+
+        :param latency_ms: The request latency in milliseconds.
+        """
+        with self._metrics_lock:
+            self._requests += 1
+            self._latency_total_ms += latency_ms
+            if self._latency_first_ms is None:
+                self._latency_first_ms = latency_ms
 
     def fetch_search_page(
         self,
@@ -82,6 +178,8 @@ class UsaJobsClient:
         results_per_page: int = 50,
         page: int = 1,
         fields: str | None = None,  # "full" or "min"
+        date_posted: int | None = None,
+        newest_first: bool = False,
         retry: int = 3,
         backoff_base: float = 0.75,
         backoff_cap: float = 6.0,
@@ -95,6 +193,8 @@ class UsaJobsClient:
         :param results_per_page: The number of results per page (default: 50)
         :param page: The page number to retrieve (default: 1)
         :param fields: The fields to include in the response (optional)
+        :param date_posted: Only postings posted within this many days, 0-60 (optional)
+        :param newest_first: Sort by open date, newest first (default: API relevance order)
         :param retry: The number of retry attempts for transient errors (default: 3)
         :param backoff_base: The base backoff time in seconds (default: 0.75)
         :param backoff_cap: The maximum backoff time in seconds (default: 6.0)
@@ -111,20 +211,40 @@ class UsaJobsClient:
             params["Radius"] = radius_miles
         if fields:
             params["Fields"] = fields
+        if date_posted is not None:
+            params["DatePosted"] = date_posted
+        if newest_first:
+            params["SortField"] = "OpenDate"
+            params["SortDirection"] = "Desc"
 
         request_dict = {"endpoint": "/api/search", "params": params}
 
+        # A fresh cached response skips the request (and the rate limiter) entirely; a stale
+        # one is revalidated with its ETag / Last-Modified where the server sent them.
+        cache_key = self.cache.key(self.base_url, params) if self.cache is not None else None
+        cached = None
+        headers = self._headers
+        if self.cache is not None and cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.cache.is_fresh(cached):
+                    logger.debug("usajobs.cache_hit", extra={"page": page})
+                    return request_dict, cached.response_dict()
+                headers = {**self._headers, **cached.conditional_headers()}
+
         last_exc: Exception | None = None
         for attempt in range(1, retry + 2):  # attempts = retry + 1
+            self.rate_limiter.acquire()
             start = time.perf_counter()
             try:
-                resp = requests.get(
+                resp = self._http.get(
                     self.base_url,
-                    headers=self._headers,
+                    headers=headers,
                     params=params,
                     timeout=self.timeout,
                 )
                 latency = (time.perf_counter() - start) * 1000
+                self._record_latency(latency)
                 content_type = resp.headers.get("Content-Type", "")
 
                 logger.debug(
@@ -144,13 +264,22 @@ class UsaJobsClient:
                     },
                 )
 
+                retry_after = self.rate_limiter.observe(resp.status_code, resp.headers)
+                if retry_after is not None:
+                    raise RateLimited(f"HTTP 429 rate limited for {retry_after:.1f}s", retry_after)
                 if resp.status_code >= 500:
                     raise RuntimeError(f"HTTP {resp.status_code} server error")
+                if resp.status_code == 304 and self.cache is not None and cached is not None:
+                    assert cache_key is not None
+                    self.cache.revalidated(cache_key, cached)
+                    return request_dict, cached.response_dict()
 
                 payload: dict[str, Any] = {}
                 if content_type.startswith("application/json") or "hr+json" in content_type:
                     try:
-                        payload = resp.json() or {}
+                        # pydantic-core's Rust parser straight from the body bytes: faster
+                        # than resp.json() (text decode + stdlib json), same dict result
+                        payload = from_json(resp.content) or {}
                     except Exception as je:  # decode issue
                         logger.warning("json.decode_failed", extra={"error": str(je)})
 
@@ -169,13 +298,23 @@ class UsaJobsClient:
                     },
                     "payload": payload,
                 }
+                if self.cache is not None and cache_key is not None and resp.status_code == 200:
+                    self.cache.put(
+                        cache_key,
+                        response_dict,
+                        etag=resp.headers.get("ETag"),
+                        last_modified=resp.headers.get("Last-Modified"),
+                    )
                 return request_dict, response_dict
             except Exception as e:  # network / transient / empty payload / decode
                 last_exc = e
                 if attempt <= retry:
-                    delay = min(backoff_cap, backoff_base * (2 ** (attempt - 1)))
-                    jitter = delay * (0.4 * random.random() - 0.2)
-                    sleep_for = max(0.05, delay + jitter)
+                    if isinstance(e, RateLimited):
+                        sleep_for = 0.0  # the limiter holds the next acquire() for Retry-After
+                    else:
+                        delay = min(backoff_cap, backoff_base * (2 ** (attempt - 1)))
+                        jitter = delay * (0.4 * random.random() - 0.2)
+                        sleep_for = max(0.05, delay + jitter)
                     logger.warning(
                         "usajobs.retrying",
                         extra={
@@ -191,3 +330,136 @@ class UsaJobsClient:
         assert last_exc is not None
         logger.error("usajobs.failed", extra={"error": str(last_exc)})
         raise last_exc
+
+    def fetch_search_pages(
+        self,
+        *,
+        keyword: str,
+        location_name: str | None = None,
+        radius_miles: int | None = None,
+        results_per_page: int = 50,
+        pages: int | Iterable[int] | None = None,
+        fields: str | None = None,
+        concurrency: int = 4,
+        date_posted: int | None = None,
+        newest_first: bool = False,
+        auto_page_size: bool = False,
+        on_plan: Callable[[PagePlan], None] | None = None,
+    ) -> Iterator[tuple[int, dict, dict]]:
+        """
+        Fetch several Search pages, yielding (page, request_dict, response_dict) in page order.
+
+        Page 1 is fetched first to read ``SearchResultCountAll`` (or, failing that,
+        ``UserArea.NumberOfPages``) and plan the exact remaining pages (``plan_pages``), which
+        are then fetched on a thread pool with at most ``concurrency`` requests in flight (a
+        sliding window, so memory stays bounded even for long runs). If the API reports
+        neither, falls back to sequential paging that stops on the first short page.
+
+        :param keyword: The search keyword (required)
+        :param location_name: The location name (optional)
+        :param radius_miles: The search radius in miles (optional)
+        :param results_per_page: The number of results per page (default: 50)
+        :param pages: Max page count (int), explicit page numbers, or None for all pages
+        :param fields: The fields to include in the response (optional)
+        :param concurrency: Max concurrent page requests (default: 4)
+        :param date_posted: Only postings posted within this many days, 0-60 (optional)
+        :param newest_first: Sort by open date, newest first (default: API relevance order)
+        :param auto_page_size: Fetch the same results in fewer, larger pages (up to the API
+            maximum of 500, see ``page_size_for``; default: as requested)
+        :param on_plan: Called with the page plan once page 1 is in (optional)
+        :return: An iterator of (page, request_dict, response_dict) tuples
+        """
+        if auto_page_size:
+            results_per_page, pages = page_size_for(results_per_page, pages)
+
+        def fetch(page: int) -> tuple[dict, dict]:
+            return self.fetch_search_page(
+                keyword=keyword,
+                location_name=location_name,
+                radius_miles=radius_miles,
+                results_per_page=results_per_page,
+                page=page,
+                fields=fields,
+                date_posted=date_posted,
+                newest_first=newest_first,
+            )
+
+        if isinstance(pages, int):
+            wanted: list[int] | None = list(range(1, pages + 1))
+        elif pages is None:
+            wanted = None
+        else:
+            wanted = sorted(set(pages))
+        if wanted is not None and not wanted:
+            return
+
+        first = wanted[0] if wanted else 1
+        request_dict, response_dict = fetch(first)
+        yield first, request_dict, response_dict
+
+        plan = plan_pages(
+            response_dict.get("payload"), results_per_page=results_per_page, wanted=wanted
+        )
+        if plan is None:
+            # Unknown page count: sequential paging, stop on a short (last) page.
+            count = _item_count(response_dict.get("payload"))
+            for page in (wanted or [])[1:]:
+                if count < results_per_page:
+                    return
+                request_dict, response_dict = fetch(page)
+                count = _item_count(response_dict.get("payload"))
+                yield page, request_dict, response_dict
+            return
+
+        if on_plan is not None:
+            on_plan(plan)
+        remaining = plan.pages[1:]
+        if not remaining:
+            return
+
+        workers = max(1, min(concurrency, len(remaining)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="usajobs-fetch")
+        try:
+            todo = iter(remaining)
+            window: deque[tuple[int, Future]] = deque()
+            for page in todo:
+                window.append((page, pool.submit(fetch, page)))
+                if len(window) >= workers:
+                    break
+            while window:
+                page, fut = window.popleft()
+                request_dict, response_dict = fut.result()
+                nxt = next(todo, None)
+                if nxt is not None:
+                    window.append((nxt, pool.submit(fetch, nxt)))
+                yield page, request_dict, response_dict
+        finally:
+            # Consumer may stop early (or a page may fail): drop queued work, let in-flight finish
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """
+    Build a keep-alive session with a connection pool sized for concurrent page fetches.
+
+    Transport-level retries are disabled; ``fetch_search_page`` owns retry/backoff.
+
+    :param pool_size: Max pooled connections per host.
+    :return: A configured requests.Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(1, pool_size), max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _item_count(payload: dict | None) -> int:
+    """
+    Count the result items in a raw Search payload.
+
+    :param payload: The raw response payload.
+    :return: The number of SearchResultItems (0 if absent).
+    """
+    items = ((payload or {}).get("SearchResult") or {}).get("SearchResultItems") or []
+    return len(items)
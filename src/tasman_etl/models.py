@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, cast
+from functools import cached_property
+from typing import Any
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, computed_field, field_validator
 
@@ -194,10 +195,13 @@ class ApiMatchedObjectDescriptor(BaseModel):
     ApplicationCloseDate: datetime | None = None
     UserArea: dict | None = None  # Details nested under UserArea
 
-    @computed_field
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def details(self) -> ApiDetails | None:
         """
-        Get the details from the UserArea.
+        Get the details from the UserArea, validated on first access and cached on the
+        instance (normalisation and ``model_dump`` reuse the same ApiDetails).
+        ``item_json`` leaves it out: UserArea.Details already holds it as received.
 
         :return: The details from the UserArea or None.
         """
@@ -392,10 +396,22 @@ class JobGradeRecord(BaseModel):
 # ------------------------------
 
 
+def item_json(item: ApiSearchResultItem) -> dict[str, Any]:
+    """
+    Dump a validated item for raw_json when the item as received is not available.
+
+    :param item: The API item.
+    :return: The JSON-ready item, without the computed ``details`` (a re-serialised copy
+        of UserArea.Details, which the dump already carries).
+    """
+    return item.model_dump(mode="json", exclude={"MatchedObjectDescriptor": {"details"}})
+
+
 def normalise_item(
     item: ApiSearchResultItem,
     ingest_run_id: str,
     source_event_time: datetime | None,
+    raw_item: dict[str, Any] | None = None,
 ) -> tuple[
     JobRecord,
     JobDetailsRecord,
@@ -409,13 +425,12 @@ def normalise_item(
     :param item: The API item to normalise.
     :param ingest_run_id: The ID of the ingest run.
     :param source_event_time: The source event time.
+    :param raw_item: The item exactly as received (stored as raw_json); when omitted the
+        validated model is dumped instead, which costs a full serialisation per item.
     :return: A tuple containing the normalised job records.
     """
     d = item.MatchedObjectDescriptor
-    # mypy: d.details is a computed_field+property (Pydantic) but static type seen as
-    # Callable/property;
-    # cast to the intended union for type checking.
-    details = cast(ApiDetails | None, d.details)
+    details = d.details
 
     pay_min = pay_max = None
     pay_code = None
@@ -446,7 +461,8 @@ def normalise_item(
         telework_eligible=(details.TeleworkEligible if details else None),
         source_event_time=source_event_time,
         ingest_run_id=ingest_run_id,
-        raw_json=item.model_dump(mode="json"),  # JSONB serialise-able
+        # JSONB serialise-able; the verbatim item avoids a validate -> dump round trip
+        raw_json=raw_item if raw_item is not None else item_json(item),
     )
 
     jd = JobDetailsRecord(
@@ -512,11 +528,11 @@ def normalise_item(
 # ------------------------------
 
 
-def parse_page_json(json_text: str) -> ApiResponse:
+def parse_page_json(json_text: str | bytes) -> ApiResponse:
     """
-    Parse the JSON text from a page response.
+    Parse the JSON text (or raw body bytes) from a page response.
 
-    :param json_text: The JSON text to parse.
+    :param json_text: The JSON text or bytes to parse.
     :return: An ApiResponse object.
     """
     # Pydantic v2 JSON entrypoint
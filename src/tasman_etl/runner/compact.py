@@ -0,0 +1,373 @@
+"""
+Compact a day's bronze pages into a few large columnar (Parquet) or NDJSON objects.
+
+Bronze holds one small ``page=NNNN.json.gz`` object per API page, which makes ad-hoc scans
+and bulk reprocessing LIST/GET-heavy. This job reads every page for a date partition (all
+runs) and rewrites the search result items as one row each:
+
+    <BRONZE_COMPACT_PREFIX>/date=YYYY/MM/DD/part-NNNNN.parquet   (or .ndjson.gz)
+    <BRONZE_COMPACT_PREFIX>/date=YYYY/MM/DD/manifest.json
+
+Rows are buffered up to ``rows_per_part``, sorted by (position_id, publication_start_date)
+and written as one part, so memory is bounded by a part rather than the day. Parquet parts
+carry row-group min/max statistics on ``position_id`` and ``publication_start_date`` (readers
+skip row groups that cannot match); the manifest records the same min/max per part for
+both formats, so readers of either can pick parts without opening them.
+
+The manifest is written last and is the source of truth: parts it does not list (e.g. left
+over from an earlier, larger compaction of the same day) are ignored.
+
+Parquet needs the optional ``pyarrow`` dependency (``pip install .[parquet]``).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from tasman_etl.storage.bronze_s3 import (
+    get_json_gz,
+    list_bronze_keys,
+    parse_bronze_key,
+    put_bytes,
+    utc_now_iso,
+)
+
+logger = logging.getLogger("tasman.compact")
+
+COMPACT_FORMATS = ("parquet", "ndjson")
+COMPACT_PREFIX = os.environ.get("BRONZE_COMPACT_PREFIX", "compact/usajobs").rstrip("/")
+
+# One row per search result item; item_json is the verbatim item (Parquet) and is emitted
+# as a nested ``item`` object in NDJSON.
+COMPACT_COLUMNS: tuple[str, ...] = (
+    "position_id",
+    "publication_start_date",
+    "matched_object_id",
+    "ingest_run_id",
+    "page",
+    "bronze_key",
+    "received_at",
+    "item_json",
+)
+STATS_COLUMNS: tuple[str, ...] = ("position_id", "publication_start_date")
+
+
+@dataclass(frozen=True)
+class CompactConfig:
+    """
+    Which days to compact and how (see ``main`` for the env vars).
+    """
+
+    start: dt.date
+    end: dt.date
+    fmt: str = "parquet"
+    rows_per_part: int = 100_000
+    row_group_size: int = 10_000
+    workers: int = 4
+
+
+def load_compact_config() -> CompactConfig:
+    """
+    Build the compaction configuration from environment variables.
+
+    :return: The compaction configuration.
+    :raises RuntimeError: If a required variable is missing or a value is invalid.
+    """
+    start_s = os.getenv("COMPACT_FROM")
+    if not start_s:
+        raise RuntimeError("missing COMPACT_FROM env var (YYYY-MM-DD)")
+    try:
+        start = dt.date.fromisoformat(start_s)
+        end = dt.date.fromisoformat(os.getenv("COMPACT_TO") or start_s)
+    except ValueError as e:
+        raise RuntimeError(f"Invalid compaction date: {e}") from e
+    if end < start:
+        raise RuntimeError(f"Compaction range end {end} is before start {start}")
+
+    fmt = (os.getenv("COMPACT_FORMAT") or "parquet").lower()
+    if fmt not in COMPACT_FORMATS:
+        raise RuntimeError(f"invalid COMPACT_FORMAT {fmt!r}; expected one of {COMPACT_FORMATS}")
+
+    try:
+        rows_per_part = int(os.getenv("COMPACT_ROWS_PER_PART") or 100_000)
+        row_group_size = int(os.getenv("COMPACT_ROW_GROUP_SIZE") or 10_000)
+        workers = int(os.getenv("COMPACT_WORKERS") or 4)
+    except ValueError as e:
+        raise RuntimeError(f"Invalid int for compaction setting: {e}") from e
+
+    return CompactConfig(
+        start=start,
+        end=end,
+        fmt=fmt,
+        rows_per_part=max(1, rows_per_part),
+        row_group_size=max(1, row_group_size),
+        workers=max(1, workers),
+    )
+
+
+def compact_prefix(date: dt.date) -> str:
+    """
+    Get the compacted partition prefix for a day.
+
+    :param date: The bronze date partition.
+    :return: The key prefix (no trailing slash).
+    """
+    return f"{COMPACT_PREFIX}/date={date:%Y/%m/%d}"
+
+
+def page_rows(key: str, envelope: dict) -> list[tuple]:
+    """
+    Flatten one bronze envelope into compacted rows (COMPACT_COLUMNS order).
+
+    :param key: The bronze key the envelope was read from.
+    :param envelope: The decoded bronze envelope.
+    :return: One row per search result item.
+    """
+    _, key_run, page = parse_bronze_key(key)
+    response = envelope.get("response") or {}
+    run_id = (envelope.get("ingest") or {}).get("ingest_run_id") or key_run
+    received_at = response.get("received_at")
+    result = (response.get("payload") or {}).get("SearchResult") or {}
+    rows = []
+    for item in result.get("SearchResultItems") or []:
+        d = item.get("MatchedObjectDescriptor") or {}
+        rows.append(
+            (
+                d.get("PositionID"),
+                d.get("PublicationStartDate"),
+                item.get("MatchedObjectId"),
+                run_id,
+                page,
+                key,
+                received_at,
+                json.dumps(item, separators=(",", ":"), ensure_ascii=False),
+            )
+        )
+    return rows
+
+
+def _page_rows(keys: list[str], workers: int) -> Iterator[list[tuple]]:
+    """
+    Download and flatten pages on a thread pool, yielding in key order.
+
+    Keys are processed in batches of ``2 * workers`` so only a bounded number of decoded
+    pages is held at once.
+
+    :param keys: The bronze keys to read.
+    :param workers: Pages downloaded in parallel.
+    :return: An iterator of per-page row lists.
+    """
+    batch = 2 * workers
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="compact") as pool:
+        for i in range(0, len(keys), batch):
+            chunk = keys[i : i + batch]
+            yield from pool.map(lambda k: page_rows(k, get_json_gz(k)), chunk)
+
+
+def _stats(rows: list[tuple]) -> dict[str, dict[str, Any]]:
+    """
+    Min/max of the statistics columns (nulls ignored), as recorded in the manifest.
+
+    :param rows: The part's rows.
+    :return: ``{column: {"min": ..., "max": ...}}``.
+    """
+    out: dict[str, dict[str, Any]] = {}
+    for col in STATS_COLUMNS:
+        i = COMPACT_COLUMNS.index(col)
+        values = [r[i] for r in rows if r[i] is not None]
+        out[col] = {"min": min(values, default=None), "max": max(values, default=None)}
+    return out
+
+
+def _to_parquet(rows: list[tuple], row_group_size: int) -> bytes:
+    """
+    Serialise rows as a zstd-compressed Parquet file with statistics on STATS_COLUMNS.
+
+    :param rows: The part's rows (already sorted).
+    :param row_group_size: Max rows per row group.
+    :return: The Parquet file bytes.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pragma: no cover - depends on the optional extra
+        raise RuntimeError(
+            "COMPACT_FORMAT=parquet needs pyarrow (pip install .[parquet]); "
+            "or use COMPACT_FORMAT=ndjson"
+        ) from e
+
+    schema = pa.schema(
+        [
+            ("position_id", pa.string()),
+            ("publication_start_date", pa.string()),  # ISO text: sorts (and prunes) by date
+            ("matched_object_id", pa.string()),
+            ("ingest_run_id", pa.string()),
+            ("page", pa.int32()),
+            ("bronze_key", pa.string()),
+            ("received_at", pa.string()),
+            ("item_json", pa.string()),
+        ]
+    )
+    columns = list(zip(*rows, strict=True)) if rows else [()] * len(COMPACT_COLUMNS)
+    table = pa.Table.from_arrays(
+        [pa.array(col, type=field.type) for col, field in zip(columns, schema, strict=True)],
+        schema=schema,
+    )
+    sink = pa.BufferOutputStream()
+    pq.write_table(
+        table,
+        sink,
+        row_group_size=row_group_size,
+        compression="zstd",
+        write_statistics=list(STATS_COLUMNS),
+    )
+    return sink.getvalue().to_pybytes()
+
+
+def _to_ndjson_gz(rows: list[tuple]) -> bytes:
+    """
+    Serialise rows as gzipped newline-delimited JSON (item nested, not re-quoted).
+
+    :param rows: The part's rows (already sorted).
+    :return: The gzipped NDJSON bytes.
+    """
+    lines = []
+    for r in rows:
+        rec = dict(zip(COMPACT_COLUMNS[:-1], r[:-1], strict=True))
+        # item_json is already compact JSON: splice it in instead of decoding/re-encoding
+        head = json.dumps(rec, separators=(",", ":"), ensure_ascii=False)
+        lines.append(f'{head[:-1]},"item":{r[-1]}}}')
+    body = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+    return gzip.compress(body, mtime=0)
+
+
+def _write_part(date: dt.date, n: int, rows: list[tuple], cfg: CompactConfig) -> dict:
+    """
+    Sort, serialise and upload one part.
+
+    :param date: The bronze date partition.
+    :param n: The part number.
+    :param rows: The part's rows.
+    :param cfg: The compaction configuration.
+    :return: The part's manifest entry.
+    """
+    rows.sort(key=lambda r: (r[0] or "", r[1] or ""))
+    if cfg.fmt == "parquet":
+        key = f"{compact_prefix(date)}/part-{n:05d}.parquet"
+        resp = put_bytes(
+            key,
+            _to_parquet(rows, cfg.row_group_size),
+            content_type="application/vnd.apache.parquet",
+        )
+    else:
+        key = f"{compact_prefix(date)}/part-{n:05d}.ndjson.gz"
+        resp = put_bytes(
+            key,
+            _to_ndjson_gz(rows),
+            content_type="application/x-ndjson",
+            content_encoding="gzip",
+        )
+    return {"key": key, "rows": len(rows), "sha256_hex": resp["sha256_hex"], **_stats(rows)}
+
+
+def compact_day(date: dt.date, cfg: CompactConfig) -> dict:
+    """
+    Compact every bronze page of one date partition and write its manifest.
+
+    :param date: The bronze date partition.
+    :param cfg: The compaction configuration.
+    :return: The manifest written (also stored as ``manifest.json``).
+    """
+    keys = list_bronze_keys(date)
+    parts: list[dict] = []
+    buf: list[tuple] = []
+    for rows in _page_rows(keys, cfg.workers):
+        buf.extend(rows)
+        while len(buf) >= cfg.rows_per_part:
+            parts.append(_write_part(date, len(parts), buf[: cfg.rows_per_part], cfg))
+            del buf[: cfg.rows_per_part]
+    if buf or not parts:
+        parts.append(_write_part(date, len(parts), buf, cfg))
+
+    manifest = {
+        "date": date.isoformat(),
+        "format": cfg.fmt,
+        "created_at": utc_now_iso(),
+        "source_pages": len(keys),
+        "rows": sum(p["rows"] for p in parts),
+        "columns": list(COMPACT_COLUMNS),
+        "parts": parts,
+    }
+    put_bytes(
+        f"{compact_prefix(date)}/manifest.json",
+        json.dumps(manifest, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        content_type="application/json",
+    )
+    return manifest
+
+
+def compact(cfg: CompactConfig) -> dict[str, int]:
+    """
+    Compact every day in the configured range.
+
+    :param cfg: The compaction configuration.
+    :return: Day, page, part and row counts.
+    """
+    total = {"days": 0, "pages": 0, "parts": 0, "rows": 0}
+    day = cfg.start
+    while day <= cfg.end:
+        manifest = compact_day(day, cfg)
+        total["days"] += 1
+        total["pages"] += manifest["source_pages"]
+        total["parts"] += len(manifest["parts"])
+        total["rows"] += manifest["rows"]
+        logger.info(
+            "compact.day",
+            extra={"date": manifest["date"], "pages": manifest["source_pages"]},
+        )
+        day += dt.timedelta(days=1)
+    return total
+
+
+def main() -> int:
+    """Executable entrypoint for bronze compaction.
+
+    Controlled by environment variables:
+      COMPACT_FROM (required)              – First bronze date partition (YYYY-MM-DD).
+      COMPACT_TO (default COMPACT_FROM)    – Last date partition (inclusive).
+      COMPACT_FORMAT (default parquet)     – parquet (needs pyarrow) or ndjson (gzipped).
+      COMPACT_ROWS_PER_PART (100000)       – Max rows per output object.
+      COMPACT_ROW_GROUP_SIZE (10000)       – Max rows per Parquet row group.
+      COMPACT_WORKERS (default 4)          – Bronze pages downloaded in parallel.
+      BRONZE_COMPACT_PREFIX                – Output prefix (default compact/usajobs).
+
+    Returns process exit code (0 success, 1 failure / config error).
+    """
+    try:
+        cfg = load_compact_config()
+    except RuntimeError as e:
+        logger.error("compact.config_error", extra={"error": str(e)})
+        return 1
+    logger.info("compact.start", extra={k: str(v) for k, v in asdict(cfg).items()})
+
+    try:
+        total = compact(cfg)
+    except Exception as e:  # pragma: no cover - top level failure
+        logger.error("compact.failed", extra={"error": str(e)})
+        return 1
+
+    logger.info("compact.complete", extra=total)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - integration path
+    sys.exit(main())
@@ -0,0 +1,394 @@
+"""
+Multi-search runner: many keyword/location searches in one process.
+
+``run.main`` covers one KEYWORD / LOCATION_NAME / RADIUS_MILES search per process, so a
+run over dozens of searches pays container start, imports and DB connects dozens of times.
+Here a run spec (JSON, or YAML if PyYAML is installed) lists the searches:
+
+    {
+      "defaults": {"results_per_page": 500, "max_pages": 5},
+      "searches": [
+        {"name": "chicago-data", "keyword": "data engineer",
+         "location_name": "Chicago, Illinois", "radius_miles": 25},
+        {"keyword": "data scientist", "location_name": "Chicago, Illinois"}
+      ]
+    }
+
+The searches run in spec order and share one API client (keep-alive session and rate
+limiter), the DB connection pool and one bronze uploader. Each search keeps its own bronze
+pages and manifest under ``run=<RUN_ID>-<name>``. Postings already loaded earlier in the run
+(by an earlier search, or an earlier page) are dropped before loading, so overlapping
+searches load each position_id once; per-search stats are logged and returned.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sys
+from collections.abc import Mapping
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, TypedDict
+
+from tasman_etl.http.paging import PagePlan
+from tasman_etl.http.usajobs import UsaJobsClient
+from tasman_etl.runner.run import (
+    IncrementalSearch,
+    load_page,
+    load_run_options,
+    persist_raw_page,
+    prepare_page,
+)
+from tasman_etl.storage.bronze_s3 import BronzeUploader
+from tasman_etl.storage.manifest import RunManifest
+
+logger = logging.getLogger("tasman.fanout")
+
+_NAME_RE = re.compile(r"[^a-z0-9_]+")
+
+# SearchStats keys that describe one search's result set; summing them across overlapping
+# searches means nothing, so the run totals leave them out (they stay per search)
+_PER_SEARCH_KEYS = frozenset({"total_results", "planned_pages"})
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """
+    One search of a run spec (the per-search part of ``run.RunConfig``).
+    """
+
+    name: str
+    keyword: str
+    location_name: str | None = None
+    radius_miles: int | None = None
+    results_per_page: int = 50
+    max_pages: int = 1
+    fields: str | None = None
+
+
+_SEARCH_KEYS = frozenset(f.name for f in fields(SearchSpec))
+
+
+@dataclass(frozen=True)
+class FanoutConfig:
+    """
+    The searches of one run plus the run-level settings they share (see ``main``).
+    """
+
+    run_id: str
+    searches: tuple[SearchSpec, ...]
+    fetch_concurrency: int = 4
+    dq_override: bool | None = None
+    load_mode: str = "bulk"
+    upload_workers: int = 4
+    incremental: bool = False
+    auto_page_size: bool = True
+
+
+class SearchStats(TypedDict):
+    search: str
+    run_id: str
+    total_results: int | None
+    planned_pages: int
+    pages: int
+    items: int
+    duplicates: int
+    jobs: int
+    locations: int
+    categories: int
+    grades: int
+    inserted: int
+    updated: int
+    unchanged: int
+
+
+def _slug(value: str) -> str:
+    return _NAME_RE.sub("-", value.lower()).strip("-")
+
+
+def parse_run_spec(doc: Any) -> tuple[SearchSpec, ...]:
+    """
+    Build the searches from a parsed run spec.
+
+    :param doc: A mapping with a ``searches`` list (and optional ``defaults`` applied to
+        every search), or just the list.
+    :return: The searches, in spec order.
+    :raises RuntimeError: If the spec is empty, malformed or has duplicate search names.
+    """
+    if isinstance(doc, list):
+        doc = {"searches": doc}
+    if not isinstance(doc, Mapping) or not isinstance(doc.get("searches"), list):
+        raise RuntimeError("run spec needs a 'searches' list")
+    defaults = doc.get("defaults") or {}
+    if not isinstance(defaults, Mapping):
+        raise RuntimeError("run spec 'defaults' must be a mapping")
+
+    searches: list[SearchSpec] = []
+    for i, entry in enumerate(doc["searches"], start=1):
+        if not isinstance(entry, Mapping):
+            raise RuntimeError(f"search #{i} must be a mapping")
+        merged = {**defaults, **entry}
+        unknown = set(merged) - _SEARCH_KEYS
+        if unknown:
+            raise RuntimeError(f"search #{i}: unknown keys {sorted(unknown)}")
+        keyword = merged.get("keyword")
+        if not keyword:
+            raise RuntimeError(f"search #{i}: missing keyword")
+        location = merged.get("location_name") or None
+        name = _slug(str(merged.get("name") or " ".join(filter(None, [keyword, location]))))
+        if not name:
+            raise RuntimeError(f"search #{i}: name must contain letters or digits")
+        try:
+            radius = merged.get("radius_miles")
+            search = SearchSpec(
+                name=name,
+                keyword=str(keyword),
+                location_name=location,
+                radius_miles=None if radius in (None, "") else int(radius),
+                results_per_page=int(merged.get("results_per_page") or 50),
+                max_pages=int(merged.get("max_pages") or 1),
+                fields=merged.get("fields") or None,
+            )
+        except (TypeError, ValueError) as e:
+            raise RuntimeError(f"search #{i} ({name}): {e}") from e
+        searches.append(search)
+
+    if not searches:
+        raise RuntimeError("run spec lists no searches")
+    names = [s.name for s in searches]
+    dupes = sorted({n for n in names if names.count(n) > 1})
+    if dupes:
+        raise RuntimeError(f"duplicate search names {dupes}; set a unique 'name' per search")
+    return tuple(searches)
+
+
+def load_run_spec(path: str | Path) -> tuple[SearchSpec, ...]:
+    """
+    Read a run spec file (``.yaml``/``.yml`` as YAML, anything else as JSON).
+
+    :param path: The spec file.
+    :return: The searches, in spec order.
+    :raises RuntimeError: If the file cannot be read or parsed, or the spec is invalid.
+    """
+    p = Path(path)
+    try:
+        text = p.read_text(encoding="utf-8")
+    except OSError as e:
+        raise RuntimeError(f"cannot read run spec {p}: {e}") from e
+
+    if p.suffix.lower() in {".yaml", ".yml"}:
+        try:
+            import yaml
+        except ImportError as e:  # pragma: no cover - depends on the environment
+            raise RuntimeError(f"YAML run spec {p} needs PyYAML; or use a .json spec") from e
+        try:
+            doc = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise RuntimeError(f"invalid YAML in run spec {p}: {e}") from e
+    else:
+        try:
+            doc = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"invalid JSON in run spec {p}: {e}") from e
+    return parse_run_spec(doc)
+
+
+def load_fanout_config() -> FanoutConfig:
+    """
+    Build the fan-out configuration from environment variables.
+
+    :return: The fan-out configuration.
+    :raises RuntimeError: If RUN_SPEC is missing or the spec / a value is invalid.
+    """
+    spec_path = os.getenv("RUN_SPEC")
+    if not spec_path:
+        raise RuntimeError("missing RUN_SPEC env var")
+    return FanoutConfig(searches=load_run_spec(spec_path), **load_run_options())
+
+
+def run_search(
+    cfg: FanoutConfig,
+    search: SearchSpec,
+    *,
+    client: UsaJobsClient,
+    seen: set[str],
+    uploader: BronzeUploader | None = None,
+    manifest: RunManifest | None = None,
+    incremental: IncrementalSearch | None = None,
+) -> SearchStats:
+    """
+    Fetch, persist, validate and load one search, skipping postings already in ``seen``.
+
+    Every fetched page is written to bronze in full; only the load is de-duplicated.
+
+    :param cfg: The fan-out configuration (run-level settings).
+    :param search: The search to run.
+    :param client: The shared API client.
+    :param seen: position_ids loaded earlier in the run (updated in place).
+    :param uploader: Shared background bronze uploader (default: upload inline).
+    :param manifest: The search's run manifest (optional).
+    :param incremental: The search's watermark tracker (optional; begins here).
+    :return: The search's stats.
+    """
+    run_id = f"{cfg.run_id}-{search.name}"
+    stats: SearchStats = {
+        "search": search.name,
+        "run_id": run_id,
+        "total_results": None,
+        "planned_pages": 0,
+        "pages": 0,
+        "items": 0,
+        "duplicates": 0,
+        "jobs": 0,
+        "locations": 0,
+        "categories": 0,
+        "grades": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+    }
+
+    def on_plan(plan: PagePlan) -> None:
+        stats["total_results"] = plan.total
+        stats["planned_pages"] = len(plan.pages)
+
+    fetch_opts = incremental.begin() if incremental is not None else {}
+    pages = client.fetch_search_pages(
+        keyword=search.keyword,
+        location_name=search.location_name,
+        radius_miles=search.radius_miles,
+        results_per_page=search.results_per_page,
+        pages=search.max_pages,
+        fields=search.fields,
+        concurrency=cfg.fetch_concurrency,
+        auto_page_size=cfg.auto_page_size,
+        on_plan=on_plan,
+        **fetch_opts,
+    )
+    if incremental is not None:
+        pages = incremental.new_pages(pages)
+    for page, request_dict, response_dict in pages:
+        key = persist_raw_page(
+            run_id, page, request_dict, response_dict, uploader=uploader, manifest=manifest
+        )
+        rows = prepare_page(run_id, response_dict, dq_enforce=cfg.dq_override)
+        stats["pages"] += 1
+        stats["items"] += len(rows)
+        if incremental is not None:
+            incremental.observe(rows)  # duplicates below were stored by an earlier search
+
+        # A position_id listed twice on the page keeps its last row, as the loaders would
+        last = {pid: i for i, pid in enumerate(rows.job["position_id"]) if pid not in seen}
+        seen.update(last)
+        fresh = sorted(last.values())
+        stats["duplicates"] += len(rows) - len(fresh)
+        if not fresh:
+            continue
+        if len(fresh) < len(rows):
+            rows = rows.take(fresh)
+
+        loaded = load_page(rows, bronze_key_out=key, load_mode=cfg.load_mode)
+        # Explicit aggregation to satisfy mypy (TypedDict requires literal keys)
+        stats["jobs"] += loaded["jobs"]
+        stats["locations"] += loaded["locations"]
+        stats["categories"] += loaded["categories"]
+        stats["grades"] += loaded["grades"]
+        stats["inserted"] += loaded["inserted"]
+        stats["updated"] += loaded["updated"]
+        stats["unchanged"] += loaded["unchanged"]
+    return stats
+
+
+def run_searches(cfg: FanoutConfig, *, client: UsaJobsClient | None = None) -> list[SearchStats]:
+    """
+    Run every search of the spec in order, sharing one client, uploader and seen-set.
+
+    :param cfg: The fan-out configuration.
+    :param client: Shared API client (created if omitted).
+    :return: Per-search stats, in spec order.
+    """
+    client = client or UsaJobsClient()
+    uploader = BronzeUploader(cfg.upload_workers) if cfg.upload_workers > 0 else None
+    manifests = [RunManifest(f"{cfg.run_id}-{s.name}") for s in cfg.searches]
+    trackers = [
+        IncrementalSearch(s.keyword, s.location_name, s.radius_miles) if cfg.incremental else None
+        for s in cfg.searches
+    ]
+    seen: set[str] = set()
+    out: list[SearchStats] = []
+    with uploader or nullcontext():
+        for search, manifest, incremental in zip(cfg.searches, manifests, trackers, strict=True):
+            stats = run_search(
+                cfg,
+                search,
+                client=client,
+                seen=seen,
+                uploader=uploader,
+                manifest=manifest,
+                incremental=incremental,
+            )
+            logger.info(
+                "fanout.search",
+                extra={**stats, **(incremental.stats() if incremental is not None else {})},
+            )
+            out.append(stats)
+    # Written once every upload has landed; only then do the watermarks move
+    for manifest, incremental in zip(manifests, trackers, strict=True):
+        manifest.write()
+        if incremental is not None:
+            incremental.commit(manifest.run_id)
+    return out
+
+
+def main() -> int:
+    """Executable entrypoint for a multi-search run.
+
+    Controlled by environment variables:
+      RUN_SPEC (required)               – Run spec file (.json, or .yaml/.yml with PyYAML).
+      RUN_ID                            – Run ID; each search runs as <RUN_ID>-<name>.
+      FETCH_CONCURRENCY (default 4)     – Max concurrent page requests within a search.
+      DQ_ENFORCE / LOAD_MODE / BRONZE_UPLOAD_WORKERS / INCREMENTAL – As for ``run.main``
+                                          (watermarks are per search).
+
+    Returns process exit code (0 success, 1 failure / validation fail / config error).
+    """
+    try:
+        cfg = load_fanout_config()
+    except RuntimeError as e:
+        logger.error("fanout.config_error", extra={"error": str(e)})
+        return 1
+    logger.info(
+        "fanout.start",
+        extra={**asdict(cfg), "searches": [s.name for s in cfg.searches]},
+    )
+
+    client = UsaJobsClient()
+    try:
+        results = run_searches(cfg, client=client)
+    except Exception as e:  # pragma: no cover - top level failure
+        logger.error("fanout.failed", extra={"error": str(e), "run_id": cfg.run_id})
+        return 1
+
+    totals: dict[str, int] = {}
+    for stats in results:
+        for k, v in stats.items():
+            if isinstance(v, int) and k not in _PER_SEARCH_KEYS:
+                totals[k] = totals.get(k, 0) + v
+    logger.info(
+        "fanout.complete",
+        extra={
+            "run_id": cfg.run_id,
+            "searches": results,
+            **totals,
+            "http": client.connection_stats(),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - integration path
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Staged (overlapped) runner: fetch, bronze write, parse/validate and load run concurrently.
+
+``run.main`` processes each page strictly in series, so the network, S3 and Postgres idle
+while the other stages work. Here each stage runs on its own thread, connected by bounded
+queues: page N+1 is being fetched (and written to bronze) while page N is loading, and a
+slow stage back-pressures the ones before it instead of buffering the whole run in memory.
+
+Pages are still loaded one at a time and in page order, so the DB end state is identical to
+``run.main``. The first stage failure stops every stage and is re-raised.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from tasman_etl.http.paging import PagePlan
+from tasman_etl.http.usajobs import UsaJobsClient
+from tasman_etl.runner.run import (
+    IncrementalSearch,
+    RunConfig,
+    load_page,
+    load_run_config,
+    persist_raw_page,
+    prepare_page,
+)
+from tasman_etl.storage.bronze_s3 import BronzeUploader
+from tasman_etl.storage.manifest import RunManifest
+from tasman_etl.transform import PageRows
+
+logger = logging.getLogger("tasman.pipeline")
+
+_DONE = object()  # end-of-stream marker passed down the queues
+_POLL_S = 0.1
+
+
+@dataclass
+class StageTimer:
+    """
+    Busy time and item count for one pipeline stage.
+    """
+
+    name: str
+    busy_s: float = 0.0
+    items: int = 0
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """
+    Put with back-pressure, giving up if the pipeline is stopping.
+
+    :param q: The downstream queue.
+    :param item: The item to enqueue.
+    :param stop: The pipeline stop event.
+    :return: True if enqueued, False if the pipeline stopped first.
+    """
+    while True:
+        try:
+            q.put(item, timeout=_POLL_S)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                return False
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    """
+    Get the next item, or the end marker if the pipeline is stopping.
+
+    :param q: The upstream queue.
+    :param stop: The pipeline stop event.
+    :return: The next item or _DONE.
+    """
+    while True:
+        if stop.is_set():
+            return _DONE
+        try:
+            return q.get(timeout=_POLL_S)
+        except queue.Empty:
+            continue
+
+
+def _source(
+    items: Iterator[Any],
+    outbox: queue.Queue,
+    stop: threading.Event,
+    errors: list[BaseException],
+    timer: StageTimer,
+) -> None:
+    """
+    Drive the head of the pipeline from an iterator (time spent in next() is stage time).
+
+    :param items: The item iterator (e.g. fetched pages).
+    :param outbox: The downstream queue.
+    :param stop: The pipeline stop event.
+    :param errors: Shared list collecting the first failure(s).
+    :param timer: The stage timer to update.
+    """
+    try:
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                break
+            timer.busy_s += time.perf_counter() - t0
+            timer.items += 1
+            if not _put(outbox, item, stop):
+                break
+    except BaseException as e:  # surface in the caller thread
+        errors.append(e)
+        stop.set()
+    finally:
+        close = getattr(items, "close", None)
+        if callable(close):
+            close()  # release fetch workers if we stopped early
+        _put(outbox, _DONE, stop)
+
+
+def _stage(
+    fn: Callable[[Any], Any],
+    inbox: queue.Queue,
+    outbox: queue.Queue | None,
+    stop: threading.Event,
+    errors: list[BaseException],
+    timer: StageTimer,
+) -> None:
+    """
+    Apply ``fn`` to each item from ``inbox`` and forward results to ``outbox``.
+
+    :param fn: The stage function.
+    :param inbox: The upstream queue.
+    :param outbox: The downstream queue (None for the final stage).
+    :param stop: The pipeline stop event.
+    :param errors: Shared list collecting the first failure(s).
+    :param timer: The stage timer to update.
+    """
+    try:
+        while True:
+            item = _get(inbox, stop)
+            if item is _DONE:
+                break
+            t0 = time.perf_counter()
+            out = fn(item)
+            timer.busy_s += time.perf_counter() - t0
+            timer.items += 1
+            if outbox is not None and not _put(outbox, out, stop):
+                break
+    except BaseException as e:  # surface in the caller thread
+        errors.append(e)
+        stop.set()
+    finally:
+        if outbox is not None:
+            _put(outbox, _DONE, stop)
+
+
+def run_pipeline(
+    cfg: RunConfig,
+    *,
+    client: UsaJobsClient | None = None,
+    queue_size: int = 2,
+) -> dict[str, Any]:
+    """
+    Run one search through the staged pipeline and return aggregate stats.
+
+    :param cfg: The run configuration.
+    :param client: Shared API client (created if omitted).
+    :param queue_size: Max pages buffered between adjacent stages (back-pressure bound).
+    :return: Totals, page count, per-stage timings, wall time and the run manifest key.
+    """
+    client = client or UsaJobsClient()
+    run_id = cfg.run_id
+    total = {
+        "pages": 0,
+        "jobs": 0,
+        "locations": 0,
+        "categories": 0,
+        "grades": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+    }
+
+    # With BRONZE_UPLOAD_WORKERS > 0 the bronze stage only hands pages to the uploader;
+    # the uploads themselves overlap every other stage and are flushed at the end.
+    uploader = BronzeUploader(cfg.upload_workers) if cfg.upload_workers > 0 else None
+    manifest = RunManifest(run_id)
+    incremental = (
+        IncrementalSearch(cfg.keyword, cfg.location_name, cfg.radius_miles)
+        if cfg.incremental
+        else None
+    )
+
+    def bronze(item: tuple[int, dict, dict]) -> tuple[int, str, dict]:
+        page, request_dict, response_dict = item
+        key = persist_raw_page(
+            run_id, page, request_dict, response_dict, uploader=uploader, manifest=manifest
+        )
+        return page, key, response_dict
+
+    def transform(item: tuple[int, str, dict]) -> tuple[int, str, PageRows]:
+        page, key, response_dict = item
+        return page, key, prepare_page(run_id, response_dict, dq_enforce=cfg.dq_override)
+
+    def load(item: tuple[int, str, PageRows]) -> None:
+        page, key, page_rows = item
+        stats = load_page(page_rows, bronze_key_out=key, load_mode=cfg.load_mode)
+        if incremental is not None:
+            incremental.observe(page_rows)
+        total["pages"] += 1
+        total["jobs"] += stats["jobs"]
+        total["locations"] += stats["locations"]
+        total["categories"] += stats["categories"]
+        total["grades"] += stats["grades"]
+        total["inserted"] += stats["inserted"]
+        total["updated"] += stats["updated"]
+        total["unchanged"] += stats["unchanged"]
+
+    fetch_opts = incremental.begin() if incremental is not None else {}
+    plans: list[PagePlan] = []
+    pages = client.fetch_search_pages(
+        keyword=cfg.keyword,
+        location_name=cfg.location_name,
+        radius_miles=cfg.radius_miles,
+        results_per_page=cfg.results_per_page,
+        pages=cfg.max_pages,
+        fields=cfg.fields,
+        concurrency=cfg.fetch_concurrency,
+        auto_page_size=cfg.auto_page_size,
+        on_plan=plans.append,
+        **fetch_opts,
+    )
+    if incremental is not None:
+        # Stops at the first page of already-stored postings (checked in the fetch stage)
+        pages = incremental.new_pages(pages)
+
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    timers = [StageTimer(n) for n in ("fetch", "bronze", "transform", "load")]
+    q_fetched: queue.Queue = queue.Queue(maxsize=queue_size)
+    q_bronze: queue.Queue = queue.Queue(maxsize=queue_size)
+    q_ready: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    threads = [
+        threading.Thread(
+            target=_source, args=(pages, q_fetched, stop, errors, timers[0]), name="pl-fetch"
+        ),
+        threading.Thread(
+            target=_stage,
+            args=(bronze, q_fetched, q_bronze, stop, errors, timers[1]),
+            name="pl-bronze",
+        ),
+        threading.Thread(
+            target=_stage,
+            args=(transform, q_bronze, q_ready, stop, errors, timers[2]),
+            name="pl-transform",
+        ),
+        threading.Thread(
+            target=_stage, args=(load, q_ready, None, stop, errors, timers[3]), name="pl-load"
+        ),
+    ]
+    t0 = time.perf_counter()
+    with uploader or nullcontext():
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+    wall_s = time.perf_counter() - t0
+    manifest_key = manifest.write()  # after the uploader flush: only landed pages
+    if incremental is not None:
+        incremental.commit(run_id)
+
+    return {
+        **total,
+        **(plans[0].stats() if plans else {}),
+        **(incremental.stats() if incremental is not None else {}),
+        "stages": {t.name: {"busy_s": round(t.busy_s, 3), "items": t.items} for t in timers},
+        "wall_s": round(wall_s, 3),
+        "manifest": manifest_key,
+    }
+
+
+def main() -> int:
+    """Executable entrypoint for the staged pipeline (same env vars as ``run.main``).
+
+    Additionally:
+      PIPELINE_QUEUE_SIZE (default 2)  – Max pages buffered between adjacent stages.
+
+    Returns process exit code (0 success, 1 failure / validation fail / config error).
+    """
+    try:
+        cfg = load_run_config()
+        queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE") or 2)
+    except (RuntimeError, ValueError) as e:
+        logger.error("ingest.config_error", extra={"error": str(e)})
+        return 1
+    logger.info("ingest.start", extra={**asdict(cfg), "queue_size": queue_size})
+
+    client = UsaJobsClient()
+    try:
+        result = run_pipeline(cfg, client=client, queue_size=queue_size)
+    except Exception as e:  # pragma: no cover - top level failure
+        logger.error("ingest.failed", extra={"error": str(e), "run_id": cfg.run_id})
+        return 1
+
+    logger.info(
+        "ingest.complete",
+        extra={"run_id": cfg.run_id, **result, "http": client.connection_stats()},
+    )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - integration path
+    sys.exit(main())
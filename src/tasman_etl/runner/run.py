@@ -7,17 +7,34 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from collections.abc import Iterator, Mapping
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
-from typing import TypedDict
+from typing import Any, TypedDict
 
 from tasman_etl.config import get_settings
 from tasman_etl.db.engine import engine
-from tasman_etl.db.repository import PageBundle, upsert_page
-from tasman_etl.dq.gx.validate import validate_page_jobs
+from tasman_etl.db.repository import (
+    LOAD_MODES,
+    copy_pages,
+    upsert_pages,
+    upsert_rows,
+)
+from tasman_etl.db.watermark import (
+    advance_watermark,
+    date_posted_days,
+    known_position_ids,
+    read_watermark,
+    search_key,
+)
+from tasman_etl.dq.validate import validate_page_rows
+from tasman_etl.http.paging import PagePlan
 from tasman_etl.http.usajobs import UsaJobsClient
 from tasman_etl.models import ApiResponse
-from tasman_etl.storage.bronze_s3 import bronze_key, put_json_gz, utc_now_iso
-from tasman_etl.transform import normalise_page
+from tasman_etl.storage.bronze_s3 import BronzeUploader, bronze_key, put_json_gz, utc_now_iso
+from tasman_etl.storage.manifest import RunManifest, page_entry
+from tasman_etl.transform import PageRows, normalise_page_rows, raw_json_items
 
 logging.basicConfig(level=logging.INFO)
 
@@ -28,9 +45,120 @@ class IngestStats(TypedDict):
     locations: int
     categories: int
     grades: int
+    inserted: int
+    updated: int
+    unchanged: int
 
 
-def persist_raw_page(run_id: str, page: int, request_dict: dict, response_dict: dict) -> str:
+class IncrementalSearch:
+    """
+    Watermark and early stop for one search in an incremental run (INCREMENTAL=true).
+
+    ``begin`` turns the search's watermark into a DatePosted filter with newest-first
+    sorting; ``new_pages`` ends the paging at the first page whose postings are all already
+    stored (the rest are older still); ``observe`` tracks the newest loaded posting and
+    ``commit`` advances the watermark once the run has completed.
+    """
+
+    def __init__(
+        self, keyword: str, location_name: str | None = None, radius_miles: int | None = None
+    ) -> None:
+        """
+        Initialise the tracker for one search.
+
+        :param keyword: The search keyword.
+        :param location_name: The location name (optional).
+        :param radius_miles: The search radius in miles (optional).
+        """
+        self.key = search_key(keyword, location_name, radius_miles)
+        self.since: datetime | None = None
+        self.date_posted: int | None = None
+        self.high_water: datetime | None = None
+        self.caught_up_page: int | None = None
+
+    def begin(self) -> dict[str, Any]:
+        """
+        Read the search's watermark.
+
+        :return: Extra ``fetch_search_pages`` kwargs (DatePosted, newest first).
+        """
+        with engine.connect() as conn:
+            self.since = read_watermark(conn, self.key)
+        self.date_posted = date_posted_days(self.since)
+        return {"date_posted": self.date_posted, "newest_first": True}
+
+    def new_pages(
+        self, pages: Iterator[tuple[int, dict, dict]]
+    ) -> Iterator[tuple[int, dict, dict]]:
+        """
+        Pass fetched pages through until one holds only already-stored postings.
+
+        :param pages: (page, request_dict, response_dict) tuples, newest postings first.
+        :return: The pages before that point; the source is closed when this stops.
+        """
+        try:
+            for page, request_dict, response_dict in pages:
+                items = response_dict["payload"]["SearchResult"]["SearchResultItems"]
+                pids = {
+                    pid
+                    for it in items
+                    if (pid := (it.get("MatchedObjectDescriptor") or {}).get("PositionID"))
+                }
+                if pids:
+                    with engine.connect() as conn:
+                        known = known_position_ids(conn, pids)
+                    if known >= pids:
+                        self.caught_up_page = page
+                        return
+                yield page, request_dict, response_dict
+        finally:
+            close = getattr(pages, "close", None)
+            if callable(close):
+                close()  # release fetch workers (in-flight pages are dropped)
+
+    def observe(self, rows: PageRows) -> None:
+        """
+        Track the newest posting of a loaded page.
+
+        :param rows: The page's rows.
+        """
+        dates = [d for d in rows.job["publication_start_date"] if d is not None]
+        if dates:
+            newest = max(dates)
+            if self.high_water is None or newest > self.high_water:
+                self.high_water = newest
+
+    def commit(self, run_id: str) -> None:
+        """
+        Advance the watermark after a completed run (no-op if nothing was loaded).
+
+        :param run_id: The ID of the run.
+        """
+        if self.high_water is None:
+            return
+        with engine.connect() as conn:
+            advance_watermark(conn, self.key, self.high_water, run_id)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        :return: The watermark read, the DatePosted sent and where paging stopped.
+        """
+        return {
+            "watermark": self.since.isoformat() if self.since else None,
+            "date_posted": self.date_posted,
+            "caught_up_page": self.caught_up_page,
+        }
+
+
+def persist_raw_page(
+    run_id: str,
+    page: int,
+    request_dict: dict,
+    response_dict: dict,
+    *,
+    uploader: BronzeUploader | None = None,
+    manifest: RunManifest | None = None,
+) -> str:
     """
     Persist a raw page of data to S3.
 
@@ -38,6 +166,8 @@ def persist_raw_page(run_id: str, page: int, request_dict: dict, response_dict:
     :param page: The page number.
     :param request_dict: The request metadata.
     :param response_dict: The response payload.
+    :param uploader: Upload in the background via this uploader (default: upload inline).
+    :param manifest: Record the written page (key, size, SHA-256, position_ids) here.
     :return: The S3 key for the bronze job.
     """
     envelope = {
@@ -51,7 +181,17 @@ def persist_raw_page(run_id: str, page: int, request_dict: dict, response_dict:
         "ingest": {"ingest_run_id": run_id},
     }
     key = bronze_key(run_id, page)
-    put_json_gz(key, envelope)
+
+    def put(k: str, doc: Mapping[str, Any]) -> dict:
+        resp = put_json_gz(k, doc)
+        if manifest is not None:  # only pages that were actually written are recorded
+            manifest.add(page_entry(k, page, response_dict["payload"], resp))
+        return resp
+
+    if uploader is not None:
+        uploader.submit(key, envelope, put)  # failures surface at uploader.flush()
+    else:
+        put(key, envelope)
     return key
 
 
@@ -65,14 +205,16 @@ def ingest_search_page(
     results_per_page: int = 50,
     fields: str | None = None,
     dq_enforce: bool | None = None,  # override Settings() if desired
+    load_mode: str | None = None,  # override Settings() if desired
+    client: UsaJobsClient | None = None,
 ) -> IngestStats:
     """
     End-to-end for one Search page:
       1) fetch page (HTTP)
       2) persist bronze
-      3) validate (GX)
-      4) normalise -> bundles
-      5) upsert into DB
+      3) validate (DQ rules)
+      4) normalise -> column-oriented rows
+      5) bulk upsert into DB (one set-based load per page)
     Returns simple run stats.
 
     :param run_id: The ID of the run.
@@ -83,10 +225,12 @@ def ingest_search_page(
     :param results_per_page: The number of results per page (default: 50).
     :param fields: The fields to include in the response (default: None).
     :param dq_enforce: Whether to enforce data quality checks (default: None).
+    :param load_mode: Loader strategy, one of LOAD_MODES (default: None -> Settings).
+    :param client: Shared API client (reuses its keep-alive session); created if omitted.
     :return: A dictionary of run statistics.
     """
     # 1) fetch
-    client = UsaJobsClient()
+    client = client or UsaJobsClient()
     request_dict, response_dict = client.fetch_search_page(
         keyword=keyword,
         location_name=location_name,
@@ -95,49 +239,153 @@ def ingest_search_page(
         page=page,
         fields=fields,
     )
+    return ingest_fetched_page(
+        run_id=run_id,
+        page=page,
+        request_dict=request_dict,
+        response_dict=response_dict,
+        dq_enforce=dq_enforce,
+        load_mode=load_mode,
+    )
+
 
+def ingest_fetched_page(
+    *,
+    run_id: str,
+    page: int,
+    request_dict: dict,
+    response_dict: dict,
+    dq_enforce: bool | None = None,  # override Settings() if desired
+    load_mode: str | None = None,  # override Settings() if desired
+    uploader: BronzeUploader | None = None,
+    manifest: RunManifest | None = None,
+    incremental: IncrementalSearch | None = None,
+) -> IngestStats:
+    """
+    Steps 2-5 of ``ingest_search_page`` for a page that has already been fetched
+    (e.g. by ``UsaJobsClient.fetch_search_pages``).
+
+    :param run_id: The ID of the run.
+    :param page: The page number.
+    :param request_dict: The request metadata returned by the client.
+    :param response_dict: The response returned by the client.
+    :param dq_enforce: Whether to enforce data quality checks (default: None).
+    :param load_mode: Loader strategy, one of LOAD_MODES (default: None -> Settings).
+    :param uploader: Background bronze uploader (default: upload inline).
+    :param manifest: Run manifest to record the bronze page in (optional).
+    :param incremental: Watermark tracker to report the loaded page to (optional).
+    :return: A dictionary of run statistics.
+    """
     # 2) bronze
-    bronze_key_out = persist_raw_page(run_id, page, request_dict, response_dict)
+    bronze_key_out = persist_raw_page(
+        run_id, page, request_dict, response_dict, uploader=uploader, manifest=manifest
+    )
 
-    # 3) parse & normalise
-    resp = ApiResponse.model_validate(response_dict["payload"])
-    bundles = normalise_page(resp, ingest_run_id=run_id, source_event_time=datetime.now(UTC))
+    # 3) parse & normalise, 4) validation (DQ rules)
+    page_rows = prepare_page(run_id, response_dict, dq_enforce=dq_enforce)
 
-    # 4) validation (GX)
-    jobs = [b.job for b in bundles]
-    locs = [loc for b in bundles for loc in b.locations]
-    vx = validate_page_jobs(jobs, locs)
+    # 5) load
+    stats = load_page(page_rows, bronze_key_out=bronze_key_out, load_mode=load_mode)
+    if incremental is not None:
+        incremental.observe(page_rows)
+    return stats
+
+
+def prepare_page(
+    run_id: str,
+    response_dict: dict,
+    *,
+    dq_enforce: bool | None = None,  # override Settings() if desired
+    source_event_time: datetime | None = None,
+) -> PageRows:
+    """
+    Parse, normalise and validate one fetched page (steps 3-4); raises if the DQ gate fails.
+
+    :param run_id: The ID of the run.
+    :param response_dict: The response returned by the client.
+    :param dq_enforce: Whether to enforce data quality checks (default: None).
+    :param source_event_time: When the page was received (default: now).
+    :return: The page's rows, ready to load.
+    """
+    # 3) parse & normalise. The client decoded the body into a dict with pydantic-core
+    # (bronze and raw_json need the dict); the model is then validated from that dict, not
+    # from the bytes: model_validate_json on top would be a second parse of the body.
+    # raw_json comes from each item dict instead of re-dumping the model: by default only
+    # what silver does not store (RAW_JSON_MODE=verbatim keeps the item, =model re-dumps).
+    payload = response_dict["payload"]
+    # Rows go straight into column batches; NORMALISE_STRICT=true builds the DTOs instead.
+    resp = ApiResponse.model_validate(payload)
     settings = get_settings()
+    rows = normalise_page_rows(
+        resp,
+        ingest_run_id=run_id,
+        source_event_time=source_event_time or datetime.now(UTC),
+        raw_items=raw_json_items(
+            payload["SearchResult"]["SearchResultItems"], settings.raw_json_mode
+        ),
+        strict=settings.normalise_strict,
+    )
+
+    # 4) validation (native vectorised checks; GX via DQ_ENGINE=gx|audit)
+    vx = validate_page_rows(rows)
     enforce = settings.dq_enforce if dq_enforce is None else dq_enforce
     if enforce and not vx.passed:
         # Fail hard if gate is on
         failed = [r.name for r in vx.rules if not r.success]
         raise RuntimeError(f"Validation failed (gate on). Failed rules: {failed}")
 
-    # 5) load
+    return rows
+
+
+def load_page(
+    page_rows: PageRows,
+    *,
+    bronze_key_out: str,
+    load_mode: str | None = None,  # override Settings() if desired
+) -> IngestStats:
+    """
+    Load one page of rows into Postgres (step 5) with the selected loader.
+
+    :param page_rows: The page's rows.
+    :param bronze_key_out: The bronze key the page was persisted under (for stats).
+    :param load_mode: Loader strategy, one of LOAD_MODES (default: None -> Settings).
+    :return: A dictionary of run statistics.
+    """
     stats: IngestStats = {
         "bronze_key": bronze_key_out,
         "jobs": 0,
         "locations": 0,
         "categories": 0,
         "grades": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
     }
+    settings = get_settings()
+    mode = load_mode or settings.load_mode
     with engine.connect() as conn:  # or `psycopg.connect(engine.dsn) as conn`
-        for b in bundles:
-            # If using Pydantic for PageBundle in future, uncomment the line below
-            # page_bundle = PageBundle(**b.model_dump())
-            page_bundle = PageBundle(
-                job=b.job,
-                details=b.details,
-                locations=list(b.locations),  # ensure list (defensive copy)
-                categories=list(b.categories),
-                grades=list(b.grades),
+        if mode == "copy":
+            # COPY into temp staging tables + INSERT ... SELECT merge (backfills)
+            result = copy_pages(conn, page_rows)
+        elif mode == "row":
+            # Legacy path: one transaction per job
+            result = upsert_rows(
+                conn,
+                page_rows,
+                pipeline=settings.load_pipeline,
+                prepare=settings.load_prepare,
             )
-            upsert_page(conn, page_bundle)
-            stats["jobs"] += 1
-            stats["locations"] += len(b.locations)
-            stats["categories"] += len(b.categories)
-            stats["grades"] += len(b.grades)
+        else:
+            # One set-based load per page (fixed statement count, not per job/child row)
+            result = upsert_pages(conn, page_rows)
+    # Postings whose content hash is unchanged were not rewritten (lineage only)
+    stats["inserted"] = result.inserted
+    stats["updated"] = result.updated
+    stats["unchanged"] = result.unchanged
+    stats["jobs"] = len(page_rows)
+    stats["locations"] = len(page_rows.locations["loc_idx"])
+    stats["categories"] = len(page_rows.categories["code"])
+    stats["grades"] = len(page_rows.grades["code"])
 
     return stats
 
@@ -156,6 +404,78 @@ def _derive_run_id() -> str:
     return datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
 
 
+@dataclass(frozen=True)
+class RunConfig:
+    """
+    Search + loader settings for one batch run (see ``main`` for the env vars).
+    """
+
+    run_id: str
+    keyword: str
+    location_name: str | None = None
+    radius_miles: int | None = None
+    results_per_page: int = 50
+    max_pages: int = 1
+    fields: str | None = None
+    fetch_concurrency: int = 4
+    dq_override: bool | None = None
+    load_mode: str = "bulk"
+    upload_workers: int = 4
+    incremental: bool = False
+    auto_page_size: bool = True
+
+
+def load_run_config() -> RunConfig:
+    """
+    Build the run configuration from environment variables.
+
+    :return: The run configuration.
+    :raises RuntimeError: If a required variable is missing or a value is invalid.
+    """
+    keyword = os.getenv("KEYWORD")
+    if not keyword:
+        raise RuntimeError("missing KEYWORD env var")
+
+    return RunConfig(
+        keyword=keyword,
+        location_name=os.getenv("LOCATION_NAME") or None,
+        radius_miles=_env_int("RADIUS_MILES"),
+        results_per_page=_env_int("RESULTS_PER_PAGE", 50) or 50,
+        max_pages=_env_int("MAX_PAGES", 1) or 1,
+        fields=os.getenv("FIELDS") or None,
+        **load_run_options(),
+    )
+
+
+def load_run_options() -> dict[str, Any]:
+    """
+    Read the run-level (non-search) settings shared by every runner from the environment.
+
+    :return: run_id, fetch_concurrency, dq_override, load_mode, upload_workers,
+        incremental and auto_page_size.
+    :raises RuntimeError: If a value is invalid.
+    """
+    dq_env = os.getenv("DQ_ENFORCE")
+    dq_override: bool | None = None
+    if dq_env is not None:
+        dq_override = dq_env.lower() in {"1", "true", "yes", "on"}
+
+    load_mode = (os.getenv("LOAD_MODE") or "bulk").lower()
+    if load_mode not in LOAD_MODES:
+        raise RuntimeError(f"invalid LOAD_MODE {load_mode!r}; expected one of {LOAD_MODES}")
+
+    return {
+        "run_id": os.getenv("RUN_ID") or _derive_run_id(),
+        "fetch_concurrency": _env_int("FETCH_CONCURRENCY", 4) or 1,
+        "dq_override": dq_override,
+        "load_mode": load_mode,
+        "upload_workers": _env_int("BRONZE_UPLOAD_WORKERS", 4) or 0,
+        "incremental": (os.getenv("INCREMENTAL") or "").lower() in {"1", "true", "yes", "on"},
+        "auto_page_size": (os.getenv("AUTO_PAGE_SIZE") or "true").lower()
+        in {"1", "true", "yes", "on"},
+    }
+
+
 def main() -> int:
     """Executable entrypoint for batch ingestion.
 
@@ -164,75 +484,116 @@ def main() -> int:
       LOCATION_NAME                     – Location filter (e.g. "Chicago, Illinois").
       RADIUS_MILES                      – Integer radius in miles.
       RESULTS_PER_PAGE (default 50)     – Page size requested from API.
-      MAX_PAGES (default 1)             – Max pages to request (stop early on empty page).
+      MAX_PAGES (default 1)             – Max pages to request (capped at the last page of
+                                          SearchResultCountAll).
+      AUTO_PAGE_SIZE (default true)     – Fetch the same MAX_PAGES x RESULTS_PER_PAGE results
+                                          in the fewest pages of up to 500.
+      FETCH_CONCURRENCY (default 4)     – Max concurrent page requests after page 1.
       FIELDS                            – Optional API Fields parameter.
       DQ_ENFORCE                        – Override data quality gate (true/false).
+      DQ_ENGINE (default native)        – Validator: native (vectorised), gx, or audit
+                                          (native gate + GX cross-check logged).
+      LOAD_MODE (default bulk)          – Loader: bulk (multi-row upsert), copy (COPY
+                                          staging + merge, for backfills) or row (per job).
+      BRONZE_UPLOAD_WORKERS (default 4) – Concurrent background bronze uploads (0 = inline);
+                                          all uploads are flushed before the run completes.
+      INCREMENTAL (default false)       – Fetch only postings since the search's watermark
+                                          (DatePosted, newest first) and stop at the first
+                                          page of already-stored postings.
 
     Returns process exit code (0 success, 1 failure / validation fail / config error).
     """
     logger = logging.getLogger("tasman.main")
 
-    keyword = os.getenv("KEYWORD")
-    if not keyword:
-        logger.error("missing KEYWORD env var")
+    try:
+        cfg = load_run_config()
+    except RuntimeError as e:
+        logger.error("ingest.config_error", extra={"error": str(e)})
         return 1
+    run_id = cfg.run_id
+    logger.info("ingest.start", extra=asdict(cfg))
 
-    location_name = os.getenv("LOCATION_NAME") or None
-    radius_miles = _env_int("RADIUS_MILES")
-    results_per_page = _env_int("RESULTS_PER_PAGE", 50) or 50
-    max_pages = _env_int("MAX_PAGES", 1) or 1
-    fields = os.getenv("FIELDS") or None
-
-    dq_env = os.getenv("DQ_ENFORCE")
-    dq_override: bool | None = None
-    if dq_env is not None:
-        dq_override = dq_env.lower() in {"1", "true", "yes", "on"}
-
-    run_id = os.getenv("RUN_ID") or _derive_run_id()
-    logger.info(
-        "ingest.start",
-        extra={
-            "run_id": run_id,
-            "keyword": keyword,
-            "location_name": location_name,
-            "radius_miles": radius_miles,
-            "results_per_page": results_per_page,
-            "max_pages": max_pages,
-            "fields": fields,
-            "dq_override": dq_override,
-        },
-    )
-
-    total = {"jobs": 0, "locations": 0, "categories": 0, "grades": 0}
+    total = {
+        "jobs": 0,
+        "locations": 0,
+        "categories": 0,
+        "grades": 0,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+    }
     pages_fetched = 0
+    plans: list[PagePlan] = []
+    # One client (one pooled keep-alive session) for the whole run
+    client = UsaJobsClient()
+    # Bronze pages upload in the background while later pages load; leaving the block
+    # waits for them and raises if any failed, so a run never completes with missing bronze.
+    uploader = BronzeUploader(cfg.upload_workers) if cfg.upload_workers > 0 else None
+    manifest = RunManifest(run_id)
+    incremental = (
+        IncrementalSearch(cfg.keyword, cfg.location_name, cfg.radius_miles)
+        if cfg.incremental
+        else None
+    )
     try:
-        for page in range(1, max_pages + 1):
-            stats = ingest_search_page(
-                run_id=run_id,
-                page=page,
-                keyword=keyword,
-                location_name=location_name,
-                radius_miles=radius_miles,
-                results_per_page=results_per_page,
-                fields=fields,
-                dq_enforce=dq_override,
-            )
-            pages_fetched += 1
-            # Explicit aggregation to satisfy mypy (TypedDict requires literal keys)
-            total["jobs"] += stats["jobs"]
-            total["locations"] += stats["locations"]
-            total["categories"] += stats["categories"]
-            total["grades"] += stats["grades"]
-            # Heuristic stop: if fewer jobs than page size, assume last page.
-            if stats["jobs"] < results_per_page:
-                break
+        fetch_opts = incremental.begin() if incremental is not None else {}
+        # Pages after the first are fetched in parallel (bounded) but yielded in page order,
+        # so loading stays sequential and deterministic.
+        pages = client.fetch_search_pages(
+            keyword=cfg.keyword,
+            location_name=cfg.location_name,
+            radius_miles=cfg.radius_miles,
+            results_per_page=cfg.results_per_page,
+            pages=cfg.max_pages,
+            fields=cfg.fields,
+            concurrency=cfg.fetch_concurrency,
+            auto_page_size=cfg.auto_page_size,
+            on_plan=plans.append,
+            **fetch_opts,
+        )
+        if incremental is not None:
+            pages = incremental.new_pages(pages)
+        with uploader or nullcontext():
+            for page, request_dict, response_dict in pages:
+                stats = ingest_fetched_page(
+                    run_id=run_id,
+                    page=page,
+                    request_dict=request_dict,
+                    response_dict=response_dict,
+                    dq_enforce=cfg.dq_override,
+                    load_mode=cfg.load_mode,
+                    uploader=uploader,
+                    manifest=manifest,
+                    incremental=incremental,
+                )
+                pages_fetched += 1
+                # Explicit aggregation to satisfy mypy (TypedDict requires literal keys)
+                total["jobs"] += stats["jobs"]
+                total["locations"] += stats["locations"]
+                total["categories"] += stats["categories"]
+                total["grades"] += stats["grades"]
+                total["inserted"] += stats["inserted"]
+                total["updated"] += stats["updated"]
+                total["unchanged"] += stats["unchanged"]
+        # Written once every upload has landed: keys, sizes and SHA-256 for the run
+        manifest_key = manifest.write()
+        if incremental is not None:
+            incremental.commit(run_id)  # only a completed run moves the watermark
     except Exception as e:  # pragma: no cover - top level failure
         logger.error("ingest.failed", extra={"error": str(e), "run_id": run_id})
         return 1
 
     logger.info(
         "ingest.complete",
-        extra={"run_id": run_id, "pages": pages_fetched, **total},
+        extra={
+            "run_id": run_id,
+            "pages": pages_fetched,
+            "manifest": manifest_key,
+            **total,
+            **(plans[0].stats() if plans else {}),
+            **(incremental.stats() if incremental is not None else {}),
+            "http": client.connection_stats(),
+        },
     )
     return 0
 
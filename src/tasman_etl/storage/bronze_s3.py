@@ -1,6 +1,6 @@
 """
 This module provides utilities for interacting with AWS S3, specifically for uploading
-gzipped JSON documents to a "bronze" storage layer.
+gzipped JSON documents to a "bronze" storage layer (and listing/reading them back for replay).
 """
 
 from __future__ import annotations
@@ -11,30 +11,61 @@ import hashlib
 import io
 import json
 import os
-from collections.abc import Mapping
-from typing import Any
+import re
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, BinaryIO, TypeVar
 
 import boto3
 from botocore.config import Config
+from botocore.exceptions import ClientError
+
+_T = TypeVar("_T")
 
 BRONZE_BUCKET = os.environ.get("BRONZE_S3_BUCKET")
 BRONZE_PREFIX = os.environ.get("BRONZE_S3_PREFIX", "bronze/usajobs").rstrip("/")
+LOCAL_ROOT = "bronze_local"  # dev fallback root (relative to the working directory)
+
+# Container levels streamed piecewise:
+# envelope -> response -> payload -> SearchResult -> SearchResultItems (one chunk per item).
+_STREAM_DEPTH = 5
+_ENCODE_BATCH = 64 * 1024  # characters of JSON buffered between gzip writes
+_MIN_PART_SIZE = 5 * 1024 * 1024  # S3 minimum for every multipart part except the last
+
+_KEY_RE = re.compile(
+    r"date=(?P<y>\d{4})/(?P<m>\d{2})/(?P<d>\d{2})/run=(?P<run>[^/]+)/page=(?P<page>\d+)\.json\.gz$"
+)
+
+
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
 
 
 def s3_client():
     """
-    A boto3 S3 client with custom configuration.
-    """
-    return boto3.client(
-        "s3",
-        config=Config(
-            retries={
-                "max_attempts": 5,
-                "mode": "standard",
-            },  # Configure retry behaviour with exponential backoff
-            user_agent_extra="tasman-etl/bronze",
-        ),
-    )
+    The process-wide boto3 S3 client, created on first use.
+
+    boto3 clients are thread-safe, so every upload/read (including parallel uploads) shares
+    one client and its connection pool instead of re-resolving credentials and endpoints
+    per page. Pool size: BRONZE_S3_MAX_POOL_CONNECTIONS (default 10).
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = boto3.client(
+                    "s3",
+                    config=Config(
+                        retries={
+                            "max_attempts": 5,
+                            "mode": "standard",
+                        },  # Configure retry behaviour with exponential backoff
+                        user_agent_extra="tasman-etl/bronze",
+                        max_pool_connections=int(os.getenv("BRONZE_S3_MAX_POOL_CONNECTIONS") or 10),
+                    ),
+                )
+    return _CLIENT
 
 
 def utc_now_iso() -> str:
@@ -59,23 +90,404 @@ def bronze_key(run_id: str, page: int, date: dt.date | None = None) -> str:
     return f"{BRONZE_PREFIX}/date={d:%Y/%m/%d}/run={run_id}/page={page:04d}.json.gz"
 
 
-def _to_gz_bytes(doc: Mapping[str, Any]) -> bytes:
+def parse_bronze_key(key: str) -> tuple[dt.date, str, int]:
+    """
+    Split a bronze key into its partition values.
+
+    :param key: The S3 key (or local relative path) of a bronze page.
+    :return: A tuple of (date, run_id, page).
+    :raises RuntimeError: If the key does not follow the bronze layout.
+    """
+    m = _KEY_RE.search(key)
+    if m is None:
+        raise RuntimeError(f"Not a bronze page key: {key}")
+    date = dt.date(int(m["y"]), int(m["m"]), int(m["d"]))
+    return date, m["run"], int(m["page"])
+
+
+def _use_s3() -> bool:
+    """
+    Decide between S3 and the ./bronze_local fallback (same preflight for reads and writes).
+
+    :return: True if a bucket is configured and AWS creds appear available.
+    """
+    have_bucket = bool(BRONZE_BUCKET)
+    # Basic heuristic: both access key & secret or a session token OR a profile (skip check).
+    have_creds_env = bool(
+        os.getenv("AWS_ACCESS_KEY_ID") and os.getenv("AWS_SECRET_ACCESS_KEY")
+    ) or bool(os.getenv("AWS_SESSION_TOKEN"))
+    return have_bucket and have_creds_env
+
+
+def list_bronze_keys(
+    start: dt.date,
+    end: dt.date | None = None,
+    run_id: str | None = None,
+) -> list[str]:
+    """
+    List bronze page keys for a date range (inclusive), optionally for one run.
+
+    Lists one ``date=YYYY/MM/DD/`` prefix per day, from S3 or ./bronze_local.
+
+    :param start: The first date.
+    :param end: The last date (default: start).
+    :param run_id: Only return pages of this run (optional).
+    :return: Keys sorted by (date, run, page).
+    """
+    end = end or start
+    if end < start:
+        raise RuntimeError(f"Replay range end {end} is before start {start}")
+
+    days = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+    prefixes = [f"{BRONZE_PREFIX}/date={d:%Y/%m/%d}/" for d in days]
+    if run_id:
+        prefixes = [f"{p}run={run_id}/" for p in prefixes]
+
+    keys: list[str] = []
+    if _use_s3():
+        paginator = s3_client().get_paginator("list_objects_v2")
+        for prefix in prefixes:
+            for page in paginator.paginate(Bucket=BRONZE_BUCKET, Prefix=prefix):
+                keys.extend(obj["Key"] for obj in page.get("Contents", []))
+    else:
+        root = os.path.abspath(LOCAL_ROOT)
+        for prefix in prefixes:
+            base = os.path.join(root, prefix)
+            for dirpath, _, files in os.walk(base):
+                rel = os.path.relpath(dirpath, root).replace(os.sep, "/")
+                keys.extend(f"{rel}/{name}" for name in files)
+
+    pages = [k for k in keys if _KEY_RE.search(k)]
+    return sorted(pages, key=parse_bronze_key)
+
+
+def get_bytes(key: str) -> bytes | None:
     """
-    Convert a document to gzipped JSON bytes.
+    Read one object's raw body (S3, or ./bronze_local fallback).
+
+    :param key: The S3 key for the object.
+    :return: The body, or None if the object does not exist.
+    """
+    if _use_s3():
+        try:
+            return s3_client().get_object(Bucket=BRONZE_BUCKET, Key=key)["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+                return None
+            raise
+    try:
+        with open(os.path.join(os.path.abspath(LOCAL_ROOT), key), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def get_json_gz(key: str) -> dict:
+    """
+    Read and decompress one bronze document (S3, or ./bronze_local fallback).
+
+    :param key: The S3 key for the object.
+    :return: The decoded JSON document.
+    :raises RuntimeError: If the object does not exist.
+    """
+    body = get_bytes(key)
+    if body is None:
+        raise RuntimeError(f"Bronze object not found: {key}")
+    return json.loads(gzip.decompress(body))
+
+
+class _HashingWriter:
+    """
+    Write-only file object that SHA-256 hashes and counts every byte on its way to a sink.
+
+    Deliberately has no ``name`` attribute, so ``GzipFile`` writes an empty filename in the
+    header and the output stays byte-identical whatever the sink is.
+    """
+
+    def __init__(self, sink: Any) -> None:
+        """
+        Initialise the writer.
+
+        :param sink: Any object with a ``write(bytes)`` method.
+        """
+        self._sink = sink
+        self._sha = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """
+        Hash and forward a chunk.
+
+        :param data: The bytes to write.
+        :return: The number of bytes written.
+        """
+        self._sha.update(data)
+        self.size += len(data)
+        self._sink.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """
+        No-op (GzipFile calls this on close); sinks flush themselves.
+        """
+
+    def hexdigest(self) -> str:
+        """
+        :return: The SHA-256 hex digest of everything written so far.
+        """
+        return self._sha.hexdigest()
+
+
+def _iter_json(obj: Any, depth: int) -> Iterator[str]:
+    """
+    Yield the compact JSON text of ``obj`` in pieces, identical to ``json.dumps`` output.
+
+    The outer ``depth`` levels of dicts/lists are walked here; anything deeper (e.g. one
+    search result item) is encoded in one go by the C encoder, which ``iterencode`` never
+    uses and which is several times faster than the pure-Python path.
+
+    :param obj: The value to encode.
+    :param depth: How many container levels to stream before delegating to ``json.dumps``.
+    :return: An iterator of JSON text fragments.
+    """
+    if depth > 0 and isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+        yield "{"
+        for i, (k, v) in enumerate(obj.items()):
+            yield ("," if i else "") + _dumps(k) + ":"
+            yield from _iter_json(v, depth - 1)
+        yield "}"
+    elif depth > 0 and isinstance(obj, (list, tuple)):
+        yield "["
+        for i, v in enumerate(obj):
+            if i:
+                yield ","
+            yield from _iter_json(v, depth - 1)
+        yield "]"
+    else:
+        yield _dumps(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Encode a value with the bronze JSON settings (compact, UTF-8 kept as-is).
+
+    :param obj: The value to encode.
+    :return: The JSON text.
+    """
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def write_json_gz(doc: Mapping[str, Any], sink: Any) -> tuple[str, int]:
+    """
+    Stream a document as deterministic gzipped JSON into ``sink``.
+
+    JSON is produced incrementally (see ``_iter_json``) and compressed as it goes, so neither
+    the full JSON text nor its UTF-8 encoding is ever held in memory; the SHA-256 of the
+    compressed bytes is computed in the same pass.
 
     Note:
-        mtime=0 makes the gzip output deterministic (no timestamp), enabling reproducible builds and
-        stable tests.
+        mtime=0 makes the gzip output deterministic (no timestamp), enabling reproducible builds
+        and stable tests. Chunking does not change the deflate stream, so the bytes are identical
+        to compressing the whole ``json.dumps`` output at once.
+    :param doc: The document to serialise.
+    :param sink: Any object with a ``write(bytes)`` method (file, BytesIO, multipart upload).
+    :return: A tuple of (sha256_hex, compressed_size).
+    """
+    hashing = _HashingWriter(sink)
+    with gzip.GzipFile(fileobj=hashing, mode="wb", mtime=0) as gz:
+        # Batch the many tiny iterencode chunks so each GzipFile.write sees a useful amount.
+        # (Never gz.flush(): a sync flush would change the deflate stream.)
+        pending: list[str] = []
+        pending_len = 0
+        for chunk in _iter_json(doc, _STREAM_DEPTH):
+            pending.append(chunk)
+            pending_len += len(chunk)
+            if pending_len >= _ENCODE_BATCH:
+                gz.write("".join(pending).encode("utf-8"))
+                pending.clear()
+                pending_len = 0
+        gz.write("".join(pending).encode("utf-8"))
+    return hashing.hexdigest(), hashing.size
+
+
+def _to_gz_bytes(doc: Mapping[str, Any]) -> bytes:
+    """
+    Convert a document to gzipped JSON bytes (in memory; see ``write_json_gz``).
+
     :param doc: The document to convert.
     :return: The gzipped JSON bytes.
     """
-    raw = json.dumps(doc, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
     buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
-        gz.write(raw)
+    write_json_gz(doc, buf)
     return buf.getvalue()
 
 
+class _S3MultipartSink:
+    """
+    Write-only sink that uploads to S3 in parts as data arrives.
+
+    At most one part (``part_size`` bytes) is buffered. If the stream ends before the first
+    part fills, nothing has been sent yet and ``close()`` falls back to a single put_object.
+    """
+
+    def __init__(self, client: Any, key: str, extra: Mapping[str, Any], part_size: int) -> None:
+        """
+        Initialise the sink.
+
+        :param client: The boto3 S3 client.
+        :param key: The S3 key for the object.
+        :param extra: Object attributes (content type/encoding, SSE) for the upload.
+        :param part_size: Bytes per part (S3 requires >= 5 MiB for all but the last part).
+        """
+        self._client = client
+        self._key = key
+        self._extra = dict(extra)
+        self._part_size = max(part_size, _MIN_PART_SIZE)
+        self._buf = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[dict[str, Any]] = []
+
+    def write(self, data: bytes) -> int:
+        """
+        Buffer a chunk, uploading a part whenever the buffer reaches ``part_size``.
+
+        :param data: The bytes to write.
+        :return: The number of bytes written.
+        """
+        self._buf += data
+        while len(self._buf) >= self._part_size:
+            part = bytes(self._buf[: self._part_size])
+            del self._buf[: self._part_size]
+            self._upload_part(part)
+        return len(data)
+
+    def close(self, sha256_hex: str) -> dict:
+        """
+        Finish the upload.
+
+        A single put_object records the whole-object SHA-256 in the object metadata. A
+        multipart upload cannot: its metadata is fixed by CreateMultipartUpload before the
+        digest is known. It carries S3's per-part SHA-256 checksums instead, and the digest
+        is returned (and recorded in the run manifest) without an extra request.
+
+        :param sha256_hex: The SHA-256 hex digest of the complete body.
+        :return: The S3 response (put_object or complete_multipart_upload).
+        """
+        if self._upload_id is None:
+            return self._client.put_object(
+                Bucket=BRONZE_BUCKET,
+                Key=self._key,
+                Body=bytes(self._buf),
+                ChecksumAlgorithm="SHA256",  # S3 verifies checksum on upload
+                Metadata={"sha256_hex": sha256_hex},
+                **self._extra,
+            )
+        if self._buf:
+            self._upload_part(bytes(self._buf))
+            self._buf.clear()
+        return self._client.complete_multipart_upload(
+            Bucket=BRONZE_BUCKET,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self) -> None:
+        """
+        Abort an in-flight multipart upload so no orphaned parts are billed.
+        """
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=BRONZE_BUCKET, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+
+    def _upload_part(self, part: bytes) -> None:
+        """
+        Upload one part, starting the multipart upload on the first call.
+
+        :param part: The part body.
+        """
+        if self._upload_id is None:
+            resp = self._client.create_multipart_upload(
+                Bucket=BRONZE_BUCKET, Key=self._key, ChecksumAlgorithm="SHA256", **self._extra
+            )
+            self._upload_id = resp["UploadId"]
+        number = len(self._parts) + 1
+        resp = self._client.upload_part(
+            Bucket=BRONZE_BUCKET,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=number,
+            Body=part,
+            ChecksumAlgorithm="SHA256",
+        )
+        self._parts.append(
+            {"PartNumber": number, "ETag": resp["ETag"], "ChecksumSHA256": resp["ChecksumSHA256"]}
+        )
+
+
+def _write_local(key: str, write: Callable[[BinaryIO], _T]) -> tuple[str, _T]:
+    """
+    Write ./bronze_local/<key> via a temp file renamed into place.
+
+    :param key: The S3 key for the object.
+    :param write: Writes the body to the open file; its return value is passed through.
+    :return: A tuple of (local path, write's return value).
+    """
+    local_path = os.path.join(os.path.abspath(LOCAL_ROOT), key)
+    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+    tmp_path = f"{local_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            out = write(f)
+        os.replace(tmp_path, local_path)  # readers never see a half-written object
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return local_path, out
+
+
+def put_bytes(
+    key: str,
+    body: bytes,
+    *,
+    content_type: str,
+    content_encoding: str | None = None,
+) -> dict:
+    """
+    Upload an already serialised object (same S3 settings and local fallback as bronze pages).
+
+    :param key: The S3 key for the object.
+    :param body: The object body.
+    :param content_type: The Content-Type to record.
+    :param content_encoding: The Content-Encoding to record (optional).
+    :return: The S3 put_object response, or a local stub response; both carry sha256_hex.
+    """
+    sha256_hex = hashlib.sha256(body).hexdigest()
+    if not _use_s3():
+        local_path, _ = _write_local(key, lambda f: f.write(body))
+        return {
+            "local_fallback": True,
+            "path": local_path,
+            "sha256_hex": sha256_hex,
+            "reason": "missing bucket or creds",
+        }
+    extra = {"ContentEncoding": content_encoding} if content_encoding else {}
+    resp = s3_client().put_object(
+        Bucket=BRONZE_BUCKET,
+        Key=key,
+        Body=body,
+        ContentType=content_type,
+        ChecksumAlgorithm="SHA256",  # S3 verifies checksum on upload
+        Metadata={"sha256_hex": sha256_hex},
+        ServerSideEncryption="AES256",
+        **extra,
+    )
+    return {**resp, "sha256_hex": sha256_hex}
+
+
 def put_json_gz(key: str, doc: Mapping[str, Any]) -> dict:
     """
     Upload a gzipped JSON document to S3 with local dev fallback.
@@ -87,40 +499,127 @@ def put_json_gz(key: str, doc: Mapping[str, Any]) -> dict:
 
     This enables running the ingest end-to-end locally without exporting AWS credentials yet.
 
+    The document is streamed (see ``write_json_gz``) straight into the destination: a temp
+    file renamed into place locally, or an S3 upload that switches to multipart once the
+    compressed body exceeds BRONZE_S3_PART_SIZE_MB (default 8).
+
     :param key: The S3 key for the object.
     :param doc: The document to upload.
-    :return: The response from the S3 put_object call.
+    :return: The S3 response (or a local stub), plus sha256_hex and size of the gzipped body.
     """
-    body = _to_gz_bytes(doc)
-    sha256_hex = hashlib.sha256(body).hexdigest()
-
-    have_bucket = bool(BRONZE_BUCKET)
-    # Basic heuristic: both access key & secret or a session token OR a profile (skip check).
-    have_creds_env = bool(
-        os.getenv("AWS_ACCESS_KEY_ID") and os.getenv("AWS_SECRET_ACCESS_KEY")
-    ) or os.getenv("AWS_SESSION_TOKEN")
-
-    if not (have_bucket and have_creds_env):
+    if not _use_s3():
         # Local fallback
-        root = os.path.abspath("bronze_local")
-        local_path = os.path.join(root, key)
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        with open(local_path, "wb") as f:
-            f.write(body)
+        local_path, (sha256_hex, size) = _write_local(key, lambda f: write_json_gz(doc, f))
         return {
             "local_fallback": True,
             "path": local_path,
             "sha256_hex": sha256_hex,
+            "size": size,
             "reason": "missing bucket or creds",
         }
 
-    return s3_client().put_object(
-        Bucket=BRONZE_BUCKET,
-        Key=key,
-        Body=body,
-        ContentType="application/json",
-        ContentEncoding="gzip",
-        ChecksumAlgorithm="SHA256",  # S3 verifies checksum on upload
-        Metadata={"sha256_hex": sha256_hex},
-        ServerSideEncryption="AES256",
+    sink = _S3MultipartSink(
+        s3_client(),
+        key,
+        {
+            "ContentType": "application/json",
+            "ContentEncoding": "gzip",
+            "ServerSideEncryption": "AES256",
+        },
+        part_size=int(float(os.getenv("BRONZE_S3_PART_SIZE_MB") or 8) * 1024 * 1024),
     )
+    try:
+        sha256_hex, size = write_json_gz(doc, sink)
+        return {**sink.close(sha256_hex), "sha256_hex": sha256_hex, "size": size}
+    except BaseException:
+        sink.abort()
+        raise
+
+
+class BronzeUploader:
+    """
+    Background bronze uploads so the run can continue while pages are in flight.
+
+    ``submit()`` hands a page to a small thread pool and returns immediately, blocking only
+    once ``max_pending`` uploads are outstanding (bounding the envelopes held in memory).
+    ``flush()`` waits for everything submitted so far and raises if any upload failed, so
+    call it before reporting a run as complete.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int | None = None) -> None:
+        """
+        Initialise the uploader.
+
+        :param max_workers: Concurrent uploads (default: 4).
+        :param max_pending: Max uploads queued or in flight (default: 2 * max_workers).
+        """
+        workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bronze-put")
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * workers)
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, Future]] = []
+        self.uploaded = 0
+
+    def submit(
+        self,
+        key: str,
+        doc: Mapping[str, Any],
+        put: Callable[[str, Mapping[str, Any]], dict] | None = None,
+    ) -> Future:
+        """
+        Queue one document for upload.
+
+        :param key: The S3 key for the object.
+        :param doc: The document to upload (must not be mutated until flushed).
+        :param put: The upload function (default: ``put_json_gz``).
+        :return: A future resolving to the upload response.
+        """
+        self._slots.acquire()
+        try:
+            fut = self._pool.submit(put or put_json_gz, key, doc)
+        except BaseException:
+            self._slots.release()
+            raise
+        fut.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._pending.append((key, fut))
+        return fut
+
+    def flush(self) -> int:
+        """
+        Wait for all submitted uploads.
+
+        :return: The number of uploads completed by this flush.
+        :raises RuntimeError: If any upload failed (chained to the first failure).
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        failed: list[tuple[str, BaseException]] = []
+        for key, fut in pending:
+            exc = fut.exception()
+            if exc is not None:
+                failed.append((key, exc))
+        done = len(pending) - len(failed)
+        self.uploaded += done
+        if failed:
+            keys = [k for k, _ in failed]
+            raise RuntimeError(f"{len(failed)} bronze upload(s) failed: {keys}") from failed[0][1]
+        return done
+
+    def close(self) -> None:
+        """
+        Flush outstanding uploads and stop the worker threads.
+        """
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> BronzeUploader:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._pool.shutdown(wait=True)  # let the original error propagate
@@ -0,0 +1,231 @@
+"""
+Per-run bronze manifests and an index over them.
+
+Each ingest run records every bronze page it wrote (key, size, SHA-256, page number, item
+count, position_ids) and writes one manifest at the end:
+
+    <BRONZE_S3_PREFIX>/manifests/run=<run_id>.json
+
+so replay, audits and targeted reprocessing can go straight to the relevant objects
+instead of listing and downloading bronze pages to find them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from tasman_etl.storage import bronze_s3
+from tasman_etl.storage.bronze_s3 import get_bytes, put_bytes, utc_now_iso
+
+
+@dataclass(frozen=True)
+class PageEntry:
+    """
+    One bronze page as recorded in a run manifest.
+    """
+
+    key: str
+    page: int
+    size: int
+    sha256_hex: str
+    items: int
+    position_ids: tuple[str, ...]
+
+
+def manifest_key(run_id: str) -> str:
+    """
+    Get the manifest key for a run.
+
+    :param run_id: The ID of the run.
+    :return: The S3 key (or local relative path) of the run's manifest.
+    """
+    return f"{bronze_s3.BRONZE_PREFIX}/manifests/run={run_id}.json"
+
+
+def page_entry(key: str, page: int, payload: Mapping[str, Any], put_resp: Mapping) -> PageEntry:
+    """
+    Build a manifest entry from a page's payload and its ``put_json_gz`` response.
+
+    :param key: The bronze key.
+    :param page: The page number.
+    :param payload: The API response payload stored in the page.
+    :param put_resp: The put_json_gz response (carries sha256_hex and size).
+    :return: The manifest entry.
+    """
+    items = (payload.get("SearchResult") or {}).get("SearchResultItems") or []
+    pids = (((it.get("MatchedObjectDescriptor") or {}).get("PositionID")) for it in items)
+    return PageEntry(
+        key=key,
+        page=page,
+        size=int(put_resp.get("size") or 0),
+        sha256_hex=put_resp.get("sha256_hex") or "",
+        items=len(items),
+        position_ids=tuple(p for p in pids if p),
+    )
+
+
+class RunManifest:
+    """
+    Collects page entries for one run (thread-safe, so background uploads can record
+    themselves as they complete) and writes them as the run's manifest.
+    """
+
+    def __init__(self, run_id: str) -> None:
+        """
+        Initialise an empty manifest.
+
+        :param run_id: The ID of the run.
+        """
+        self.run_id = run_id
+        self._lock = threading.Lock()
+        self._pages: list[PageEntry] = []
+
+    def add(self, entry: PageEntry) -> None:
+        """
+        Record one written page.
+
+        :param entry: The page entry.
+        """
+        with self._lock:
+            self._pages.append(entry)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        :return: The manifest document (pages ordered by page number).
+        """
+        with self._lock:
+            pages = sorted(self._pages, key=lambda p: p.page)
+        return {
+            "run_id": self.run_id,
+            "created_at": utc_now_iso(),
+            "pages": [asdict(p) for p in pages],
+            "totals": {
+                "pages": len(pages),
+                "items": sum(p.items for p in pages),
+                "bytes": sum(p.size for p in pages),
+            },
+        }
+
+    def write(self) -> str:
+        """
+        Store the manifest next to the run's bronze pages.
+
+        :return: The manifest key.
+        """
+        key = manifest_key(self.run_id)
+        body = json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False)
+        put_bytes(key, body.encode("utf-8"), content_type="application/json")
+        return key
+
+
+def load_run_manifest(run_id: str) -> list[PageEntry] | None:
+    """
+    Read a run's manifest.
+
+    :param run_id: The ID of the run.
+    :return: The run's pages in page order, or None if the run has no manifest.
+    """
+    body = get_bytes(manifest_key(run_id))
+    if body is None:
+        return None
+    doc = json.loads(body)
+    return [
+        PageEntry(**{**p, "position_ids": tuple(p.get("position_ids") or ())})
+        for p in doc.get("pages") or []
+    ]
+
+
+class BronzeIndex:
+    """
+    In-memory lookup of bronze pages by run and by position_id, built from run manifests.
+
+    Use:
+        index = BronzeIndex.from_runs(["20250903T100000000000"])
+        for page in index.find("ABC-123"):
+            envelope = get_json_gz(page.key)
+    """
+
+    def __init__(self, manifests: Mapping[str, Iterable[PageEntry]] | None = None) -> None:
+        """
+        Initialise the index.
+
+        :param manifests: Pages per run ID (optional; see ``add_run``).
+        """
+        self._by_run: dict[str, dict[int, PageEntry]] = {}
+        self._by_position: dict[str, list[tuple[str, PageEntry]]] = {}
+        for run_id, pages in (manifests or {}).items():
+            self.add_run(run_id, pages)
+
+    @classmethod
+    def from_runs(cls, run_ids: Iterable[str]) -> BronzeIndex:
+        """
+        Build an index from stored manifests (runs without one are skipped).
+
+        :param run_ids: The runs to index.
+        :return: The index.
+        """
+        index = cls()
+        for run_id in run_ids:
+            pages = load_run_manifest(run_id)
+            if pages is not None:
+                index.add_run(run_id, pages)
+        return index
+
+    def add_run(self, run_id: str, pages: Iterable[PageEntry]) -> None:
+        """
+        Add (or replace) one run's pages.
+
+        :param run_id: The ID of the run.
+        :param pages: The run's page entries.
+        """
+        if run_id in self._by_run:
+            for pid in {p for e in self._by_run[run_id].values() for p in e.position_ids}:
+                hits = [h for h in self._by_position[pid] if h[0] != run_id]
+                if hits:
+                    self._by_position[pid] = hits
+                else:
+                    del self._by_position[pid]
+        entries = sorted(pages, key=lambda p: p.page)
+        self._by_run[run_id] = {e.page: e for e in entries}
+        for entry in entries:
+            for pid in entry.position_ids:
+                self._by_position.setdefault(pid, []).append((run_id, entry))
+
+    @property
+    def runs(self) -> list[str]:
+        """
+        :return: The indexed run IDs.
+        """
+        return list(self._by_run)
+
+    def pages(self, run_id: str) -> list[PageEntry]:
+        """
+        Get a run's pages.
+
+        :param run_id: The ID of the run.
+        :return: The run's pages in page order (empty if not indexed).
+        """
+        return list(self._by_run.get(run_id, {}).values())
+
+    def page(self, run_id: str, page: int) -> PageEntry | None:
+        """
+        Get one page of a run.
+
+        :param run_id: The ID of the run.
+        :param page: The page number.
+        :return: The page entry, or None if absent.
+        """
+        return self._by_run.get(run_id, {}).get(page)
+
+    def find(self, position_id: str) -> list[PageEntry]:
+        """
+        Get every indexed page that contains a posting.
+
+        :param position_id: The USAJOBS PositionID.
+        :return: Matching pages, in the order their runs were added.
+        """
+        return [entry for _, entry in self._by_position.get(position_id, ())]
@@ -1,13 +1,17 @@
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from .models import (
+    ApiDetails,
     ApiResponse,
     JobCategoryRecord,
     JobDetailsRecord,
     JobGradeRecord,
     JobLocationRecord,
     JobRecord,
+    item_json,
     normalise_item,
 )
 
@@ -29,6 +33,7 @@ def normalise_page(
     resp: ApiResponse,
     ingest_run_id: str,
     source_event_time: datetime | None,
+    raw_items: list[dict[str, Any]] | None = None,
 ) -> list[Bundle]:
     """
     Convert a parsed API response into normalised bundles (pure transform).
@@ -36,11 +41,21 @@ def normalise_page(
     :param resp: The API response to normalise.
     :param ingest_run_id: The ID of the ingest run.
     :param source_event_time: The source event time.
+    :param raw_items: The page's SearchResultItems as received, carried into raw_json
+        (default: dump each validated item instead).
     :return: A list of normalised bundles.
     """
+    items = resp.SearchResult.SearchResultItems
+    if raw_items is not None and len(raw_items) != len(items):
+        raise RuntimeError(f"raw_items has {len(raw_items)} entries for {len(items)} items")
+    raws: list[dict[str, Any] | None] = (
+        list(raw_items) if raw_items is not None else [None] * len(items)
+    )
     out: list[Bundle] = []
-    for item in resp.SearchResult.SearchResultItems:
-        job, details, locs, cats, grades = normalise_item(item, ingest_run_id, source_event_time)
+    for item, raw in zip(items, raws, strict=True):
+        job, details, locs, cats, grades = normalise_item(
+            item, ingest_run_id, source_event_time, raw
+        )
         out.append(Bundle(job=job, details=details, locations=locs, categories=cats, grades=grades))
     return out
 
@@ -65,128 +80,605 @@ def normalise_page(
 #     return list(bundles)
 
 
-# -------- Row dict mappers (DB loader will consume these) --------
+# -------- Row mappers (loaders bind these tuples positionally) --------
 
+# Column orders of the row tuples built by the mappers below and by the column batches
+# (child tables exclude job_id / the owning item, which the mappers take as an argument).
+JOB_COLUMNS: tuple[str, ...] = (
+    "position_id",
+    "matched_object_id",
+    "position_uri",
+    "position_title",
+    "organization_name",
+    "department_name",
+    "apply_uri",
+    "position_location_display",
+    "pay_min",
+    "pay_max",
+    "pay_rate_interval_code",
+    "qualification_summary",
+    "publication_start_date",
+    "application_close_date",
+    "position_start_date",
+    "position_end_date",
+    "remote_indicator",
+    "telework_eligible",
+    "source_event_time",
+    "ingest_run_id",
+    "raw_json",
+)
+
+DETAILS_COLUMNS: tuple[str, ...] = (
+    "job_summary",
+    "low_grade",
+    "high_grade",
+    "promotion_potential",
+    "organization_codes",
+    "relocation",
+    "hiring_path",
+    "mco_tags",
+    "total_openings",
+    "agency_marketing_statement",
+    "travel_code",
+    "apply_online_url",
+    "detail_status_url",
+    "major_duties",
+    "education",
+    "requirements",
+    "evaluations",
+    "how_to_apply",
+    "what_to_expect_next",
+    "required_documents",
+    "benefits",
+    "benefits_url",
+    "benefits_display_default_text",
+    "other_information",
+    "key_requirements",
+    "within_area",
+    "commute_distance",
+    "service_type",
+    "announcement_closing_type",
+    "agency_contact_email",
+    "security_clearance",
+    "drug_test_required",
+    "position_sensitivity",
+    "adjudication_type",
+    "financial_disclosure",
+    "bargaining_unit_status",
+)
+
+LOCATION_COLUMNS: tuple[str, ...] = (
+    "loc_idx",
+    "location_name",
+    "country_code",
+    "country_sub_division_code",
+    "city_name",
+    "latitude",
+    "longitude",
+)
+
+CATEGORY_COLUMNS: tuple[str, ...] = ("code", "name")
+
+GRADE_COLUMNS: tuple[str, ...] = ("code",)
 
-def as_job_row(j: JobRecord) -> dict:
+
+def as_job_row(j: JobRecord) -> tuple:
     """
-    Map JobRecord to a database row representation.
+    Map JobRecord to a database row (JOB_COLUMNS order).
 
     :param j: The JobRecord to map.
-    :return: A dictionary representing the database row.
-    """
-    return {
-        "position_id": j.position_id,
-        "matched_object_id": j.matched_object_id,
-        "position_uri": j.position_uri,
-        "position_title": j.position_title,
-        "organization_name": j.organization_name,
-        "department_name": j.department_name,
-        "apply_uri": j.apply_uri,  # psycopg3 adapts Python list -> Postgres text[]
-        "position_location_display": j.position_location_display,
-        "pay_min": j.pay_min,
-        "pay_max": j.pay_max,
-        "pay_rate_interval_code": j.pay_rate_interval_code,
-        "qualification_summary": j.qualification_summary,
-        "publication_start_date": j.publication_start_date,
-        "application_close_date": j.application_close_date,
-        "position_start_date": j.position_start_date,
-        "position_end_date": j.position_end_date,
-        "remote_indicator": j.remote_indicator,
-        "telework_eligible": j.telework_eligible,
-        "source_event_time": j.source_event_time,
-        "ingest_run_id": j.ingest_run_id,
-        "raw_json": j.raw_json,
-    }
+    :return: The row tuple.
+    """
+    return (
+        j.position_id,
+        j.matched_object_id,
+        j.position_uri,
+        j.position_title,
+        j.organization_name,
+        j.department_name,
+        j.apply_uri,  # psycopg3 adapts Python list -> Postgres text[]
+        j.position_location_display,
+        j.pay_min,
+        j.pay_max,
+        j.pay_rate_interval_code,
+        j.qualification_summary,
+        j.publication_start_date,
+        j.application_close_date,
+        j.position_start_date,
+        j.position_end_date,
+        j.remote_indicator,
+        j.telework_eligible,
+        j.source_event_time,
+        j.ingest_run_id,
+        j.raw_json,
+    )
 
 
-def as_details_row(jd: JobDetailsRecord) -> dict:
+def as_details_row(jd: JobDetailsRecord) -> tuple:
     """
-    Map JobDetailsRecord to a database row representation.
+    Map JobDetailsRecord to a database row (DETAILS_COLUMNS order, without job_id).
 
     :param jd: The JobDetailsRecord to map.
-    :return: A dictionary representing the database row.
-    """
-    return {
-        "job_summary": jd.job_summary,
-        "low_grade": jd.low_grade,
-        "high_grade": jd.high_grade,
-        "promotion_potential": jd.promotion_potential,
-        "organization_codes": jd.organization_codes,
-        "relocation": jd.relocation,
-        "hiring_path": jd.hiring_path,
-        "mco_tags": jd.mco_tags,
-        "total_openings": jd.total_openings,
-        "agency_marketing_statement": jd.agency_marketing_statement,
-        "travel_code": jd.travel_code,
-        "apply_online_url": jd.apply_online_url,
-        "detail_status_url": jd.detail_status_url,
-        "major_duties": jd.major_duties,
-        "education": jd.education,
-        "requirements": jd.requirements,
-        "evaluations": jd.evaluations,
-        "how_to_apply": jd.how_to_apply,
-        "what_to_expect_next": jd.what_to_expect_next,
-        "required_documents": jd.required_documents,
-        "benefits": jd.benefits,
-        "benefits_url": jd.benefits_url,
-        "benefits_display_default_text": jd.benefits_display_default_text,
-        "other_information": jd.other_information,
-        "key_requirements": jd.key_requirements,
-        "within_area": jd.within_area,
-        "commute_distance": jd.commute_distance,
-        "service_type": jd.service_type,
-        "announcement_closing_type": jd.announcement_closing_type,
-        "agency_contact_email": jd.agency_contact_email,
-        "security_clearance": jd.security_clearance,
-        "drug_test_required": jd.drug_test_required,
-        "position_sensitivity": jd.position_sensitivity,
-        "adjudication_type": jd.adjudication_type,
-        "financial_disclosure": jd.financial_disclosure,
-        "bargaining_unit_status": jd.bargaining_unit_status,
-    }
+    :return: The row tuple.
+    """
+    return (
+        jd.job_summary,
+        jd.low_grade,
+        jd.high_grade,
+        jd.promotion_potential,
+        jd.organization_codes,
+        jd.relocation,
+        jd.hiring_path,
+        jd.mco_tags,
+        jd.total_openings,
+        jd.agency_marketing_statement,
+        jd.travel_code,
+        jd.apply_online_url,
+        jd.detail_status_url,
+        jd.major_duties,
+        jd.education,
+        jd.requirements,
+        jd.evaluations,
+        jd.how_to_apply,
+        jd.what_to_expect_next,
+        jd.required_documents,
+        jd.benefits,
+        jd.benefits_url,
+        jd.benefits_display_default_text,
+        jd.other_information,
+        jd.key_requirements,
+        jd.within_area,
+        jd.commute_distance,
+        jd.service_type,
+        jd.announcement_closing_type,
+        jd.agency_contact_email,
+        jd.security_clearance,
+        jd.drug_test_required,
+        jd.position_sensitivity,
+        jd.adjudication_type,
+        jd.financial_disclosure,
+        jd.bargaining_unit_status,
+    )
 
 
-def as_location_rows(job_id: int, locs: list[JobLocationRecord]) -> list[dict]:
+def as_location_rows(owner: int, locs: list[JobLocationRecord]) -> list[tuple]:
     """
-    Map JobLocationRecord to a database row representation.
+    Map JobLocationRecords to database rows ((owner, *LOCATION_COLUMNS) order).
 
-    :param job_id: The ID of the job.
+    :param owner: The job_id, or the job's index within a batch.
     :param locs: A list of JobLocationRecord instances.
-    :return: A list of dictionaries representing the database rows.
+    :return: The row tuples.
     """
     return [
-        {
-            "job_id": job_id,
-            "loc_idx": x.loc_idx,
-            "location_name": x.location_name,
-            "country_code": x.country_code,
-            "country_sub_division_code": x.country_sub_division_code,
-            "city_name": x.city_name,
-            "latitude": x.latitude,
-            "longitude": x.longitude,
-        }
+        (
+            owner,
+            x.loc_idx,
+            x.location_name,
+            x.country_code,
+            x.country_sub_division_code,
+            x.city_name,
+            x.latitude,
+            x.longitude,
+        )
         for x in locs
     ]
 
 
-def as_category_rows(job_id: int, cats: list[JobCategoryRecord]) -> list[dict]:
+def as_category_rows(owner: int, cats: list[JobCategoryRecord]) -> list[tuple]:
     """
-    Map JobCategoryRecord to a database row representation.
+    Map JobCategoryRecords to database rows ((owner, *CATEGORY_COLUMNS) order).
 
-    :param job_id: The ID of the job.
+    :param owner: The job_id, or the job's index within a batch.
     :param cats: A list of JobCategoryRecord instances.
-    :return: A list of dictionaries representing the database rows.
+    :return: The row tuples.
     """
-    return [{"job_id": job_id, "code": c.code, "name": c.name} for c in cats]
+    return [(owner, c.code, c.name) for c in cats]
 
 
-def as_grade_rows(job_id: int, grades: list[JobGradeRecord]) -> list[dict]:
+def as_grade_rows(owner: int, grades: list[JobGradeRecord]) -> list[tuple]:
     """
-    Map JobGradeRecord to a database row representation.
+    Map JobGradeRecords to database rows ((owner, *GRADE_COLUMNS) order).
 
-    :param job_id: The ID of the job.
+    :param owner: The job_id, or the job's index within a batch.
     :param grades: A list of JobGradeRecord instances.
-    :return: A list of dictionaries representing the database rows.
+    :return: The row tuples.
     """
-    return [{"job_id": job_id, "code": g.code} for g in grades]
+    return [(owner, g.code) for g in grades]
+
+
+# -------- Column-oriented batches (set-based / COPY loaders consume these) --------
+
+# Child tables carry the index of their owning job within the batch
+ITEM_COLUMN = "item"
+
+_NO_DETAILS = ApiDetails()
+
+
+@dataclass(frozen=True)
+class PageRows:
+    """
+    Normalised rows for one or more pages, held column-wise (column name -> values).
+
+    ``job`` and ``details`` hold one row per item (JOB_COLUMNS / DETAILS_COLUMNS); the child
+    tables hold an ``item`` column (index of the owning job) followed by LOCATION_COLUMNS,
+    CATEGORY_COLUMNS or GRADE_COLUMNS. Columns bind as ``unnest`` arrays as they are and
+    ``rows`` yields tuples for COPY / executemany.
+    """
+
+    job: dict[str, list[Any]]
+    details: dict[str, list[Any]]
+    locations: dict[str, list[Any]]
+    categories: dict[str, list[Any]]
+    grades: dict[str, list[Any]]
+
+    def __len__(self) -> int:
+        """
+        :return: The number of jobs in the batch.
+        """
+        return len(self.job["position_id"])
+
+    def rows(self, table: str) -> Iterator[tuple]:
+        """
+        Iterate one table row by row.
+
+        :param table: One of "job", "details", "locations", "categories" or "grades".
+        :return: An iterator of row tuples in column order.
+        """
+        return zip(*getattr(self, table).values(), strict=True)
+
+    def children(self, table: str) -> list[list[tuple]]:
+        """
+        Group a child table's rows by owning job.
+
+        :param table: One of "locations", "categories" or "grades".
+        :return: Per job (in batch order), its rows without the item column.
+        """
+        out: list[list[tuple]] = [[] for _ in range(len(self))]
+        for row in self.rows(table):
+            out[row[0]].append(row[1:])
+        return out
+
+    def take(self, indices: Sequence[int]) -> "PageRows":
+        """
+        Select a subset of jobs (with their details and child rows).
+
+        :param indices: Positions of the jobs to keep, in the order to keep them.
+        :return: A new batch; child ``item`` columns are renumbered to match.
+        """
+        remap = {old: new for new, old in enumerate(indices)}
+
+        def pick(cols: dict[str, list[Any]], keep: Sequence[int]) -> dict[str, list[Any]]:
+            return {c: [v[i] for i in keep] for c, v in cols.items()}
+
+        def children(cols: dict[str, list[Any]]) -> dict[str, list[Any]]:
+            keep = [i for i, item in enumerate(cols[ITEM_COLUMN]) if item in remap]
+            out = pick(cols, keep)
+            out[ITEM_COLUMN] = [remap[item] for item in out[ITEM_COLUMN]]
+            return out
+
+        return PageRows(
+            job=pick(self.job, indices),
+            details=pick(self.details, indices),
+            locations=children(self.locations),
+            categories=children(self.categories),
+            grades=children(self.grades),
+        )
+
+    def bundles(self) -> list[Bundle]:
+        """
+        Materialise the batch as validated DTO bundles (row-by-row loader, GX checks).
+
+        :return: One bundle per job, in batch order.
+        """
+        locs, cats, grades = (self.children(t) for t in ("locations", "categories", "grades"))
+        return [
+            Bundle(
+                job=JobRecord(**dict(zip(JOB_COLUMNS, job, strict=True))),
+                details=JobDetailsRecord(**dict(zip(DETAILS_COLUMNS, details, strict=True))),
+                locations=[
+                    JobLocationRecord(**dict(zip(LOCATION_COLUMNS, x, strict=True)))
+                    for x in locs[i]
+                ],
+                categories=[JobCategoryRecord(code=c[0], name=c[1]) for c in cats[i]],
+                grades=[JobGradeRecord(code=g[0]) for g in grades[i]],
+            )
+            for i, (job, details) in enumerate(
+                zip(self.rows("job"), self.rows("details"), strict=True)
+            )
+        ]
+
+
+def _columns(cols: Iterable[str], rows: list[tuple]) -> dict[str, list[Any]]:
+    """
+    Transpose row tuples into a column dict.
+
+    :param cols: The column names, in row order.
+    :param rows: The row tuples.
+    :return: Column name -> list of values.
+    """
+    names = tuple(cols)
+    if not rows:
+        return {c: [] for c in names}
+    return dict(zip(names, map(list, zip(*rows, strict=True)), strict=True))
+
+
+def page_rows_from_bundles(bundles: Sequence[Bundle]) -> PageRows:
+    """
+    Convert DTO bundles into a column-oriented batch.
+
+    :param bundles: The normalised bundles.
+    :return: The batch, jobs in bundle order.
+    """
+    return PageRows(
+        job=_columns(JOB_COLUMNS, [as_job_row(b.job) for b in bundles]),
+        details=_columns(DETAILS_COLUMNS, [as_details_row(b.details) for b in bundles]),
+        locations=_columns(
+            (ITEM_COLUMN, *LOCATION_COLUMNS),
+            [r for i, b in enumerate(bundles) for r in as_location_rows(i, b.locations)],
+        ),
+        categories=_columns(
+            (ITEM_COLUMN, *CATEGORY_COLUMNS),
+            [r for i, b in enumerate(bundles) for r in as_category_rows(i, b.categories)],
+        ),
+        grades=_columns(
+            (ITEM_COLUMN, *GRADE_COLUMNS),
+            [r for i, b in enumerate(bundles) for r in as_grade_rows(i, b.grades)],
+        ),
+    )
+
+
+# raw_json sources (RAW_JSON_MODE): the item as received, the item without what silver
+# already stores (the default), or a dump of the validated model. The received item is
+# stored without its search-specific keys (see ``posting_item``).
+RAW_JSON_MODES: tuple[str, ...] = ("verbatim", "trimmed", "model")
+
+# Parts of an item that the silver tables hold in full: the child arrays and every Details
+# key ApiDetails maps to a column (including the historic PositionSensitivitiy spelling)
+_STORED_DESCRIPTOR_KEYS = frozenset({"PositionLocation", "JobCategory", "JobGrade"})
+_STORED_DETAILS_KEYS = frozenset({*ApiDetails.model_fields, "PositionSensitivitiy"})
+
+
+def trim_item(raw_item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Project an item as received down to what the silver tables do not already store.
+
+    The bronze page keeps the full item; this only shrinks ``job.raw_json``.
+
+    :param raw_item: The item as received.
+    :return: A copy without PositionLocation, JobCategory, JobGrade and the mapped
+        UserArea.Details keys (unmapped keys are kept verbatim).
+    """
+    desc = raw_item.get("MatchedObjectDescriptor")
+    if not isinstance(desc, dict):
+        return raw_item
+    out = {k: v for k, v in desc.items() if k not in _STORED_DESCRIPTOR_KEYS}
+    user_area = desc.get("UserArea")
+    if isinstance(user_area, dict) and isinstance(user_area.get("Details"), dict):
+        details = user_area["Details"]
+        out["UserArea"] = {
+            **user_area,
+            "Details": {k: v for k, v in details.items() if k not in _STORED_DETAILS_KEYS},
+        }
+    return {**raw_item, "MatchedObjectDescriptor": out}
+
+
+# Item keys that describe the search rather than the posting: RelevanceRank moves between
+# runs and MatchedObjectId is already stored as job.matched_object_id
+_SEARCH_ITEM_KEYS = frozenset({"RelevanceRank", "MatchedObjectId"})
+
+# Descriptor keys whose values the job columns already hold
+_JOB_DESCRIPTOR_KEYS = frozenset(
+    {
+        "PositionID",
+        "PositionTitle",
+        "PositionURI",
+        "ApplyURI",
+        "PositionLocationDisplay",
+        "OrganizationName",
+        "DepartmentName",
+        "QualificationSummary",
+        "PublicationStartDate",
+        "ApplicationCloseDate",
+        "PositionStartDate",
+        "PositionEndDate",
+    }
+)
+
+
+def posting_item(raw_item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Drop the keys that describe the search rather than the posting from an item.
+
+    RelevanceRank moves between runs, so storing it would make an unchanged posting's
+    raw_json differ on every load.
+
+    :param raw_item: The item as received.
+    :return: A shallow copy without RelevanceRank and MatchedObjectId.
+    """
+    return {k: v for k, v in raw_item.items() if k not in _SEARCH_ITEM_KEYS}
+
+
+def content_item(raw_json: Any) -> Any:
+    """
+    Project a raw_json value down to the posting content no silver column holds.
+
+    Change detection hashes this next to the normalised rows: search-specific item keys
+    and everything the columns already carry are left out, so a new relevance rank is not
+    a change and the projection is the same for the verbatim and trimmed RAW_JSON_MODEs.
+
+    :param raw_json: The job's raw_json value.
+    :return: The projection (non-dict values are returned as they are).
+    """
+    if not isinstance(raw_json, dict):
+        return raw_json
+    item = posting_item(trim_item(raw_json))
+    desc = item.get("MatchedObjectDescriptor")
+    if isinstance(desc, dict):
+        item["MatchedObjectDescriptor"] = {
+            k: v for k, v in desc.items() if k not in _JOB_DESCRIPTOR_KEYS
+        }
+    return item
+
+
+def raw_json_items(
+    raw_items: list[dict[str, Any]], mode: str = "trimmed"
+) -> list[dict[str, Any]] | None:
+    """
+    Pick what each item stores as raw_json.
+
+    ``verbatim`` and ``trimmed`` items leave out the search-specific keys (see
+    ``posting_item``), so re-fetching a posting at another rank stores the same document.
+
+    :param raw_items: The page's SearchResultItems as received.
+    :param mode: One of RAW_JSON_MODES.
+    :return: The raw_items argument for the normalisers (None dumps the validated models).
+    :raises RuntimeError: If the mode is unknown.
+    """
+    if mode == "verbatim":
+        return [posting_item(it) for it in raw_items]
+    if mode == "trimmed":
+        return [posting_item(trim_item(it)) for it in raw_items]
+    if mode == "model":
+        return None
+    raise RuntimeError(f"invalid RAW_JSON_MODE {mode!r}; expected one of {RAW_JSON_MODES}")
+
+
+def normalise_page_rows(
+    resp: ApiResponse,
+    ingest_run_id: str,
+    source_event_time: datetime | None,
+    raw_items: list[dict[str, Any]] | None = None,
+    *,
+    strict: bool = False,
+) -> PageRows:
+    """
+    Normalise a parsed API response straight into column-oriented batches (one pass).
+
+    The API models have already validated and coerced every field, so the default path
+    reads them directly instead of building JobRecord / JobDetailsRecord /
+    JobLocationRecord per item (~650 locations per posting dominate the page cost). The
+    JobRecord rules (apply_uri as a list, pay_min <= pay_max) are applied here;
+    ``strict=True`` goes through ``normalise_page`` and the DTOs instead.
+
+    :param resp: The API response to normalise.
+    :param ingest_run_id: The ID of the ingest run.
+    :param source_event_time: The source event time.
+    :param raw_items: The page's SearchResultItems as received, carried into raw_json
+        (default: dump each validated item instead).
+    :param strict: Validate every row through the pydantic DTOs (default: False).
+    :return: The page's rows.
+    """
+    if strict:
+        return page_rows_from_bundles(
+            normalise_page(resp, ingest_run_id, source_event_time, raw_items)
+        )
+
+    items = resp.SearchResult.SearchResultItems
+    if raw_items is not None and len(raw_items) != len(items):
+        raise RuntimeError(f"raw_items has {len(raw_items)} entries for {len(items)} items")
+
+    jobs: list[tuple] = []
+    details: list[tuple] = []
+    locs: list[tuple] = []
+    cats: list[tuple] = []
+    grades: list[tuple] = []
+    for i, item in enumerate(items):
+        d = item.MatchedObjectDescriptor
+        det = d.details or _NO_DETAILS
+
+        pay_min = pay_max = pay_code = None
+        if d.PositionRemuneration:
+            pr = d.PositionRemuneration[0]
+            pay_min, pay_max, pay_code = pr.MinimumRange, pr.MaximumRange, pr.RateIntervalCode
+        if pay_min is not None and pay_max is not None and pay_min > pay_max:
+            # same rule (and ValueError family) as JobRecord's validator
+            raise ValueError(f"pay_min cannot exceed pay_max (PositionID {d.PositionID})")
+
+        jobs.append(
+            (
+                d.PositionID,
+                item.MatchedObjectId,
+                d.PositionURI,
+                d.PositionTitle,
+                d.OrganizationName,
+                d.DepartmentName,
+                list(d.ApplyURI or []),
+                d.PositionLocationDisplay,
+                pay_min,
+                pay_max,
+                pay_code,
+                d.QualificationSummary,
+                d.PublicationStartDate,
+                d.ApplicationCloseDate,
+                d.PositionStartDate,
+                d.PositionEndDate,
+                det.RemoteIndicator,
+                det.TeleworkEligible,
+                source_event_time,
+                ingest_run_id,
+                raw_items[i] if raw_items is not None else item_json(item),
+            )
+        )
+        details.append(
+            (
+                det.JobSummary,
+                det.LowGrade,
+                det.HighGrade,
+                det.PromotionPotential,
+                det.OrganizationCodes,
+                det.Relocation,
+                list(det.HiringPath or []),
+                list(det.MCOTags or []),
+                det.TotalOpenings,
+                det.AgencyMarketingStatement,
+                det.TravelCode,
+                det.ApplyOnlineUrl,
+                det.DetailStatusUrl,
+                "; ".join(det.MajorDuties) if det.MajorDuties else None,
+                det.Education,
+                det.Requirements,
+                det.Evaluations,
+                det.HowToApply,
+                det.WhatToExpectNext,
+                det.RequiredDocuments,
+                det.Benefits,
+                det.BenefitsUrl,
+                det.BenefitsDisplayDefaultText,
+                det.OtherInformation,
+                list(det.KeyRequirements or []),
+                det.WithinArea,
+                det.CommuteDistance,
+                det.ServiceType,
+                det.AnnouncementClosingType,
+                det.AgencyContactEmail,
+                det.SecurityClearance,
+                det.DrugTestRequired,
+                det.PositionSensitivity,
+                list(det.AdjudicationType or []),
+                det.FinancialDisclosure,
+                det.BargainingUnitStatus,
+            )
+        )
+        locs.extend(
+            (
+                i,
+                k,
+                pl.LocationName,
+                pl.CountryCode,
+                pl.CountrySubDivisionCode,
+                pl.CityName,
+                pl.Latitude,
+                pl.Longitude,
+            )
+            for k, pl in enumerate(d.PositionLocation or ())
+        )
+        cats.extend((i, c.Code, c.Name) for c in d.JobCategory or ())
+        grades.extend((i, g.Code) for g in d.JobGrade or ())
+
+    return PageRows(
+        job=_columns(JOB_COLUMNS, jobs),
+        details=_columns(DETAILS_COLUMNS, details),
+        locations=_columns((ITEM_COLUMN, *LOCATION_COLUMNS), locs),
+        categories=_columns((ITEM_COLUMN, *CATEGORY_COLUMNS), cats),
+        grades=_columns((ITEM_COLUMN, *GRADE_COLUMNS), grades),
+    )
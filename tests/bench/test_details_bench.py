@@ -0,0 +1,171 @@
+"""Details memoisation benchmark over recorded bronze pages.
+
+Skipped unless BENCH=1 (``make bench``). Parses every page under ./bronze_local with the
+previous descriptor (``details`` re-validates UserArea.Details on every access) and the
+current one (validated once per descriptor and cached), and checks both give the same DTO
+rows. The saving is asserted on ``ApiDetails.model_validate`` calls per page, which is
+deterministic, for the Details work of ``normalise_item`` when raw_json falls back to a
+dump (read for the DTO fields, then the whole-item dump: previously re-validating and
+re-serialising ``details``, now ``item_json``). The timings of that work and of end-to-end
+parse + normalise are only logged: run to run they are within noise, as the ~650
+locations per posting dominate the page cost.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import computed_field
+
+from tasman_etl.models import (
+    ApiDetails,
+    ApiMatchedObjectDescriptor,
+    ApiResponse,
+    ApiSearchResult,
+    ApiSearchResultItem,
+    item_json,
+    normalise_item,
+)
+
+pytestmark = pytest.mark.skipif(os.getenv("BENCH") != "1", reason="set BENCH=1 to run")
+
+REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+ROOT = Path(__file__).resolve().parents[2] / "bronze_local"
+
+
+class _LegacyDescriptor(ApiMatchedObjectDescriptor):
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def details(self) -> ApiDetails | None:  # type: ignore[override]
+        if not self.UserArea:
+            return None
+        d = self.UserArea.get("Details")
+        return ApiDetails.model_validate(d) if isinstance(d, dict) else None
+
+
+class _LegacyItem(ApiSearchResultItem):
+    MatchedObjectDescriptor: _LegacyDescriptor
+
+
+class _LegacyResult(ApiSearchResult):
+    SearchResultItems: list[_LegacyItem]  # type: ignore[assignment]
+
+
+class _LegacyResponse(ApiResponse):
+    SearchResult: _LegacyResult
+
+
+def _recorded_payloads() -> list[dict]:
+    payloads = []
+    for path in sorted(ROOT.rglob("page=*.json.gz")):
+        envelope = json.loads(gzip.decompress(path.read_bytes()))
+        payload = (envelope.get("response") or {}).get("payload") or {}
+        if (payload.get("SearchResult") or {}).get("SearchResultItems"):
+            payloads.append(payload)
+    return payloads
+
+
+def _normalise(model: type[ApiResponse], payload: dict) -> list[tuple]:
+    resp = model.model_validate(payload)
+    return [normalise_item(it, "bench", None) for it in resp.SearchResult.SearchResultItems]
+
+
+def _details_path(items: list[ApiSearchResultItem], *, legacy: bool) -> None:
+    # What normalise_item does with Details: read it for the DTOs, then dump raw_json
+    for it in items:
+        _ = it.MatchedObjectDescriptor.details
+        if legacy:  # the dump re-validated and re-serialised the computed field
+            it.model_dump(mode="json")
+        else:
+            item_json(it)
+
+
+def _best_ms(model: type[ApiResponse], payloads: list[dict], *, details_only: bool) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        # Fresh models every round (validation untimed when isolating the details path)
+        resps = [model.model_validate(p) for p in payloads] if details_only else []
+        t0 = time.perf_counter()
+        if details_only:
+            for resp in resps:
+                items = list(resp.SearchResult.SearchResultItems)
+                _details_path(items, legacy=model is _LegacyResponse)
+        else:
+            for payload in payloads:
+                _normalise(model, payload)
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def _validations_per_page(
+    monkeypatch: pytest.MonkeyPatch, model: type[ApiResponse], payloads: list[dict]
+) -> list[int]:
+    calls: list[int] = []
+    original = ApiDetails.model_validate.__func__  # type: ignore[attr-defined]
+
+    def _counting(cls, obj, *args, **kwargs):
+        calls[-1] += 1
+        return original(cls, obj, *args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(ApiDetails, "model_validate", classmethod(_counting))
+        for payload in payloads:
+            calls.append(0)
+            items = list(model.model_validate(payload).SearchResult.SearchResultItems)
+            _details_path(items, legacy=model is _LegacyResponse)
+    return calls
+
+
+def test_bench_details_memoised_per_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    payloads = _recorded_payloads()
+    if not payloads:
+        pytest.skip("no recorded bronze pages under ./bronze_local")
+    items = sum(len(p["SearchResult"]["SearchResultItems"]) for p in payloads)
+    with_details = [
+        sum(
+            isinstance((it["MatchedObjectDescriptor"].get("UserArea") or {}).get("Details"), dict)
+            for it in p["SearchResult"]["SearchResultItems"]
+        )
+        for p in payloads
+    ]
+
+    for payload in payloads:
+        old, new = _normalise(_LegacyResponse, payload), _normalise(ApiResponse, payload)
+        assert [j.model_dump(exclude={"raw_json"}) for j, *_ in old] == [
+            j.model_dump(exclude={"raw_json"}) for j, *_ in new
+        ]
+        assert [d for _, d, *_ in old] == [d for _, d, *_ in new]
+
+    # Deterministic: one validation per item with Details; previously the DTO read and the
+    # raw_json dump of the computed field validated it once each
+    legacy_calls = _validations_per_page(monkeypatch, _LegacyResponse, payloads)
+    cached_calls = _validations_per_page(monkeypatch, ApiResponse, payloads)
+    assert cached_calls == with_details
+    assert legacy_calls == [2 * n for n in with_details]
+
+    legacy_ms = _best_ms(_LegacyResponse, payloads, details_only=True)
+    cached_ms = _best_ms(ApiResponse, payloads, details_only=True)
+    legacy_e2e = _best_ms(_LegacyResponse, payloads, details_only=False)
+    cached_e2e = _best_ms(ApiResponse, payloads, details_only=False)
+
+    log = logging.getLogger("dq.smoke")
+    log.info(
+        "details %d pages / %d items: ApiDetails validations %d -> %d | per-access %.4f "
+        "ms/item | cached %.4f ms/item | x%.2f (parse+normalise end to end: %.3f -> %.3f "
+        "ms/item)",
+        len(payloads),
+        items,
+        sum(legacy_calls),
+        sum(cached_calls),
+        legacy_ms / items,
+        cached_ms / items,
+        legacy_ms / cached_ms,
+        legacy_e2e / items,
+        cached_e2e / items,
+    )
@@ -0,0 +1,79 @@
+"""Normalisation microbenchmark: per-field DTOs vs column batches over recorded pages.
+
+Skipped unless BENCH=1 (``make bench``). Validates every page under ./bronze_local once
+(shared by both paths), then times the strict path (JobRecord / JobDetailsRecord /
+JobLocationRecord per item, then columns) against the batch engine that reads the
+validated API models straight into columns, checks both give the same rows, and logs the
+per-item cost of each.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tasman_etl.models import ApiResponse
+from tasman_etl.transform import normalise_page_rows
+
+pytestmark = pytest.mark.skipif(os.getenv("BENCH") != "1", reason="set BENCH=1 to run")
+
+REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+ROOT = Path(__file__).resolve().parents[2] / "bronze_local"
+
+
+def _recorded_pages() -> list[tuple[ApiResponse, list[dict]]]:
+    pages = []
+    for path in sorted(ROOT.rglob("page=*.json.gz")):
+        envelope = json.loads(gzip.decompress(path.read_bytes()))
+        payload = (envelope.get("response") or {}).get("payload") or {}
+        items = (payload.get("SearchResult") or {}).get("SearchResultItems")
+        if items:
+            pages.append((ApiResponse.model_validate(payload), items))
+    return pages
+
+
+def _best_ms(pages: list[tuple[ApiResponse, list[dict]]], *, strict: bool) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        for resp, raw_items in pages:
+            normalise_page_rows(resp, "bench", None, raw_items, strict=strict)
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def test_bench_normalise_per_item() -> None:
+    pages = _recorded_pages()
+    if not pages:
+        pytest.skip("no recorded bronze pages under ./bronze_local")
+    items = sum(len(raw) for _, raw in pages)
+
+    for resp, raw_items in pages:
+        assert normalise_page_rows(resp, "bench", None, raw_items) == normalise_page_rows(
+            resp, "bench", None, raw_items, strict=True
+        )
+    locations = sum(
+        len(normalise_page_rows(r, "bench", None, raw).locations["loc_idx"]) for r, raw in pages
+    )
+
+    strict_ms = _best_ms(pages, strict=True)
+    batch_ms = _best_ms(pages, strict=False)
+
+    log = logging.getLogger("dq.smoke")
+    log.info(
+        "normalise %d pages / %d items / %d locations: DTO %.3f ms/item | batch %.3f ms/item "
+        "| speed-up x%.2f",
+        len(pages),
+        items,
+        locations,
+        strict_ms / items,
+        batch_ms / items,
+        strict_ms / batch_ms,
+    )
+    assert batch_ms < strict_ms
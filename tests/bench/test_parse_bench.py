@@ -0,0 +1,92 @@
+"""Parse + normalise benchmark over recorded bronze pages.
+
+Skipped unless BENCH=1 (``make bench``). Replays the payload bytes of every page under
+./bronze_local through the previous path (stdlib ``json`` as in ``resp.json()``, then
+``model_dump`` per item for raw_json) and the current one (pydantic-core ``from_json``,
+raw item carried into raw_json), checks both produce the same normalised rows, and logs
+the per-item cost of each.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pydantic_core import from_json
+
+from tasman_etl.models import ApiResponse
+from tasman_etl.transform import as_details_row, normalise_page
+
+pytestmark = pytest.mark.skipif(os.getenv("BENCH") != "1", reason="set BENCH=1 to run")
+
+REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+ROOT = Path(__file__).resolve().parents[2] / "bronze_local"
+
+
+def _recorded_bodies() -> list[bytes]:
+    bodies = []
+    for path in sorted(ROOT.rglob("page=*.json.gz")):
+        envelope = json.loads(gzip.decompress(path.read_bytes()))
+        payload = (envelope.get("response") or {}).get("payload") or {}
+        if (payload.get("SearchResult") or {}).get("SearchResultItems"):
+            bodies.append(json.dumps(payload).encode("utf-8"))  # as received on the wire
+    return bodies
+
+
+def _legacy(body: bytes) -> list:
+    payload = json.loads(body.decode("utf-8"))
+    return normalise_page(ApiResponse.model_validate(payload), "bench", None)
+
+
+def _current(body: bytes) -> list:
+    payload = from_json(body)
+    return normalise_page(
+        ApiResponse.model_validate(payload),
+        "bench",
+        None,
+        raw_items=payload["SearchResult"]["SearchResultItems"],
+    )
+
+
+def _best_ms(fn, bodies: list[bytes]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        for body in bodies:
+            fn(body)
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def test_bench_parse_normalise_per_item() -> None:
+    bodies = _recorded_bodies()
+    if not bodies:
+        pytest.skip("no recorded bronze pages under ./bronze_local")
+    items = sum(len(from_json(b)["SearchResult"]["SearchResultItems"]) for b in bodies)
+
+    for body in bodies:  # same normalised rows either way; only raw_json's source differs
+        old, new = _legacy(body), _current(body)
+        assert [b.job.model_dump(exclude={"raw_json"}) for b in old] == [
+            b.job.model_dump(exclude={"raw_json"}) for b in new
+        ]
+        assert [as_details_row(b.details) for b in old] == [as_details_row(b.details) for b in new]
+
+    legacy_ms = _best_ms(_legacy, bodies)
+    current_ms = _best_ms(_current, bodies)
+
+    log = logging.getLogger("dq.smoke")
+    log.info(
+        "parse+normalise %d pages / %d items: legacy %.3f ms/item | current %.3f ms/item "
+        "| speed-up x%.2f",
+        len(bodies),
+        items,
+        legacy_ms / items,
+        current_ms / items,
+        legacy_ms / current_ms,
+    )
+    assert current_ms < legacy_ms
@@ -0,0 +1,72 @@
+"""Validation engine benchmark: native vectorised checks vs Great Expectations.
+
+Skipped unless BENCH=1 (``make bench``). Validates the same pages with both engines,
+checks they agree rule-for-rule, and logs per-page latency and the speed-up.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+import pytest
+
+from tasman_etl.dq.gx.validate import validate_page_jobs as validate_gx
+from tasman_etl.dq.native import validate_page_jobs_native
+from tasman_etl.models import JobLocationRecord, JobRecord
+
+pytestmark = pytest.mark.skipif(os.getenv("BENCH") != "1", reason="set BENCH=1 to run")
+
+REPEAT = int(os.getenv("BENCH_REPEAT", "5"))
+
+
+def _page(n: int) -> tuple[list[JobRecord], list[JobLocationRecord]]:
+    jobs = [
+        JobRecord(
+            position_id=f"BENCH-{i}",
+            position_title="Data Engineer",
+            position_uri=f"https://example.com/job/{i}",
+            apply_uri=[f"https://apply.example.com/{i}", f"https://alt.example.com/{i}"],
+            pay_min=90_000 + i,
+            pay_max=None if i % 7 == 0 else 120_000 + i,
+            raw_json={"PositionID": f"BENCH-{i}"},
+        )
+        for i in range(n)
+    ]
+    locs = [JobLocationRecord(loc_idx=0, city_name="Chicago") for _ in range(n)]
+    return jobs, locs
+
+
+def _best_ms(fn, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+@pytest.mark.parametrize("n", [25, 500, 5000])
+def test_bench_validate_engines(n: int) -> None:
+    jobs, locs = _page(n)
+    validate_gx(jobs, locs)  # warm the cached GX context so setup is not counted
+
+    native = validate_page_jobs_native(jobs, locs)
+    gx = validate_gx(jobs, locs)
+    assert sorted((r.name, r.success) for r in native.rules) == sorted(
+        (r.name, r.success) for r in gx.rules
+    )
+
+    native_ms = _best_ms(validate_page_jobs_native, jobs, locs)
+    gx_ms = _best_ms(validate_gx, jobs, locs)
+
+    log = logging.getLogger("dq.smoke")
+    log.info(
+        "validate n=%d: native %.2f ms | gx %.1f ms | speed-up x%.0f",
+        n,
+        native_ms,
+        gx_ms,
+        gx_ms / native_ms,
+    )
+    assert native_ms < gx_ms
@@ -91,3 +91,182 @@ def test_utc_now_iso_format(bronze_env):
     from datetime import datetime
 
     datetime.strptime(prefix, "%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _one_shot_gz(doc) -> bytes:
+    """The pre-streaming serialiser: whole JSON text, then a single gzip write."""
+    import io
+
+    raw = json.dumps(doc, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+        gz.write(raw)
+    return buf.getvalue()
+
+
+def _envelope(n_items: int) -> dict:
+    items = [
+        {"MatchedObjectId": str(i), "Descriptor": {"PositionTitle": f"Analyst ✓ {i}" * 20}}
+        for i in range(n_items)
+    ]
+    return {
+        "request": {"params": {"Keyword": "data"}},
+        "response": {
+            "status": 200,
+            "payload": {"SearchResult": {"SearchResultItems": items, "Count": n_items}},
+        },
+        "ingest": {"run_id": "R1", "page": 1},
+    }
+
+
+def test_streaming_writer_is_byte_identical(bronze_env):
+    import io
+
+    for doc in (_envelope(300), {"a": [[], {}], "b": None}, {"x": 1.5, "y": [True, "é"]}):
+        buf = io.BytesIO()
+        sha, size = bronze_env.write_json_gz(doc, buf)
+        body = buf.getvalue()
+        assert body == _one_shot_gz(doc)
+        assert sha == hashlib.sha256(body).hexdigest()
+        assert size == len(body)
+
+
+def test_put_json_gz_local_streams_to_file(monkeypatch, tmp_path, bronze_env):
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
+    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    monkeypatch.setattr(bronze_env, "LOCAL_ROOT", str(tmp_path))
+    doc = _envelope(5)
+    key = bronze_env.bronze_key("RUNID", 1, date=dt.date(2024, 5, 6))
+    resp = bronze_env.put_json_gz(key, doc)
+    body = (tmp_path / key).read_bytes()
+    assert body == _one_shot_gz(doc)
+    assert resp["sha256_hex"] == hashlib.sha256(body).hexdigest()
+    assert not (tmp_path / f"{key}.tmp").exists()
+
+
+def test_put_json_gz_multipart_for_large_bodies(monkeypatch, bronze_env):
+    calls: list[tuple[str, dict]] = []
+    parts: dict[int, bytes] = {}
+
+    class FakeS3:
+        def create_multipart_upload(self, **kwargs):
+            calls.append(("create", kwargs))
+            return {"UploadId": "up-1"}
+
+        def upload_part(self, **kwargs):
+            calls.append(("part", kwargs))
+            parts[kwargs["PartNumber"]] = kwargs["Body"]
+            return {"ETag": f'"e{kwargs["PartNumber"]}"', "ChecksumSHA256": "c"}
+
+        def complete_multipart_upload(self, **kwargs):
+            calls.append(("complete", kwargs))
+            return {"ETag": '"multi"'}
+
+    monkeypatch.setattr(bronze_env, "s3_client", lambda: FakeS3())
+    monkeypatch.setattr(bronze_env, "_MIN_PART_SIZE", 1024)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "dummy")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "dummy")
+    monkeypatch.setenv("BRONZE_S3_PART_SIZE_MB", "0.001")  # ~1 KiB parts
+
+    doc = _envelope(300)
+    resp = bronze_env.put_json_gz("k.json.gz", doc)
+    assert resp["ETag"] == '"multi"'
+
+    body = b"".join(parts[n] for n in sorted(parts))
+    assert body == _one_shot_gz(doc)
+    assert len(parts) > 2
+    assert all(len(parts[n]) == 1048 for n in sorted(parts)[:-1])
+
+    assert resp["sha256_hex"] == hashlib.sha256(body).hexdigest()
+
+    # One request per part plus create/complete: no copy just to attach metadata
+    kinds = [k for k, _ in calls]
+    assert kinds == ["create", *["part"] * len(parts), "complete"]
+    assert calls[0][1]["ContentEncoding"] == "gzip"
+    assert calls[0][1]["ChecksumAlgorithm"] == "SHA256"
+    complete = calls[-1][1]
+    assert [p["PartNumber"] for p in complete["MultipartUpload"]["Parts"]] == sorted(parts)
+
+
+def test_put_json_gz_aborts_multipart_on_error(monkeypatch, bronze_env):
+    aborted = []
+
+    class FakeS3:
+        def create_multipart_upload(self, **kwargs):
+            return {"UploadId": "up-1"}
+
+        def upload_part(self, **kwargs):
+            if kwargs["PartNumber"] == 2:
+                raise RuntimeError("boom")
+            return {"ETag": '"e"', "ChecksumSHA256": "c"}
+
+        def abort_multipart_upload(self, **kwargs):
+            aborted.append(kwargs["UploadId"])
+
+    monkeypatch.setattr(bronze_env, "s3_client", lambda: FakeS3())
+    monkeypatch.setattr(bronze_env, "_MIN_PART_SIZE", 1024)
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "dummy")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "dummy")
+    monkeypatch.setenv("BRONZE_S3_PART_SIZE_MB", "0.001")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        bronze_env.put_json_gz("k.json.gz", _envelope(300))
+    assert aborted == ["up-1"]
+
+
+def test_s3_client_is_created_once(monkeypatch, bronze_env):
+    created = []
+
+    def _fake_client(service, config=None):
+        created.append(config)
+        return object()
+
+    monkeypatch.setattr(bronze_env.boto3, "client", _fake_client)
+    monkeypatch.setattr(bronze_env, "_CLIENT", None)
+    monkeypatch.setenv("BRONZE_S3_MAX_POOL_CONNECTIONS", "32")
+    first = bronze_env.s3_client()
+    assert bronze_env.s3_client() is first
+    assert len(created) == 1
+    assert created[0].max_pool_connections == 32
+
+
+def test_uploader_runs_uploads_concurrently(bronze_env):
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "keys": []}
+
+    def _put(key, doc):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+            state["keys"].append(key)
+        return {"ok": True}
+
+    with bronze_env.BronzeUploader(max_workers=3) as up:
+        futures = [up.submit(f"k{i}", {"i": i}, _put) for i in range(6)]
+        assert up.flush() == 6
+    assert all(f.result() == {"ok": True} for f in futures)
+    assert sorted(state["keys"]) == [f"k{i}" for i in range(6)]
+    assert state["peak"] > 1
+    assert up.uploaded == 6
+
+
+def test_uploader_flush_surfaces_failures(bronze_env):
+    def _put(key, doc):
+        if key == "bad":
+            raise OSError("connection reset")
+        return {}
+
+    up = bronze_env.BronzeUploader(max_workers=2)
+    for key in ("a", "bad", "b"):
+        up.submit(key, {}, _put)
+    with pytest.raises(RuntimeError, match=r"1 bronze upload\(s\) failed: \['bad'\]") as ei:
+        up.close()
+    assert isinstance(ei.value.__cause__, OSError)
+    assert up.uploaded == 2
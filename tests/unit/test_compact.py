@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+
+import pytest
+
+import tasman_etl.storage.bronze_s3 as bronze_s3
+from tasman_etl.runner import compact as compact_mod
+
+DAY = dt.date(2025, 9, 3)
+
+
+def _item(pid: str, published: str) -> dict:
+    return {
+        "MatchedObjectId": f"M-{pid}",
+        "MatchedObjectDescriptor": {
+            "PositionID": pid,
+            "PositionTitle": "Data Engineer ✓",
+            "PublicationStartDate": published,
+        },
+    }
+
+
+@pytest.fixture()
+def local_bronze(monkeypatch, tmp_path):
+    """Write bronze pages to tmp_path/bronze_local (no bucket -> local fallback)."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bronze_s3, "BRONZE_BUCKET", None)
+    monkeypatch.setattr(bronze_s3, "BRONZE_PREFIX", "bronze/usajobs")
+    monkeypatch.setattr(compact_mod, "COMPACT_PREFIX", "compact/usajobs")
+
+    def write(run_id: str, page: int, items: list[dict], day: dt.date = DAY) -> str:
+        key = bronze_s3.bronze_key(run_id, page, date=day)
+        bronze_s3.put_json_gz(
+            key,
+            {
+                "request": {"params": {"Page": page}},
+                "response": {
+                    "status": 200,
+                    "received_at": "2025-09-03T10:00:00.000000Z",
+                    "payload": {"SearchResult": {"SearchResultItems": items}},
+                },
+                "ingest": {"ingest_run_id": run_id},
+            },
+        )
+        return key
+
+    return tmp_path, write
+
+
+def _read_local(root, key: str) -> bytes:
+    return (root / "bronze_local" / key).read_bytes()
+
+
+def test_compact_day_ndjson_parts_and_manifest(local_bronze):
+    root, write = local_bronze
+    write("r1", 1, [_item("P3", "2025-09-01T00:00:00"), _item("P1", "2025-08-30T00:00:00")])
+    write("r1", 2, [_item("P5", "2025-09-02T00:00:00")])
+    write("r2", 1, [_item("P2", "2025-09-03T00:00:00"), _item("P4", "2025-08-31T00:00:00")])
+    write("r1", 1, [_item("P9", "2025-09-04T00:00:00")], day=DAY + dt.timedelta(days=1))
+
+    cfg = compact_mod.CompactConfig(start=DAY, end=DAY, fmt="ndjson", rows_per_part=3)
+    manifest = compact_mod.compact_day(DAY, cfg)
+
+    assert manifest["source_pages"] == 3 and manifest["rows"] == 5
+    assert [p["rows"] for p in manifest["parts"]] == [3, 2]
+    stored = json.loads(_read_local(root, "compact/usajobs/date=2025/09/03/manifest.json"))
+    assert stored == manifest
+
+    rows = []
+    for part in manifest["parts"]:
+        body = _read_local(root, part["key"])
+        lines = [json.loads(x) for x in gzip.decompress(body).decode().splitlines()]
+        pids = [r["position_id"] for r in lines]
+        assert pids == sorted(pids)  # each part is sorted for min/max pruning
+        assert part["position_id"] == {"min": pids[0], "max": pids[-1]}
+        dates = sorted(r["publication_start_date"] for r in lines)
+        assert part["publication_start_date"] == {"min": dates[0], "max": dates[-1]}
+        rows.extend(lines)
+
+    assert sorted(r["position_id"] for r in rows) == ["P1", "P2", "P3", "P4", "P5"]
+    p2 = next(r for r in rows if r["position_id"] == "P2")
+    assert p2["ingest_run_id"] == "r2" and p2["page"] == 1
+    assert p2["bronze_key"].endswith("run=r2/page=0001.json.gz")
+    assert p2["item"] == _item("P2", "2025-09-03T00:00:00")  # verbatim item survives
+
+
+def test_compact_range_counts(local_bronze):
+    _, write = local_bronze
+    write("r1", 1, [_item("P1", "2025-09-01T00:00:00")])
+    write("r1", 1, [_item("P2", "2025-09-01T00:00:00")], day=DAY + dt.timedelta(days=1))
+    cfg = compact_mod.CompactConfig(start=DAY, end=DAY + dt.timedelta(days=2), fmt="ndjson")
+    total = compact_mod.compact(cfg)
+    # An empty day still gets a (single, empty) part and a manifest
+    assert total == {"days": 3, "pages": 2, "parts": 3, "rows": 2}
+
+
+def test_compact_day_parquet_row_group_stats(local_bronze):
+    pq = pytest.importorskip("pyarrow.parquet")
+    root, write = local_bronze
+    write("r1", 1, [_item(f"P{i:02d}", f"2025-09-{i:02d}T00:00:00") for i in range(1, 11)])
+    cfg = compact_mod.CompactConfig(start=DAY, end=DAY, fmt="parquet", row_group_size=4)
+    manifest = compact_mod.compact_day(DAY, cfg)
+
+    path = root / "bronze_local" / manifest["parts"][0]["key"]
+    meta = pq.ParquetFile(path).metadata
+    assert meta.num_rows == 10 and meta.num_row_groups == 3
+    col = meta.schema.names.index("position_id")
+    stats = meta.row_group(0).column(col).statistics
+    assert (stats.min, stats.max) == ("P01", "P04")
+
+
+def test_load_compact_config_validates(monkeypatch):
+    monkeypatch.delenv("COMPACT_FROM", raising=False)
+    with pytest.raises(RuntimeError, match="COMPACT_FROM"):
+        compact_mod.load_compact_config()
+    monkeypatch.setenv("COMPACT_FROM", "2025-09-03")
+    monkeypatch.setenv("COMPACT_FORMAT", "csv")
+    with pytest.raises(RuntimeError, match="COMPACT_FORMAT"):
+        compact_mod.load_compact_config()
+    monkeypatch.setenv("COMPACT_FORMAT", "ndjson")
+    cfg = compact_mod.load_compact_config()
+    assert cfg.start == cfg.end == DAY and cfg.fmt == "ndjson"
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from tasman_etl.dq.gx.validate import validate_page_jobs as validate_gx
+from tasman_etl.dq.native import validate_page_jobs_native, validate_page_rows_native
+from tasman_etl.dq.validate import validate_page_jobs, validate_page_rows
+from tasman_etl.models import JobDetailsRecord, JobLocationRecord, JobRecord
+from tasman_etl.transform import Bundle, page_rows_from_bundles
+
+LOC = JobLocationRecord(loc_idx=0, city_name="Chicago")
+
+
+def _job(pid: str = "N1", **kw) -> JobRecord:
+    fields = {
+        "position_id": pid,
+        "position_title": "Data Engineer",
+        "position_uri": f"https://example.com/job/{pid}",
+        "apply_uri": [f"https://apply.example.com/{pid}"],
+        "pay_min": 100,
+        "pay_max": 200,
+        "raw_json": {"PositionID": pid},
+    }
+    fields.update(kw)
+    return JobRecord(**fields)
+
+
+def _rules(result):
+    return sorted((r.name, r.success, r.details) for r in result.rules)
+
+
+PAGES = {
+    "happy": [_job("A"), _job("B", pay_min=None, pay_max=None, apply_uri=[])],
+    "bad_uri_and_pay": [
+        _job("C", position_uri="ftp://not-http", pay_min=-10, pay_max=0),
+        _job("D"),
+    ],
+    "bad_apply_and_pair": [
+        _job("E", apply_uri=["https://ok", "ftp://bad", "mailto:x"]),
+        # JobRecord rejects pay_min > pay_max, so bypass validation to exercise the rule
+        _job("F", apply_uri=["ftp://bad"]).model_copy(update={"pay_min": 300}),
+        _job("G", pay_min=500, pay_max=None),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_native_matches_gx_rule_for_rule(name):
+    jobs = PAGES[name]
+    native = validate_page_jobs_native(jobs, [LOC])
+    gx = validate_gx(jobs, [LOC])
+    assert native.passed == gx.passed
+    assert _rules(native) == _rules(gx)
+
+
+def _rows(jobs, locs):
+    bundles = [Bundle(j, JobDetailsRecord(), [], [], []) for j in jobs]
+    if bundles:
+        bundles[0].locations.extend(locs)
+    return page_rows_from_bundles(bundles)
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_native_rows_match_records(name):
+    jobs = PAGES[name]
+    for locs in ([LOC], []):
+        by_rows = validate_page_rows_native(_rows(jobs, locs))
+        by_records = validate_page_jobs_native(jobs, locs)
+        assert by_rows.passed == by_records.passed
+        assert _rules(by_rows) == _rules(by_records)
+
+
+def test_rows_dispatch_engines():
+    rows = _rows(PAGES["bad_uri_and_pay"], [LOC])
+    native = validate_page_rows(rows, engine="native")
+    assert _rules(native) == _rules(validate_page_rows(rows, engine="gx"))
+    assert native.passed is False
+    with pytest.raises(RuntimeError, match="DQ_ENGINE"):
+        validate_page_rows(rows, engine="pandera")
+
+
+def test_native_counts_unexpected_rows():
+    result = validate_page_jobs_native(PAGES["bad_apply_and_pair"], [LOC])
+    failing = {(r.name, r.details) for r in result.rules if not r.success}
+    # Two jobs with a bad apply URL, one with pay_min > pay_max
+    assert failing == {
+        ("expect_column_values_to_be_in_set", "2"),
+        ("expect_column_values_to_be_in_set", "1"),
+    }
+    assert result.passed is False
+
+
+def test_native_empty_page_and_missing_locations():
+    empty = validate_page_jobs_native([], [LOC])
+    assert empty.passed is False
+    assert [r.name for r in empty.rules] == ["has_at_least_one_location", "non_empty_jobs_page"]
+    no_loc = validate_page_jobs_native([_job()], [])
+    assert no_loc.passed is False
+    assert all(r.success for r in no_loc.rules[1:])
+
+
+def test_dispatch_engines(monkeypatch, caplog):
+    jobs = PAGES["happy"]
+    assert validate_page_jobs(jobs, [LOC], engine="native").passed
+    assert validate_page_jobs(jobs, [LOC], engine="gx").passed
+    with pytest.raises(RuntimeError, match="DQ_ENGINE"):
+        validate_page_jobs(jobs, [LOC], engine="pandera")
+
+    # Audit gates on native and logs when GX disagrees
+    import tasman_etl.dq.gx.validate as gx_mod
+    from tasman_etl.dq.result import ValidationResult
+
+    monkeypatch.setattr(
+        gx_mod, "validate_page_jobs", lambda jobs, locs: ValidationResult(passed=False, rules=[])
+    )
+    with caplog.at_level(logging.WARNING, logger="tasman.dq"):
+        result = validate_page_jobs(jobs, [LOC], engine="audit")
+    assert result.passed is True
+    assert any(r.message == "dq.audit_mismatch" for r in caplog.records)
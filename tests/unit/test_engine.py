@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+import tasman_etl.db.engine as engine_mod
+
+
+class _FakePool:
+    instances: list[_FakePool] = []
+
+    def __init__(self, conninfo: str, **kwargs: Any):
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.checkouts = 0
+        self.closed = False
+        _FakePool.instances.append(self)
+
+    @contextmanager
+    def connection(self):
+        self.checkouts += 1
+        yield f"pooled-{self.checkouts}"
+
+    def close(self):
+        self.closed = True
+
+    @staticmethod
+    def check_connection(conn):  # referenced as ConnectionPool.check_connection
+        return None
+
+
+@pytest.fixture()
+def fake_pool(monkeypatch):
+    _FakePool.instances = []
+    monkeypatch.setattr(engine_mod, "ConnectionPool", _FakePool)
+    monkeypatch.setattr(engine_mod.atexit, "register", lambda fn: fn)
+    return _FakePool
+
+
+def test_pool_is_lazy_and_shared(fake_pool):
+    eng = engine_mod.Engine(dsn="dbname=x", pool_min_size=2, pool_max_size=8)
+    assert not fake_pool.instances, "Pool must not open at import/construct time"
+
+    with eng.connect() as c1:
+        assert c1 == "pooled-1"
+    with eng.connect() as c2:
+        assert c2 == "pooled-2"
+
+    assert len(fake_pool.instances) == 1
+    kwargs = fake_pool.instances[0].kwargs
+    assert kwargs["min_size"] == 2 and kwargs["max_size"] == 8
+    assert kwargs["check"] is not None
+
+    eng.close()
+    assert fake_pool.instances[0].closed
+
+
+def test_connect_kwargs_bypass_pool(monkeypatch, fake_pool):
+    opened: list[dict] = []
+
+    @contextmanager
+    def _fake_connect(dsn, **kwargs):
+        opened.append(kwargs)
+        yield "direct"
+
+    monkeypatch.setattr(engine_mod.psycopg, "connect", _fake_connect)
+    eng = engine_mod.Engine(dsn="dbname=x")
+    with eng.connect(autocommit=True) as conn:
+        assert conn == "direct"
+    assert opened == [{"autocommit": True}]
+    assert not fake_pool.instances
+
+
+def test_build_engine_reads_pool_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "12")
+    monkeypatch.setenv("DB_POOL_MAX_IDLE", "60")
+    monkeypatch.setenv("DB_POOL_ENABLED", "false")
+    eng = engine_mod.build_engine(app_name="unit")
+    assert eng.pool_max_size == 12
+    assert eng.pool_max_idle == 60.0
+    assert eng.use_pool is False
+    assert "application_name=unit" in eng.dsn
+
+
+def test_build_engine_rejects_fractional_pool_size(monkeypatch):
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "2.7")
+    with pytest.raises(RuntimeError, match="DB_POOL_MAX_SIZE"):
+        engine_mod.build_engine(app_name="unit")
+
+
+def test_unpooled_connect_returns_plain_connection(monkeypatch, fake_pool):
+    sentinel = object()
+    monkeypatch.setattr(engine_mod.psycopg, "connect", lambda dsn, **kw: sentinel)
+    eng = engine_mod.Engine(dsn="dbname=x", use_pool=False)
+    conn = eng.connect()  # pre-pool call shape
+    assert conn is sentinel
+    assert not fake_pool.instances
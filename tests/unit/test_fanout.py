@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import logging
+import types
+from typing import Any
+
+import pytest
+
+from tasman_etl.db.repository import LoadResult
+from tasman_etl.runner import fanout as fo_mod
+from tasman_etl.runner import run as run_mod
+
+
+def _item(pid: str) -> dict:
+    return {
+        "MatchedObjectId": f"M-{pid}",
+        "MatchedObjectDescriptor": {
+            "PositionID": pid,
+            "PositionTitle": "Data Engineer",
+            "PositionURI": f"https://example/job/{pid}",
+            "PositionLocation": [{"CityName": "Chicago"}, {"CityName": "Remote"}],
+            "JobCategory": [{"Code": "2210", "Name": "IT"}],
+        },
+    }
+
+
+class _SearchClient:
+    """Serves fixed pages per keyword and records every search it was asked for."""
+
+    def __init__(self, pages: dict[str, list[list[str]]]):
+        self.pages = pages
+        self.searches: list[dict[str, Any]] = []
+
+    def fetch_search_pages(self, **kwargs):
+        self.searches.append(kwargs)
+        for page, pids in enumerate(self.pages[kwargs["keyword"]], start=1):
+            payload = {
+                "SearchResult": {
+                    "SearchResultCount": len(pids),
+                    "SearchResultCountAll": len(pids),
+                    "SearchResultItems": [_item(p) for p in pids],
+                }
+            }
+            yield page, {"params": {"Page": page}}, {"status": 200, "payload": payload}
+
+    def connection_stats(self):
+        return {"searches": len(self.searches)}
+
+
+@pytest.fixture()
+def stubs(monkeypatch):
+    state: dict[str, Any] = {"loaded": [], "bronze": [], "manifests": []}
+
+    def _fake_put(key, doc):
+        state["bronze"].append(key)
+        return {"mocked": True}
+
+    def _fake_upsert(conn, rows, **kwargs):
+        state["loaded"].append(list(rows.job["position_id"]))
+        # every child row must still point at a job of the (possibly filtered) batch
+        assert set(rows.locations["item"]) <= set(range(len(rows)))
+        return LoadResult(dict.fromkeys(rows.job["position_id"], 1), inserted=len(rows))
+
+    class _StubConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(run_mod, "put_json_gz", _fake_put)
+    monkeypatch.setattr(run_mod, "upsert_pages", _fake_upsert)
+    monkeypatch.setattr(
+        run_mod,
+        "validate_page_rows",
+        lambda rows: types.SimpleNamespace(passed=True, rules=[]),
+    )
+    monkeypatch.setattr(run_mod, "engine", types.SimpleNamespace(connect=lambda **kw: _StubConn()))
+    monkeypatch.setattr(
+        fo_mod.RunManifest, "write", lambda self: state["manifests"].append(self.to_dict())
+    )
+    return state
+
+
+def _cfg(*searches: fo_mod.SearchSpec) -> fo_mod.FanoutConfig:
+    return fo_mod.FanoutConfig(run_id="rid", searches=searches, upload_workers=0)
+
+
+def test_parse_run_spec_defaults_names_and_errors():
+    searches = fo_mod.parse_run_spec(
+        {
+            "defaults": {"results_per_page": 500, "max_pages": 3},
+            "searches": [
+                {"keyword": "Data Engineer", "location_name": "Chicago, Illinois"},
+                {"name": "remote", "keyword": "data", "radius_miles": "25", "max_pages": 1},
+            ],
+        }
+    )
+    assert [s.name for s in searches] == ["data-engineer-chicago-illinois", "remote"]
+    assert searches[0].results_per_page == 500 and searches[0].max_pages == 3
+    assert searches[1].radius_miles == 25 and searches[1].max_pages == 1
+    assert fo_mod.parse_run_spec([{"keyword": "x"}])[0].name == "x"
+
+    with pytest.raises(RuntimeError, match="unknown keys"):
+        fo_mod.parse_run_spec([{"keyword": "x", "locaton_name": "typo"}])
+    with pytest.raises(RuntimeError, match="missing keyword"):
+        fo_mod.parse_run_spec([{"name": "x"}])
+    with pytest.raises(RuntimeError, match="duplicate search names"):
+        fo_mod.parse_run_spec([{"keyword": "x"}, {"keyword": "X"}])
+    with pytest.raises(RuntimeError, match="no searches"):
+        fo_mod.parse_run_spec({"searches": []})
+    with pytest.raises(RuntimeError, match=r"search #1 \(x\)"):
+        fo_mod.parse_run_spec([{"keyword": "x", "radius_miles": "far"}])
+
+
+def test_load_run_spec_json_and_yaml(tmp_path):
+    doc = {"searches": [{"keyword": "data", "location_name": "Chicago"}]}
+    (tmp_path / "spec.json").write_text(json.dumps(doc))
+    assert fo_mod.load_run_spec(tmp_path / "spec.json")[0].name == "data-chicago"
+
+    pytest.importorskip("yaml")
+    (tmp_path / "spec.yaml").write_text(
+        "searches:\n  - name: chi\n    keyword: data\n    radius_miles: 10\n"
+    )
+    assert fo_mod.load_run_spec(tmp_path / "spec.yaml")[0] == fo_mod.SearchSpec(
+        name="chi", keyword="data", radius_miles=10
+    )
+    (tmp_path / "bad.json").write_text("{")
+    with pytest.raises(RuntimeError, match="invalid JSON"):
+        fo_mod.load_run_spec(tmp_path / "bad.json")
+
+
+def test_run_searches_dedupes_overlap_and_reports_per_search(stubs):
+    client = _SearchClient(
+        {
+            "engineer": [["P1", "P2"], ["P3"]],
+            "scientist": [["P2", "P4", "P1"]],  # P1, P2 already loaded by the first search
+            "analyst": [["P4", "P3"]],  # nothing new
+        }
+    )
+    cfg = _cfg(
+        fo_mod.SearchSpec(name="eng", keyword="engineer", max_pages=2),
+        fo_mod.SearchSpec(name="sci", keyword="scientist"),
+        fo_mod.SearchSpec(name="ana", keyword="analyst"),
+    )
+    results = fo_mod.run_searches(cfg, client=client)  # type: ignore[arg-type]
+
+    assert stubs["loaded"] == [["P1", "P2"], ["P3"], ["P4"]]
+    assert [(r["search"], r["pages"], r["items"], r["duplicates"], r["jobs"]) for r in results] == [
+        ("eng", 2, 3, 0, 3),
+        ("sci", 1, 3, 2, 1),
+        ("ana", 1, 2, 2, 0),
+    ]
+    sci = results[1]
+    assert (sci["locations"], sci["categories"], sci["inserted"]) == (2, 1, 1)
+
+    # One shared client; each search keeps its own bronze run and manifest (full pages)
+    assert [s["keyword"] for s in client.searches] == ["engineer", "scientist", "analyst"]
+    assert len(stubs["bronze"]) == 4
+    assert "/run=rid-sci/page=0001.json.gz" in stubs["bronze"][2]
+    assert [m["run_id"] for m in stubs["manifests"]] == ["rid-eng", "rid-sci", "rid-ana"]
+    assert stubs["manifests"][1]["pages"][0]["position_ids"] == ("P2", "P4", "P1")
+
+
+def test_duplicate_on_a_page_keeps_the_last_row(monkeypatch, stubs):
+    client = _SearchClient({"engineer": [["P5", "P6", "P5"]]})
+    fetch = client.fetch_search_pages
+
+    def _fetch(**kwargs):
+        for page, req, resp in fetch(**kwargs):
+            items = resp["payload"]["SearchResult"]["SearchResultItems"]
+            items[2]["MatchedObjectDescriptor"]["PositionTitle"] = "Senior Data Engineer"
+            yield page, req, resp
+
+    titles: list[dict[str, str]] = []
+    load_page = fo_mod.load_page
+
+    def _load(rows, **kwargs):
+        titles.append(dict(zip(rows.job["position_id"], rows.job["position_title"], strict=True)))
+        return load_page(rows, **kwargs)
+
+    monkeypatch.setattr(client, "fetch_search_pages", _fetch)
+    monkeypatch.setattr(fo_mod, "load_page", _load)
+    search = fo_mod.SearchSpec(name="eng", keyword="engineer")
+    stats = fo_mod.run_search(_cfg(search), search, client=client, seen=set())  # type: ignore[arg-type]
+
+    # Same row as upsert_pages keeps for a repeated position_id
+    assert titles == [{"P5": "Senior Data Engineer", "P6": "Data Engineer"}]
+    assert (stats["items"], stats["duplicates"], stats["jobs"]) == (3, 1, 2)
+
+
+def test_main_runs_spec(monkeypatch, tmp_path, stubs, caplog):
+    spec = tmp_path / "searches.json"
+    spec.write_text(
+        json.dumps(
+            {"searches": [{"name": "a", "keyword": "engineer"}, {"name": "b", "keyword": "sci"}]}
+        )
+    )
+    created: list[_SearchClient] = []
+
+    def _factory():
+        created.append(_SearchClient({"engineer": [["P1"]], "sci": [["P1", "P2"]]}))
+        return created[-1]
+
+    monkeypatch.setattr(fo_mod, "UsaJobsClient", _factory)
+    monkeypatch.setenv("RUN_SPEC", str(spec))
+    monkeypatch.setenv("RUN_ID", "rid-main")
+    monkeypatch.setenv("BRONZE_UPLOAD_WORKERS", "0")
+
+    caplog.set_level(logging.INFO, logger=fo_mod.logger.name)
+    assert fo_mod.main() == 0
+    assert len(created) == 1
+    assert stubs["loaded"] == [["P1"], ["P2"]]
+
+    # Additive counts are summed; per-search result-set sizes are not
+    done = next(r for r in caplog.records if r.msg == "fanout.complete")
+    assert (done.items, done.jobs, done.duplicates) == (3, 2, 1)
+    assert not hasattr(done, "total_results") and not hasattr(done, "planned_pages")
+    assert [s["total_results"] for s in done.searches] == [None, None]
+
+
+def test_main_config_error(monkeypatch):
+    monkeypatch.delenv("RUN_SPEC", raising=False)
+    assert fo_mod.main() == 1
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from tasman_etl.http.cache import ResponseCache
+from tasman_etl.http.ratelimit import RateLimiter
+from tasman_etl.http.usajobs import UsaJobsClient
+
+
+class _Response:
+    def __init__(self, status: int, payload: dict | None = None, headers: dict | None = None):
+        self.status_code = status
+        self.headers = {"Content-Type": "application/hr+json; charset=utf-8", **(headers or {})}
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+        self.text = self.content.decode()
+
+
+class _Session:
+    """Serves one page per request (versioned by ``etag``); honours If-None-Match."""
+
+    def __init__(self, etag: str | None = '"v1"'):
+        self.etag = etag
+        self.version = 1
+        self.calls: list[dict] = []
+
+    def get(self, url, *, headers, params, **kwargs):
+        self.calls.append({"headers": dict(headers), "params": dict(params)})
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return _Response(304, headers={"ETag": self.etag})
+        payload = {
+            "SearchResult": {
+                "SearchResultCount": 1,
+                "SearchResultCountAll": 1,
+                "SearchResultItems": [{"page": params["Page"], "version": self.version}],
+            }
+        }
+        return _Response(200, payload, {"ETag": self.etag} if self.etag else {})
+
+
+@pytest.fixture()
+def now() -> list[float]:
+    return [1_000.0]
+
+
+@pytest.fixture()
+def cache(tmp_path, now) -> ResponseCache:
+    return ResponseCache(tmp_path / "cache", ttl_s=60, clock=lambda: now[0])
+
+
+@pytest.fixture()
+def limiter() -> RateLimiter:
+    return RateLimiter(max_rate=1000.0, burst=100)
+
+
+def _client(monkeypatch, session, cache, limiter) -> UsaJobsClient:
+    monkeypatch.setenv("USAJOBS_USER_AGENT", "unit@example.com")
+    monkeypatch.setenv("USAJOBS_AUTH_KEY", "unit-key")
+    return UsaJobsClient(session=session, cache=cache, rate_limiter=limiter)  # type: ignore[arg-type]
+
+
+def _version(resp: dict) -> int:
+    return resp["payload"]["SearchResult"]["SearchResultItems"][0]["version"]
+
+
+def test_key_normalises_params():
+    key = ResponseCache.key
+    url = "https://data.usajobs.gov/api/search"
+    assert key(url, {"Keyword": "data  engineer ", "Page": 1}) == key(
+        url, {"Page": "1", "keyword": "data engineer", "Radius": None}
+    )
+    assert key(url, {"Keyword": "data", "Page": 1}) != key(url, {"Keyword": "data", "Page": 2})
+    assert key(url, {"Keyword": "data"}) != key("https://other/api/search", {"Keyword": "data"})
+
+
+def test_fresh_entry_served_without_request(monkeypatch, cache, limiter):
+    session = _Session()
+    client = _client(monkeypatch, session, cache, limiter)
+    _, first = client.fetch_search_page(keyword="data", page=1)
+    session.version = 2  # the API changed, but the entry is still fresh
+    req, again = client.fetch_search_page(keyword="data", page=1)
+
+    assert len(session.calls) == 1 and _version(again) == 1
+    assert again == first and req["params"]["Page"] == 1
+    client.fetch_search_page(keyword="data", page=2)  # other params: separate entry
+    assert len(session.calls) == 2
+    stats = client.connection_stats()
+    assert stats["requests"] == 2
+    assert (stats["cache"]["hits"], stats["cache"]["stored"]) == (1, 2)
+
+
+def test_stale_entry_revalidated_with_etag(monkeypatch, cache, limiter, now):
+    session = _Session()
+    client = _client(monkeypatch, session, cache, limiter)
+    client.fetch_search_page(keyword="data", page=1)
+
+    now[0] += 120  # past the TTL
+    _, resp = client.fetch_search_page(keyword="data", page=1)
+    assert session.calls[-1]["headers"]["If-None-Match"] == '"v1"'
+    assert _version(resp) == 1 and resp["status"] == 200
+    assert cache.stats()["revalidated"] == 1
+
+    client.fetch_search_page(keyword="data", page=1)  # 304 restarted the TTL
+    assert len(session.calls) == 2
+
+    now[0] += 120
+    session.etag, session.version = '"v2"', 2  # changed upstream: full response
+    _, resp = client.fetch_search_page(keyword="data", page=1)
+    assert _version(resp) == 2
+    key = ResponseCache.key(client.base_url, session.calls[-1]["params"])
+    entry = cache.get(key)
+    assert entry is not None and entry.etag == '"v2"'
+
+
+def test_stale_entry_without_validators_is_refetched(monkeypatch, cache, limiter, now):
+    session = _Session(etag=None)
+    client = _client(monkeypatch, session, cache, limiter)
+    client.fetch_search_page(keyword="data", page=1)
+    now[0] += 120
+    session.version = 2
+    _, resp = client.fetch_search_page(keyword="data", page=1)
+    assert "If-None-Match" not in session.calls[-1]["headers"]
+    assert _version(resp) == 2
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, now):
+    cache = ResponseCache(tmp_path, ttl_s=60, clock=lambda: now[0])
+    doc = {"status": 200, "payload": {"blob": os.urandom(2048).hex()}}
+    for i, k in enumerate(("a", "b", "c")):
+        cache.put(k, doc)
+        os.utime(tmp_path / f"{k}.json.gz", (1_000 + i, 1_000 + i))
+    size = cache.stats()["bytes"]
+    cache.max_bytes = size  # exactly full
+    assert cache.get("a") is not None  # "a" becomes the most recently used
+
+    cache.put("d", doc)
+    assert cache.get("b") is None  # least recently used went first
+    assert all(cache.get(k) is not None for k in ("a", "c", "d"))
+    assert cache.stats()["evicted"] == 1 and cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(tmp_path)
+    (tmp_path / "bad.json.gz").write_bytes(b"not gzip")
+    assert cache.get("bad") is None
+    assert not (tmp_path / "bad.json.gz").exists()
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("USAJOBS_CACHE_DIR", raising=False)
+    assert ResponseCache.from_env() is None
+    monkeypatch.setenv("USAJOBS_CACHE_DIR", str(tmp_path / "c"))
+    monkeypatch.setenv("USAJOBS_CACHE_TTL", "30")
+    monkeypatch.setenv("USAJOBS_CACHE_MAX_MB", "0.5")
+    cache = ResponseCache.from_env()
+    assert cache is not None and (cache.ttl_s, cache.max_bytes) == (30.0, 512 * 1024)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+
+import pytest
+
+import tasman_etl.storage.bronze_s3 as bronze_s3
+from tasman_etl.runner import replay as replay_mod
+from tasman_etl.runner import run as run_mod
+from tasman_etl.storage import manifest as manifest_mod
+
+DAY = dt.date(2025, 9, 3)
+
+
+def _response(*pids: str) -> dict:
+    items = [{"MatchedObjectDescriptor": {"PositionID": pid}} for pid in pids]
+    return {"status": 200, "headers": {}, "payload": {"SearchResult": {"SearchResultItems": items}}}
+
+
+@pytest.fixture()
+def local_bronze(monkeypatch, tmp_path):
+    """Bronze + manifests under tmp_path/bronze_local (no bucket -> local fallback)."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bronze_s3, "BRONZE_BUCKET", None)
+    monkeypatch.setattr(bronze_s3, "BRONZE_PREFIX", "bronze/usajobs")
+    monkeypatch.setattr(
+        run_mod, "bronze_key", lambda run_id, page: bronze_s3.bronze_key(run_id, page, date=DAY)
+    )
+    return tmp_path
+
+
+def _write_run(run_id: str, pages: dict[int, tuple[str, ...]], *, uploader=None) -> str:
+    m = manifest_mod.RunManifest(run_id)
+    for page, pids in pages.items():
+        run_mod.persist_raw_page(
+            run_id,
+            page,
+            {"params": {"Page": page}},
+            _response(*pids),
+            uploader=uploader,
+            manifest=m,
+        )
+    if uploader is not None:
+        uploader.flush()
+    return m.write()
+
+
+def test_run_manifest_records_what_was_written(local_bronze):
+    key = _write_run("r1", {2: ("P3",), 1: ("P1", "P2")})
+    assert key == "bronze/usajobs/manifests/run=r1.json"
+    doc = json.loads((local_bronze / "bronze_local" / key).read_bytes())
+    assert doc["run_id"] == "r1"
+    assert doc["totals"]["pages"] == 2 and doc["totals"]["items"] == 3
+    first = doc["pages"][0]
+    assert first["page"] == 1 and first["position_ids"] == ["P1", "P2"]
+    body = (local_bronze / "bronze_local" / first["key"]).read_bytes()
+    assert first["size"] == len(body)
+    assert first["sha256_hex"] == bronze_s3.hashlib.sha256(body).hexdigest()
+    assert doc["totals"]["bytes"] == sum(p["size"] for p in doc["pages"])
+
+
+def test_run_manifest_with_background_uploads(local_bronze):
+    with bronze_s3.BronzeUploader(max_workers=3) as up:
+        _write_run("r2", {p: (f"P{p}",) for p in range(1, 6)}, uploader=up)
+    pages = manifest_mod.load_run_manifest("r2")
+    assert pages is not None
+    assert [p.page for p in pages] == [1, 2, 3, 4, 5]
+    assert all(p.size > 0 and len(p.sha256_hex) == 64 for p in pages)
+
+
+def test_bronze_index_lookups(local_bronze):
+    _write_run("r1", {1: ("P1", "P2"), 2: ("P3",)})
+    _write_run("r2", {1: ("P2",)})
+    index = manifest_mod.BronzeIndex.from_runs(["r1", "r2", "missing"])
+    assert index.runs == ["r1", "r2"]
+    assert [p.key.split("/")[-2:] for p in index.find("P2")] == [
+        ["run=r1", "page=0001.json.gz"],
+        ["run=r2", "page=0001.json.gz"],
+    ]
+    assert index.find("nope") == []
+    entry = index.page("r1", 2)
+    assert entry is not None and entry.position_ids == ("P3",)
+    assert bronze_s3.get_json_gz(entry.key)["response"]["payload"] == _response("P3")["payload"]
+    assert [p.page for p in index.pages("r1")] == [1, 2]
+
+    # Re-adding a run replaces its pages in both lookups
+    index.add_run("r1", [manifest_mod.PageEntry("k", 7, 1, "x", 1, ("P9",))])
+    assert [p.page for p in index.find("P2")] == [1] and index.find("P1") == []
+    assert index.page("r1", 7) is not None and index.page("r1", 1) is None
+
+
+def test_load_run_manifest_missing(local_bronze):
+    assert manifest_mod.load_run_manifest("never-ran") is None
+
+
+def test_replay_uses_manifest_keys(local_bronze, monkeypatch):
+    _write_run("r1", {1: ("P1",), 2: ("P2",)})
+
+    def _no_listing(*a, **k):
+        raise AssertionError("manifest should avoid listing")
+
+    monkeypatch.setattr(replay_mod, "list_bronze_keys", _no_listing)
+    cfg = replay_mod.ReplayConfig(start=DAY, end=DAY, source_run_id="r1")
+    keys = replay_mod.replay_keys(cfg)
+    assert [k.rsplit("/", 1)[-1] for k in keys] == ["page=0001.json.gz", "page=0002.json.gz"]
+    # Outside the date range -> nothing, still without listing
+    later = replay_mod.ReplayConfig(
+        start=DAY + dt.timedelta(days=1), end=DAY + dt.timedelta(days=1), source_run_id="r1"
+    )
+    assert replay_mod.replay_keys(later) == []
@@ -221,3 +221,38 @@ def test_major_duties_joining_empty_safe():
     _, jd, *_ = normalise_item(item, "RID5", None)
     # Empty list -> None (not blank string)
     assert jd.major_duties is None
+
+
+def test_details_validated_once_per_descriptor(monkeypatch):
+    from tasman_etl.models import ApiDetails
+
+    item = ApiSearchResultItem.model_validate(
+        {
+            "MatchedObjectId": "1",
+            "MatchedObjectDescriptor": {
+                "PositionID": "MEMO-1",
+                "PositionTitle": "Engineer",
+                "PositionURI": "https://x/job/1",
+                "UserArea": {"Details": {"JobSummary": "Build", "TeleworkEligible": "yes"}},
+            },
+        }
+    )
+    calls = []
+    original = ApiDetails.model_validate.__func__  # type: ignore[attr-defined]
+
+    def _counting(cls, obj, *args, **kwargs):
+        calls.append(obj)
+        return original(cls, obj, *args, **kwargs)
+
+    monkeypatch.setattr(ApiDetails, "model_validate", classmethod(_counting))
+
+    d = item.MatchedObjectDescriptor
+    assert d.details is d.details
+    job, jd, *_ = normalise_item(item, "RID", source_event_time=None)
+    assert jd.job_summary == "Build" and job.telework_eligible is True
+    # Dumps reuse the cached instance; the raw_json fallback keeps Details as received
+    assert item.model_dump(mode="json")["MatchedObjectDescriptor"]["details"]["JobSummary"]
+    raw = job.raw_json["MatchedObjectDescriptor"]
+    assert "details" not in raw
+    assert raw["UserArea"]["Details"] == {"JobSummary": "Build", "TeleworkEligible": "yes"}
+    assert len(calls) == 1
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from tasman_etl.http.paging import PagePlan, page_size_for, plan_pages
+from tasman_etl.http.ratelimit import RateLimiter
+from tasman_etl.http.usajobs import UsaJobsClient
+
+RECORDED = (
+    Path(__file__).resolve().parents[2]
+    / "bronze_local/bronze/usajobs/date=2025/09/03/run=local-manual/page=0001.json.gz"
+)
+
+
+@pytest.fixture(scope="module")
+def recorded() -> dict:
+    """Page 1 of a recorded search: 25 per page, SearchResultCountAll 36, NumberOfPages 2."""
+    if not RECORDED.exists():
+        pytest.skip("recorded bronze page not available")
+    return json.loads(gzip.decompress(RECORDED.read_bytes()))["response"]["payload"]
+
+
+class _Response:
+    status_code = 200
+    headers = {"Content-Type": "application/hr+json; charset=utf-8"}
+
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload).encode()
+        self.text = self.content.decode()
+
+
+class _RecordedSearch:
+    """Session that replays a recorded result set, re-paged per ResultsPerPage / Page."""
+
+    def __init__(self, payload: dict, count: int | None = None):
+        result = payload["SearchResult"]
+        self.items = result["SearchResultItems"][:count]
+        self.user_area = result["UserArea"]
+        self.calls: list[dict] = []
+
+    def get(self, url, *, params, **kwargs):
+        self.calls.append(dict(params))
+        size, page = params["ResultsPerPage"], params["Page"]
+        chunk = self.items[(page - 1) * size : page * size]
+        payload = {
+            "SearchResult": {
+                "SearchResultCount": len(chunk),
+                "SearchResultCountAll": len(self.items),
+                "SearchResultItems": chunk,
+                "UserArea": {**self.user_area, "NumberOfPages": str(-(-len(self.items) // size))},
+            }
+        }
+        return _Response(payload)
+
+
+@pytest.fixture()
+def client(monkeypatch) -> UsaJobsClient:
+    monkeypatch.setenv("USAJOBS_USER_AGENT", "unit@example.com")
+    monkeypatch.setenv("USAJOBS_AUTH_KEY", "unit-key")
+    return UsaJobsClient(rate_limiter=RateLimiter(max_rate=1000.0, burst=100))
+
+
+def _replay(client: UsaJobsClient, session: _RecordedSearch, **kwargs):
+    client._http = session  # type: ignore[assignment]
+    plans: list[PagePlan] = []
+    out = list(client.fetch_search_pages(keyword="data", on_plan=plans.append, **kwargs))
+    ids = [
+        it["MatchedObjectId"]
+        for _, _, resp in out
+        for it in resp["payload"]["SearchResult"]["SearchResultItems"]
+    ]
+    return [p for p, _, _ in out], ids, plans
+
+
+def test_page_size_for():
+    assert page_size_for(50, 1) == (50, 1)
+    assert page_size_for(50, 3) == (150, 1)
+    assert page_size_for(50, 15) == (375, 2)  # split evenly: not 500 + a 250 tail
+    assert page_size_for(100, 20) == (500, 4)
+    assert page_size_for(800, 1) == (400, 2)
+    assert page_size_for(50, None) == (500, None)
+    assert page_size_for(50, [2, 3]) == (50, [2, 3])  # page numbers are tied to the size
+    assert page_size_for(50, 0) == (50, 0)
+
+
+def test_plan_pages_from_recorded_first_page(recorded):
+    assert plan_pages(recorded, results_per_page=25, wanted=None) == PagePlan(25, 36, (1, 2))
+    assert plan_pages(recorded, results_per_page=25, wanted=list(range(1, 11))).pages == (1, 2)
+    assert plan_pages(recorded, results_per_page=12, wanted=None).pages == (1, 2, 3)
+    assert plan_pages(recorded, results_per_page=500, wanted=[1]).pages == (1,)
+
+    no_total = {"SearchResult": {"UserArea": {"NumberOfPages": "3"}}}
+    assert plan_pages(no_total, results_per_page=25, wanted=[2, 3, 5]) == PagePlan(25, None, (2, 3))
+    empty = {"SearchResult": {"SearchResultCountAll": 0}}
+    assert plan_pages(empty, results_per_page=25, wanted=None).pages == (1,)
+    assert plan_pages({"SearchResult": {}}, results_per_page=25, wanted=None) is None
+
+
+def test_replay_fetches_exact_page_set(client, recorded):
+    session = _RecordedSearch(recorded)  # 25 recorded postings
+    pages, ids, plans = _replay(client, session, results_per_page=10, concurrency=2)
+    assert pages == [1, 2, 3]
+    assert sorted(ids) == sorted(it["MatchedObjectId"] for it in session.items)
+    assert plans == [PagePlan(10, 25, (1, 2, 3))]
+    assert sorted(c["Page"] for c in session.calls) == [1, 2, 3]
+
+
+def test_replay_full_last_page_needs_no_trailing_request(client, recorded):
+    # 20 postings at 10 per page: the short-page heuristic would ask for an empty page 3
+    session = _RecordedSearch(recorded, count=20)
+    pages, ids, _ = _replay(client, session, results_per_page=10, pages=10)
+    assert pages == [1, 2] and len(ids) == 20
+    assert sorted(c["Page"] for c in session.calls) == [1, 2]
+
+
+def test_replay_auto_page_size_minimises_requests(client, recorded):
+    session = _RecordedSearch(recorded)
+    pages, ids, plans = _replay(client, session, results_per_page=10, pages=3, auto_page_size=True)
+    # Same budget of 30 results, one request
+    assert pages == [1] and len(ids) == 25
+    assert [(c["Page"], c["ResultsPerPage"]) for c in session.calls] == [(1, 30)]
+    assert plans[0].stats() == {"total_results": 25, "planned_pages": 1, "results_per_page": 30}
+
+    session = _RecordedSearch(recorded)
+    pages, _, _ = _replay(client, session, auto_page_size=True)
+    assert pages == [1]
+    assert [c["ResultsPerPage"] for c in session.calls] == [500]
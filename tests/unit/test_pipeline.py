@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+import time
+import types
+from typing import Any
+
+import pytest
+
+from tasman_etl.db.repository import LoadResult
+from tasman_etl.runner import pipeline as pl_mod
+from tasman_etl.runner import run as run_mod
+
+
+def _payload(page: int) -> dict:
+    return {
+        "SearchResult": {
+            "SearchResultCount": 1,
+            "SearchResultCountAll": 3,
+            "SearchResultItems": [
+                {
+                    "MatchedObjectId": f"M{page}",
+                    "MatchedObjectDescriptor": {
+                        "PositionID": f"PID-PL-{page}",
+                        "PositionTitle": "Data Engineer",
+                        "PositionURI": f"https://example/job/{page}",
+                        "PositionLocation": [{"CityName": "Chicago"}],
+                    },
+                }
+            ],
+        }
+    }
+
+
+class _PagesClient:
+    def __init__(self, n: int, delay: float = 0.0):
+        self.n = n
+        self.delay = delay
+
+    def fetch_search_pages(self, **kwargs):
+        for page in range(1, self.n + 1):
+            time.sleep(self.delay)
+            yield page, {"params": {"Page": page}}, {"status": 200, "payload": _payload(page)}
+
+
+@pytest.fixture()
+def stubs(monkeypatch):
+    state: dict[str, Any] = {"loaded": [], "bronze": [], "overlap": False, "loading": False}
+    lock = threading.Lock()
+
+    def _fake_put(key, doc):
+        with lock:
+            state["bronze"].append(key)
+            # Bronze write happening while a load is in progress => stages overlap
+            state["overlap"] = state["overlap"] or state["loading"]
+        return {"mocked": True}
+
+    def _fake_upsert(conn, rows, **kwargs):
+        with lock:
+            state["loading"] = True
+        time.sleep(0.05)
+        with lock:
+            state["loaded"].extend(rows.job["position_id"])
+            state["loading"] = False
+        return LoadResult(dict.fromkeys(rows.job["position_id"], 1), updated=len(rows))
+
+    class _StubConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(run_mod, "put_json_gz", _fake_put)
+    monkeypatch.setattr(pl_mod.RunManifest, "write", lambda self: "manifests/stub.json")
+    monkeypatch.setattr(run_mod, "upsert_pages", _fake_upsert)
+    monkeypatch.setattr(
+        run_mod,
+        "validate_page_rows",
+        lambda rows: types.SimpleNamespace(passed=True, rules=[]),
+    )
+    monkeypatch.setattr(run_mod, "engine", types.SimpleNamespace(connect=lambda **kw: _StubConn()))
+    return state
+
+
+def _cfg(**kw) -> run_mod.RunConfig:
+    return run_mod.RunConfig(run_id="rid-pl", keyword="data", max_pages=5, load_mode="bulk", **kw)
+
+
+def test_pipeline_loads_in_page_order_with_overlap(stubs):
+    result = pl_mod.run_pipeline(_cfg(), client=_PagesClient(5, delay=0.02))  # type: ignore[arg-type]
+    assert result["pages"] == 5 and result["jobs"] == 5 and result["updated"] == 5
+    assert stubs["loaded"] == [f"PID-PL-{p}" for p in range(1, 6)]
+    assert stubs["overlap"], "Bronze writes should proceed while earlier pages load"
+    assert set(result["stages"]) == {"fetch", "bronze", "transform", "load"}
+    assert all(s["items"] == 5 for s in result["stages"].values())
+
+
+def test_pipeline_stage_failure_propagates(stubs, monkeypatch):
+    def _boom(*a, **k):
+        raise RuntimeError("Validation failed (gate on)")
+
+    monkeypatch.setattr(pl_mod, "prepare_page", _boom)
+    with pytest.raises(RuntimeError, match="gate on"):
+        pl_mod.run_pipeline(_cfg(), client=_PagesClient(50))  # type: ignore[arg-type]
+    assert not stubs["loaded"]
+
+
+def test_pipeline_surfaces_background_upload_failure(stubs, monkeypatch):
+    def _fail(key, doc):
+        raise OSError("S3 unavailable")
+
+    monkeypatch.setattr(run_mod, "put_json_gz", _fail)
+    with pytest.raises(RuntimeError, match="bronze upload"):
+        pl_mod.run_pipeline(_cfg(upload_workers=2), client=_PagesClient(3))  # type: ignore[arg-type]
+    # Loading is not held up by the uploads; the failure is raised when they are flushed
+    assert stubs["loaded"] == [f"PID-PL-{p}" for p in range(1, 4)]
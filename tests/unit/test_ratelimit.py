@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+from tasman_etl.http.ratelimit import RateLimiter, shared_limiter
+
+
+class _FakeClock:
+    """Monotonic + wall clock whose sleep just advances time."""
+
+    def __init__(self, wall: float = 1_700_000_000.0):
+        self.t = 0.0
+        self.wall0 = wall
+        self.sleeps: list[float] = []
+
+    def mono(self) -> float:
+        return self.t
+
+    def wall(self) -> float:
+        return self.wall0 + self.t
+
+    def sleep(self, s: float) -> None:
+        self.sleeps.append(s)
+        self.t += s
+
+
+def _limiter(clock: _FakeClock, **kw) -> RateLimiter:
+    return RateLimiter(clock=clock.mono, wall_clock=clock.wall, sleep=clock.sleep, **kw)
+
+
+def test_bucket_allows_burst_then_paces_at_max_rate():
+    clock = _FakeClock()
+    rl = _limiter(clock, max_rate=4.0, burst=2)
+    for _ in range(2):
+        assert rl.acquire() == 0.0
+    for _ in range(4):
+        rl.acquire()
+    # 4 extra requests at 4 rps -> ~1s of waiting, never more than one token interval each
+    assert abs(clock.t - 1.0) < 1e-6
+    assert all(s <= 0.25 + 1e-9 for s in clock.sleeps)
+
+
+def test_429_pauses_for_retry_after_and_halves_rate():
+    clock = _FakeClock()
+    rl = _limiter(clock, max_rate=8.0, burst=4)
+    rl.acquire()
+    delay = rl.observe(429, {"Retry-After": "3"})
+    assert delay == 3.0
+    assert rl.rate == 4.0
+    rl.acquire()
+    assert clock.t >= 3.0
+    assert rl.stats()["throttled"] == 1
+
+
+def test_retry_after_http_date():
+    clock = _FakeClock()
+    rl = _limiter(clock)
+    when = datetime.fromtimestamp(clock.wall() + 5, tz=UTC)
+    delay = rl.observe(429, {"retry-after": format_datetime(when, usegmt=True)})
+    assert delay is not None and 4.0 <= delay <= 5.0
+
+
+def test_exhausted_quota_waits_for_epoch_reset():
+    clock = _FakeClock()
+    rl = _limiter(clock, max_rate=10.0, burst=5)
+    reset_at = clock.wall() + 7
+    assert (
+        rl.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)}) is None
+    )
+    rl.acquire()
+    assert clock.t >= 7.0
+
+
+def test_low_remaining_spreads_quota_until_reset_then_recovers():
+    clock = _FakeClock()
+    rl = _limiter(clock, max_rate=10.0, burst=5)
+    rl.observe(200, {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "10"})
+    assert rl.rate == 0.2  # 2 requests over 10s
+    for _ in range(3):
+        rl.observe(200, {"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "3600"})
+    assert rl.rate > 0.2
+    for _ in range(20):
+        rl.observe(200, {})
+    assert rl.rate == 10.0
+
+
+def test_shared_limiter_is_per_host():
+    a = shared_limiter("api.example.test")
+    assert shared_limiter("api.example.test") is a
+    assert shared_limiter("other.example.test") is not a
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import datetime as dt
+import types
+from typing import Any
+
+import pytest
+
+import tasman_etl.storage.bronze_s3 as bronze_s3
+from tasman_etl.db.repository import LoadResult
+from tasman_etl.runner import replay as replay_mod
+from tasman_etl.runner import run as run_mod
+
+DAY = dt.date(2025, 9, 3)
+
+
+def _payload(pid: str) -> dict:
+    return {
+        "SearchResult": {
+            "SearchResultCount": 1,
+            "SearchResultCountAll": 1,
+            "SearchResultItems": [
+                {
+                    "MatchedObjectId": pid,
+                    "MatchedObjectDescriptor": {
+                        "PositionID": pid,
+                        "PositionTitle": "Data Engineer",
+                        "PositionURI": f"https://example/job/{pid}",
+                        "PositionLocation": [{"CityName": "Chicago"}],
+                    },
+                }
+            ],
+        }
+    }
+
+
+@pytest.fixture()
+def local_bronze(monkeypatch, tmp_path):
+    """Write bronze pages to tmp_path/bronze_local (no bucket -> local fallback)."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bronze_s3, "BRONZE_BUCKET", None)
+    monkeypatch.setattr(bronze_s3, "BRONZE_PREFIX", "bronze/usajobs")
+
+    def write(run_id: str, page: int, pid: str, day: dt.date = DAY) -> str:
+        key = bronze_s3.bronze_key(run_id, page, date=day)
+        bronze_s3.put_json_gz(
+            key,
+            {
+                "request": {"params": {"Page": page}},
+                "response": {
+                    "status": 200,
+                    "received_at": "2025-09-03T10:00:00.000000Z",
+                    "payload": _payload(pid),
+                },
+                "ingest": {"ingest_run_id": run_id},
+            },
+        )
+        return key
+
+    return write
+
+
+@pytest.fixture()
+def loaded(monkeypatch) -> list[Any]:
+    calls: list[Any] = []
+
+    def _fake_upsert(conn, rows, **kwargs):
+        calls.append(rows)
+        return LoadResult(dict.fromkeys(rows.job["position_id"], 1), inserted=len(rows))
+
+    class _StubConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(run_mod, "upsert_pages", _fake_upsert)
+    monkeypatch.setattr(
+        run_mod, "validate_page_rows", lambda rows: types.SimpleNamespace(passed=True)
+    )
+    monkeypatch.setattr(run_mod, "engine", types.SimpleNamespace(connect=lambda **kw: _StubConn()))
+    return calls
+
+
+def test_list_bronze_keys_filters_range_and_run(local_bronze):
+    k2 = local_bronze("run-a", 2, "P2")
+    k1 = local_bronze("run-a", 1, "P1")
+    kb = local_bronze("run-b", 1, "P3")
+    local_bronze("run-a", 1, "OLD", day=DAY - dt.timedelta(days=5))
+    local_bronze("run-a", 1, "NEW", day=DAY + dt.timedelta(days=1))
+
+    assert bronze_s3.list_bronze_keys(DAY) == [k1, k2, kb]
+    assert bronze_s3.list_bronze_keys(DAY, run_id="run-b") == [kb]
+    assert (
+        len(bronze_s3.list_bronze_keys(DAY - dt.timedelta(days=5), DAY + dt.timedelta(days=1))) == 5
+    )
+    assert bronze_s3.parse_bronze_key(k2) == (DAY, "run-a", 2)
+    assert bronze_s3.get_json_gz(k1)["response"]["payload"] == _payload("P1")
+
+
+def test_replay_loads_pages_in_order_with_original_lineage(local_bronze, loaded):
+    for page in range(1, 6):
+        local_bronze("run-a", page, f"P{page}")
+    cfg = replay_mod.ReplayConfig(start=DAY, end=DAY, workers=3, load_mode="bulk")
+
+    total = replay_mod.replay(cfg)
+
+    assert total["pages"] == 5 and total["jobs"] == 5 and total["inserted"] == 5
+    jobs = [rows.bundles()[0].job for rows in loaded]
+    assert [j.position_id for j in jobs] == [f"P{p}" for p in range(1, 6)]
+    assert {j.ingest_run_id for j in jobs} == {"run-a"}
+    assert jobs[0].source_event_time == dt.datetime(2025, 9, 3, 10, tzinfo=dt.UTC)
+
+
+def test_replay_run_id_override_and_config(local_bronze, loaded, monkeypatch):
+    local_bronze("run-a", 1, "P1")
+    monkeypatch.setenv("REPLAY_FROM", DAY.isoformat())
+    monkeypatch.setenv("RUN_ID", "replay-1")
+    monkeypatch.setenv("REPLAY_WORKERS", "2")
+    cfg = replay_mod.load_replay_config()
+    assert (cfg.start, cfg.end, cfg.workers) == (DAY, DAY, 2)
+
+    assert replay_mod.main() == 0
+    assert loaded[0].job["ingest_run_id"] == ["replay-1"]
+
+    monkeypatch.delenv("REPLAY_FROM")
+    assert replay_mod.main() == 1
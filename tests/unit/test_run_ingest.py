@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import types
+from datetime import UTC, datetime
 from typing import Any
 
 import pytest
 
+from tasman_etl.db.repository import LoadResult
+
 # Target module under test
 from tasman_etl.runner import run as run_mod
 
@@ -66,7 +69,12 @@ def capture_bronze(monkeypatch):
         store[key] = doc
         return {"mocked": True}
 
+    def _fake_manifest_write(self):
+        store["manifest"] = self.to_dict()
+        return f"manifests/run={self.run_id}.json"
+
     _patch(monkeypatch, "put_json_gz", _fake_put)
+    monkeypatch.setattr(run_mod.RunManifest, "write", _fake_manifest_write)
     return store
 
 
@@ -74,11 +82,24 @@ def capture_bronze(monkeypatch):
 def fake_upsert(monkeypatch):
     calls: list[Any] = []
 
-    def _fake_upsert(conn, bundle, **kwargs):
-        calls.append(bundle)
-        return 42  # stable fake job_id
+    def _fake_upsert(conn, rows, **kwargs):
+        calls.extend(rows.job["position_id"])
+        # stable fake job_id; everything counts as newly inserted
+        return LoadResult(dict.fromkeys(rows.job["position_id"], 42), inserted=len(rows))
 
-    _patch(monkeypatch, "upsert_page", _fake_upsert)
+    _patch(monkeypatch, "upsert_pages", _fake_upsert)
+    return calls
+
+
+@pytest.fixture()
+def fake_copy(monkeypatch):
+    calls: list[Any] = []
+
+    def _fake_copy(conn, rows, **kwargs):
+        calls.extend(rows.job["position_id"])
+        return LoadResult(dict.fromkeys(rows.job["position_id"], 7), unchanged=len(rows))
+
+    _patch(monkeypatch, "copy_pages", _fake_copy)
     return calls
 
 
@@ -86,10 +107,10 @@ def fake_upsert(monkeypatch):
 def fake_validate(monkeypatch):
     state = {"passed": True}
 
-    def _fake_validate(jobs, locs):
+    def _fake_validate(rows):
         return types.SimpleNamespace(passed=state["passed"], rules=[])
 
-    _patch(monkeypatch, "validate_page_jobs", _fake_validate)
+    _patch(monkeypatch, "validate_page_rows", _fake_validate)
     return state
 
 
@@ -125,11 +146,26 @@ def test_ingest_search_page_happy(stub_client, capture_bronze, fake_upsert, fake
     assert stats["locations"] == 1
     assert stats["categories"] == 1
     assert stats["grades"] == 1
+    assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (1, 0, 0)
     assert len(fake_upsert) == 1
     assert stub_client.calls, "Client should have been invoked"
     assert any(key.endswith("page=0001.json.gz") for key in capture_bronze)
 
 
+def test_ingest_search_page_reuses_passed_client(capture_bronze, fake_upsert, fake_validate):
+    shared = _StubClient()
+    for page in (1, 2):
+        run_mod.ingest_search_page(
+            run_id="rid-shared",
+            page=page,
+            keyword="data",
+            location_name=None,
+            radius_miles=None,
+            client=shared,  # type: ignore[arg-type]
+        )
+    assert [c["page"] for c in shared.calls] == [1, 2]
+
+
 def test_ingest_search_page_dq_gate_blocks(stub_client, capture_bronze, fake_upsert, fake_validate):
     fake_validate["passed"] = False
     with pytest.raises(RuntimeError):
@@ -160,3 +196,158 @@ def test_ingest_search_page_dq_gate_disabled(
     # Should still load
     assert stats["jobs"] == 1
     assert fake_upsert, "Upsert should have occurred with gate disabled"
+
+
+def test_ingest_search_page_copy_mode(
+    stub_client, capture_bronze, fake_upsert, fake_copy, fake_validate
+):
+    stats = run_mod.ingest_search_page(
+        run_id="rid-4",
+        page=1,
+        keyword="data",
+        location_name=None,
+        radius_miles=None,
+        load_mode="copy",
+    )
+    assert stats["jobs"] == 1
+    assert stats["unchanged"] == 1, "Loader change counts should flow into run stats"
+    assert len(fake_copy) == 1, "COPY loader should receive the page"
+    assert not fake_upsert, "Bulk loader should not run in copy mode"
+
+
+def test_main_fetches_all_pages_with_one_client(
+    monkeypatch, capture_bronze, fake_upsert, fake_validate
+):
+    created: list[Any] = []
+
+    class _MultiPageClient(_StubClient):
+        def fetch_search_pages(self, **kwargs):
+            assert kwargs["pages"] == 3
+            assert kwargs["concurrency"] == 2
+            assert kwargs["auto_page_size"] is True and callable(kwargs["on_plan"])
+            for page in (1, 2, 3):
+                request_dict, response_dict = self.fetch_search_page(page=page)
+                yield page, request_dict, response_dict
+
+        def connection_stats(self):
+            return {"requests": len(self.calls)}
+
+    def _factory():
+        created.append(_MultiPageClient())
+        return created[-1]
+
+    monkeypatch.setattr(run_mod, "UsaJobsClient", _factory)
+    monkeypatch.setenv("KEYWORD", "data")
+    monkeypatch.setenv("MAX_PAGES", "3")
+    monkeypatch.setenv("FETCH_CONCURRENCY", "2")
+    monkeypatch.setenv("RUN_ID", "rid-main")
+
+    assert run_mod.main() == 0
+    assert len(created) == 1
+    assert len(fake_upsert) == 3
+    manifest = capture_bronze.pop("manifest")
+    assert sorted(k.rsplit("/", 1)[-1] for k in capture_bronze) == [
+        "page=0001.json.gz",
+        "page=0002.json.gz",
+        "page=0003.json.gz",
+    ]
+    assert manifest["run_id"] == "rid-main"
+    assert [p["page"] for p in manifest["pages"]] == [1, 2, 3]
+    assert all(p["position_ids"] == ("PID-UNIT-1",) for p in manifest["pages"])
+
+
+def test_main_incremental_stops_at_stored_page_and_advances_watermark(
+    monkeypatch, capture_bronze, fake_upsert, fake_validate
+):
+    stored = {"PID-OLD-1", "PID-OLD-2"}
+    state: dict[str, Any] = {"fetch": None, "advanced": [], "closed": False}
+
+    def _item(pid: str, published: str) -> dict:
+        return {
+            "MatchedObjectId": pid,
+            "MatchedObjectDescriptor": {
+                "PositionID": pid,
+                "PositionTitle": "Data Engineer",
+                "PositionURI": f"https://example/job/{pid}",
+                "PublicationStartDate": published,
+            },
+        }
+
+    pages = {
+        1: [_item("PID-NEW-1", "2025-09-09T00:00:00Z"), _item("PID-NEW-2", "2025-09-08T00:00:00Z")],
+        2: [_item("PID-NEW-3", "2025-09-07T00:00:00Z"), _item("PID-OLD-1", "2025-09-01T00:00:00Z")],
+        3: [_item("PID-OLD-2", "2025-08-30T00:00:00Z")],  # nothing new: paging stops here
+        4: [_item("PID-OLDER", "2025-08-01T00:00:00Z")],
+    }
+
+    class _IncrementalClient(_StubClient):
+        def fetch_search_pages(self, **kwargs):
+            state["fetch"] = kwargs
+            try:
+                for page, items in pages.items():
+                    payload = {
+                        "SearchResult": {
+                            "SearchResultCount": len(items),
+                            "SearchResultCountAll": 6,
+                            "SearchResultItems": items,
+                        }
+                    }
+                    yield page, {"params": {"Page": page}}, {"status": 200, "payload": payload}
+            finally:
+                state["closed"] = True
+
+        def connection_stats(self):
+            return {}
+
+    monkeypatch.setattr(run_mod, "UsaJobsClient", _IncrementalClient)
+    monkeypatch.setattr(
+        run_mod, "read_watermark", lambda conn, key: datetime(2025, 9, 5, tzinfo=UTC)
+    )
+    monkeypatch.setattr(run_mod, "known_position_ids", lambda conn, ids: set(ids) & stored)
+    monkeypatch.setattr(
+        run_mod,
+        "advance_watermark",
+        lambda conn, key, high_water, run_id: state["advanced"].append((key, high_water, run_id)),
+    )
+    monkeypatch.setattr(run_mod, "date_posted_days", lambda since: 6)
+    monkeypatch.setenv("KEYWORD", "data")
+    monkeypatch.setenv("MAX_PAGES", "10")
+    monkeypatch.setenv("RUN_ID", "rid-incr")
+    monkeypatch.setenv("INCREMENTAL", "true")
+
+    assert run_mod.main() == 0
+    assert (state["fetch"]["date_posted"], state["fetch"]["newest_first"]) == (6, True)
+    assert state["closed"], "The page source should be closed once caught up"
+    # Pages 1-2 load (including the already-stored PID-OLD-1 on a mixed page); 3+ do not
+    assert fake_upsert == ["PID-NEW-1", "PID-NEW-2", "PID-NEW-3", "PID-OLD-1"]
+    assert sorted(k.rsplit("/", 1)[-1] for k in capture_bronze if k != "manifest") == [
+        "page=0001.json.gz",
+        "page=0002.json.gz",
+    ]
+    [(key, high_water, run_id)] = state["advanced"]
+    assert key == "keyword=data|location=|radius=" and run_id == "rid-incr"
+    assert high_water == datetime(2025, 9, 9, tzinfo=UTC)
+
+
+def test_main_incremental_keeps_watermark_on_failure(
+    monkeypatch, capture_bronze, fake_upsert, fake_validate
+):
+    advanced: list[Any] = []
+
+    class _FailingClient(_StubClient):
+        def fetch_search_pages(self, **kwargs):
+            yield 1, *self.fetch_search_page(page=1)
+            raise RuntimeError("page 2 failed")
+
+        def connection_stats(self):
+            return {}
+
+    monkeypatch.setattr(run_mod, "UsaJobsClient", _FailingClient)
+    monkeypatch.setattr(run_mod, "read_watermark", lambda conn, key: None)
+    monkeypatch.setattr(run_mod, "known_position_ids", lambda conn, ids: set())
+    monkeypatch.setattr(run_mod, "advance_watermark", lambda *a: advanced.append(a))
+    monkeypatch.setenv("KEYWORD", "data")
+    monkeypatch.setenv("INCREMENTAL", "1")
+
+    assert run_mod.main() == 1
+    assert fake_upsert == ["PID-UNIT-1"] and not advanced
@@ -3,15 +3,32 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 
-from tasman_etl.models import ApiResponse, parse_page_json
+import pytest
+from pydantic_core import from_json
+
+from tasman_etl.models import (
+    ApiResponse,
+    JobCategoryRecord,
+    JobGradeRecord,
+    JobLocationRecord,
+    parse_page_json,
+)
 from tasman_etl.transform import (
+    DETAILS_COLUMNS,
+    JOB_COLUMNS,
+    LOCATION_COLUMNS,
     Bundle,
     as_category_rows,
     as_details_row,
     as_grade_rows,
     as_job_row,
     as_location_rows,
+    content_item,
     normalise_page,
+    normalise_page_rows,
+    page_rows_from_bundles,
+    raw_json_items,
+    trim_item,
 )
 
 
@@ -45,15 +62,15 @@ def test_normalise_page_with_sample():
 
     # Row mapping spot checks
     job_row = as_job_row(b0.job)
-    assert job_row["position_id"] == b0.job.position_id
+    assert job_row[JOB_COLUMNS.index("position_id")] == b0.job.position_id
     details_row = as_details_row(b0.details)
-    assert "job_summary" in details_row
+    assert details_row[DETAILS_COLUMNS.index("job_summary")] == b0.details.job_summary
     loc_rows = as_location_rows(1, b0.locations)
-    assert loc_rows and loc_rows[0]["loc_idx"] == 0
+    assert loc_rows and loc_rows[0][1 + LOCATION_COLUMNS.index("loc_idx")] == 0
     cat_rows = as_category_rows(1, b0.categories)
     grade_rows = as_grade_rows(1, b0.grades)
     # Ensure referential job_id assigned in mapping helpers
-    assert all(r["job_id"] == 1 for r in (*loc_rows, *cat_rows, *grade_rows))
+    assert all(r[0] == 1 for r in (*loc_rows, *cat_rows, *grade_rows))
 
 
 def test_normalise_page_minimal_item():
@@ -111,7 +128,7 @@ def test_extra_fields_ignored():
     assert bundles[0].job.position_title == "Data Scientist"
     # Unknown field should not appear in JobRecord row mapping
     job_row = as_job_row(bundles[0].job)
-    assert "UnknownField" not in job_row
+    assert len(job_row) == len(JOB_COLUMNS) and "SHOULD_BE_IGNORED" not in job_row
 
 
 def test_translation_of_major_duties_join():
@@ -135,3 +152,220 @@ def test_translation_of_major_duties_join():
     resp = ApiResponse.model_validate(payload)
     bundle = normalise_page(resp, ingest_run_id="rid", source_event_time=None)[0]
     assert bundle.details.major_duties == "A; B; C"
+
+
+def test_column_lists_match_row_mappers():
+    payload = {
+        "SearchResult": {
+            "SearchResultCount": 1,
+            "SearchResultCountAll": 1,
+            "SearchResultItems": [
+                {
+                    "MatchedObjectDescriptor": {
+                        "PositionID": "PID-4",
+                        "PositionTitle": "Analyst",
+                        "PositionURI": "https://x.example/job/4",
+                    },
+                }
+            ],
+        }
+    }
+    resp = ApiResponse.model_validate(payload)
+    bundle = normalise_page(resp, ingest_run_id="rid", source_event_time=None)[0]
+    # Loaders bind positionally in these orders; they must not drift from the mappers
+    assert as_job_row(bundle.job) == tuple(getattr(bundle.job, c) for c in JOB_COLUMNS)
+    assert as_details_row(bundle.details) == tuple(
+        getattr(bundle.details, c) for c in DETAILS_COLUMNS
+    )
+    loc = JobLocationRecord(loc_idx=3, city_name="Chicago", latitude=41.8, longitude=-87.6)
+    assert as_location_rows(7, [loc]) == [(7, *(getattr(loc, c) for c in LOCATION_COLUMNS))]
+    assert as_category_rows(7, [JobCategoryRecord(code="2210", name="IT")]) == [(7, "2210", "IT")]
+    assert as_grade_rows(7, [JobGradeRecord(code="12")]) == [(7, "12")]
+
+
+def test_raw_items_are_carried_verbatim():
+    payload = from_json(
+        b'{"SearchResult":{"SearchResultCount":2,"SearchResultCountAll":2,"SearchResultItems":['
+        b'{"MatchedObjectId":"Z1","MatchedObjectDescriptor":{"PositionID":"PID-5",'
+        b'"PositionTitle":"  Analyst  ","PositionURI":"https://x.example/job/5","New":1}},'
+        b'{"MatchedObjectDescriptor":{"PositionID":"PID-6","PositionTitle":"Engineer",'
+        b'"PositionURI":"https://x.example/job/6"}}]}}'
+    )
+    raw_items = payload["SearchResult"]["SearchResultItems"]
+    resp = ApiResponse.model_validate(payload)
+    bundles = normalise_page(resp, ingest_run_id="rid", source_event_time=None, raw_items=raw_items)
+    # raw_json is the item as received (unknown fields, untrimmed strings), not a model dump
+    assert [b.job.raw_json for b in bundles] == raw_items
+    # No deep copy/re-serialisation: nested values are the parsed objects themselves
+    descriptor = raw_items[0]["MatchedObjectDescriptor"]
+    assert bundles[0].job.raw_json["MatchedObjectDescriptor"] is descriptor
+    assert bundles[0].job.position_title == "Analyst"  # validated fields still normalised
+
+    dumped = normalise_page(resp, ingest_run_id="rid", source_event_time=None)
+    assert "New" not in dumped[0].job.raw_json["MatchedObjectDescriptor"]
+
+    with pytest.raises(RuntimeError, match="raw_items"):
+        normalise_page(resp, ingest_run_id="rid", source_event_time=None, raw_items=raw_items[:1])
+
+
+def _rich_payload() -> dict:
+    def item(pid: str, pay: tuple[str, str], n_locs: int) -> dict:
+        return {
+            "MatchedObjectId": f"M-{pid}",
+            "MatchedObjectDescriptor": {
+                "PositionID": pid,
+                "PositionTitle": " Data Engineer ",
+                "PositionURI": f"https://x.example/job/{pid}",
+                "ApplyURI": [f"https://apply.example/{pid}"],
+                "PositionLocation": [
+                    {"LocationName": f"City {k}", "CityName": f"City {k}", "Latitude": 41.8}
+                    for k in range(n_locs)
+                ],
+                "JobCategory": [{"Code": "2210", "Name": "IT"}, {"Code": "1560"}],
+                "JobGrade": [{"Code": "12"}],
+                "PositionRemuneration": [
+                    {"MinimumRange": pay[0], "MaximumRange": pay[1], "RateIntervalCode": "PA"}
+                ],
+                "PublicationStartDate": "2025-09-01T00:00:00",
+                "UserArea": {
+                    "Details": {
+                        "MajorDuties": ["A", "B"],
+                        "HiringPath": ["public"],
+                        "TeleworkEligible": "yes",
+                        "PositionSensitivitiy": "Low",
+                    }
+                },
+            },
+        }
+
+    return {
+        "SearchResult": {
+            "SearchResultCount": 3,
+            "SearchResultCountAll": 3,
+            "SearchResultItems": [
+                item("PID-7", ("$90,000", "120000.00"), 3),
+                {
+                    "MatchedObjectDescriptor": {
+                        "PositionID": "PID-8",
+                        "PositionTitle": "Analyst",
+                        "PositionURI": "https://x.example/job/8",
+                    }
+                },
+                item("PID-9", ("1", "2"), 0),
+            ],
+        }
+    }
+
+
+def test_page_rows_match_dto_path():
+    payload = _rich_payload()
+    raw_items = payload["SearchResult"]["SearchResultItems"]
+    resp = ApiResponse.model_validate(payload)
+    t = datetime(2025, 9, 3, tzinfo=UTC)
+
+    for raw in (raw_items, None):
+        rows = normalise_page_rows(resp, "rid", t, raw)
+        # Same rows as building every DTO first (strict mode)
+        assert rows == normalise_page_rows(resp, "rid", t, raw, strict=True)
+        assert rows == page_rows_from_bundles(normalise_page(resp, "rid", t, raw))
+
+    assert len(rows) == 3 and tuple(rows.job) == JOB_COLUMNS
+    assert rows.job["pay_min"] == [90000, None, 1]
+    assert rows.job["telework_eligible"] == [True, None, True]
+    assert rows.details["major_duties"] == ["A; B", None, "A; B"]
+    assert rows.details["position_sensitivity"] == ["Low", None, "Low"]
+    assert rows.locations["item"] == [0, 0, 0] and rows.locations["loc_idx"] == [0, 1, 2]
+    assert [len(x) for x in rows.children("categories")] == [2, 0, 2]
+    assert list(rows.rows("grades")) == [(0, "12"), (2, "12")]
+
+    # Materialising DTOs from the columns gives back the normal bundles
+    bundles = normalise_page(resp, "rid", t, raw_items)
+    again = normalise_page_rows(resp, "rid", t, raw_items).bundles()
+    assert [b.job for b in again] == [b.job for b in bundles]
+    assert [b.details for b in again] == [b.details for b in bundles]
+    assert [b.locations for b in again] == [b.locations for b in bundles]
+
+
+def test_page_rows_keep_dto_rules():
+    payload = _rich_payload()
+    descriptor = payload["SearchResult"]["SearchResultItems"][0]["MatchedObjectDescriptor"]
+    descriptor["PositionRemuneration"][0]["MinimumRange"] = "150000"
+    resp = ApiResponse.model_validate(payload)
+    for strict in (False, True):
+        with pytest.raises(ValueError, match="pay_min cannot exceed pay_max"):
+            normalise_page_rows(resp, "rid", None, strict=strict)
+    with pytest.raises(RuntimeError, match="raw_items"):
+        normalise_page_rows(resp, "rid", None, raw_items=[])
+
+
+def test_page_rows_take_renumbers_children():
+    resp = ApiResponse.model_validate(_rich_payload())
+    rows = normalise_page_rows(resp, "rid", None)
+    sub = rows.take([1, 2])
+    assert sub.job["position_id"] == ["PID-8", "PID-9"]
+    assert sub.locations["item"] == []
+    assert list(sub.rows("grades")) == [(1, "12")]
+    assert sub.children("categories") == [[], rows.children("categories")[2]]
+    # Same rows as normalising just those items
+    only = _rich_payload()
+    only["SearchResult"]["SearchResultItems"] = only["SearchResult"]["SearchResultItems"][1:]
+    assert sub == normalise_page_rows(ApiResponse.model_validate(only), "rid", None)
+
+
+def test_raw_json_modes():
+    payload = _rich_payload()
+    payload["SearchResult"]["SearchResultItems"][0]["MatchedObjectDescriptor"]["UserArea"][
+        "IsRadialSearch"
+    ] = False
+    raw_items = payload["SearchResult"]["SearchResultItems"]
+    resp = ApiResponse.model_validate(payload)
+
+    # Search-specific keys are never stored; otherwise verbatim is the item as received
+    raw_items[0]["RelevanceRank"] = 4
+    verbatim = raw_json_items(raw_items, "verbatim")
+    assert verbatim is not None
+    assert [set(it) for it in verbatim] == [{"MatchedObjectDescriptor"}] * 3
+    assert verbatim[0]["MatchedObjectDescriptor"] is raw_items[0]["MatchedObjectDescriptor"]
+    assert raw_json_items(raw_items, "model") is None
+    assert raw_json_items(raw_items) == raw_json_items(raw_items, "trimmed")
+    with pytest.raises(RuntimeError, match="RAW_JSON_MODE"):
+        raw_json_items(raw_items, "lean")
+
+    trimmed = raw_json_items(raw_items, "trimmed")
+    assert trimmed is not None
+    assert set(trimmed[0]) == {"MatchedObjectDescriptor"}
+    desc = trimmed[0]["MatchedObjectDescriptor"]
+    # Child arrays and mapped Details keys (both PositionSensitivity spellings) are dropped;
+    # everything silver does not store stays verbatim, and the input is not mutated
+    assert {"PositionLocation", "JobCategory", "JobGrade"}.isdisjoint(desc)
+    assert desc["UserArea"] == {"Details": {}, "IsRadialSearch": False}
+    assert desc["ApplyURI"] == ["https://apply.example/PID-7"]
+    assert (
+        desc["PositionRemuneration"]
+        == raw_items[0]["MatchedObjectDescriptor"]["PositionRemuneration"]
+    )
+    assert raw_items[0]["MatchedObjectDescriptor"]["PositionLocation"]
+    assert trim_item({"MatchedObjectId": "x"}) == {"MatchedObjectId": "x"}
+
+    # Only raw_json differs between modes
+    rows = {
+        mode: normalise_page_rows(resp, "rid", None, raw_json_items(raw_items, mode))
+        for mode in ("verbatim", "trimmed", "model")
+    }
+    assert rows["trimmed"].job["raw_json"] == trimmed
+    assert "details" not in rows["model"].job["raw_json"][0]["MatchedObjectDescriptor"]
+    for r in rows.values():
+        r.job.pop("raw_json")
+    assert rows["verbatim"] == rows["trimmed"] == rows["model"]
+
+
+def test_content_item_ignores_search_keys_and_trimming():
+    raw = _rich_payload()["SearchResult"]["SearchResultItems"][0]
+    projected = content_item(raw)
+    assert content_item({**raw, "RelevanceRank": 99, "MatchedObjectId": "other"}) == projected
+    assert content_item(trim_item(raw)) == projected
+    # Only what no column holds is left of the descriptor
+    desc = projected["MatchedObjectDescriptor"]
+    assert {"PositionID", "PositionTitle", "ApplyURI", "PositionLocation"}.isdisjoint(desc)
+    assert desc["PositionRemuneration"] == raw["MatchedObjectDescriptor"]["PositionRemuneration"]
+    assert content_item({"demo": True}) == {"demo": True}
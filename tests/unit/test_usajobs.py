@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from tasman_etl.http.ratelimit import RateLimiter
+from tasman_etl.http.usajobs import UsaJobsClient
+
+
+def _payload(page: int, items: int, number_of_pages: int | None) -> dict:
+    # No SearchResultCountAll: pages are planned from NumberOfPages (see test_paging.py)
+    user_area = {} if number_of_pages is None else {"NumberOfPages": str(number_of_pages)}
+    return {
+        "SearchResult": {
+            "SearchResultCount": items,
+            "SearchResultItems": [{"page": page}] * items,
+            "UserArea": user_area,
+        }
+    }
+
+
+@pytest.fixture()
+def client(monkeypatch) -> UsaJobsClient:
+    monkeypatch.setenv("USAJOBS_USER_AGENT", "unit@example.com")
+    monkeypatch.setenv("USAJOBS_AUTH_KEY", "unit-key")
+    return UsaJobsClient()
+
+
+def _stub_fetch(monkeypatch, client, *, number_of_pages, items=10, delay=0.0):
+    state = {"in_flight": 0, "max_in_flight": 0, "pages": []}
+    lock = threading.Lock()
+
+    def _fetch(**kwargs):
+        page = kwargs["page"]
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            state["pages"].append(page)
+        # Later pages return faster, so completion order differs from page order
+        time.sleep(delay / page)
+        with lock:
+            state["in_flight"] -= 1
+        return {"params": kwargs}, {"payload": _payload(page, items, number_of_pages)}
+
+    monkeypatch.setattr(client, "fetch_search_page", _fetch)
+    return state
+
+
+def test_fetch_search_pages_in_order_with_bounded_concurrency(monkeypatch, client):
+    state = _stub_fetch(monkeypatch, client, number_of_pages=6, delay=0.05)
+    out = list(client.fetch_search_pages(keyword="data", results_per_page=10, concurrency=2))
+    assert [p for p, _, _ in out] == [1, 2, 3, 4, 5, 6]
+    assert all(
+        resp["payload"]["SearchResult"]["SearchResultItems"][0]["page"] == p for p, _, resp in out
+    )
+    assert state["max_in_flight"] <= 2
+
+
+def test_fetch_search_pages_caps_at_max_pages_and_total(monkeypatch, client):
+    state = _stub_fetch(monkeypatch, client, number_of_pages=3)
+    out = list(client.fetch_search_pages(keyword="data", pages=20, concurrency=4))
+    assert [p for p, _, _ in out] == [1, 2, 3]
+    assert sorted(state["pages"]) == [1, 2, 3]
+
+
+def test_fetch_search_pages_without_page_count_stops_on_short_page(monkeypatch, client):
+    state = _stub_fetch(monkeypatch, client, number_of_pages=None, items=5)
+    out = list(client.fetch_search_pages(keyword="data", results_per_page=10, pages=5))
+    # First page is already short -> no further requests
+    assert [p for p, _, _ in out] == [1]
+    assert state["pages"] == [1]
+
+
+class _FakeResponse:
+    status_code = 200
+    headers = {"Content-Type": "application/hr+json; charset=utf-8"}
+    text = "{}"
+
+    @property
+    def content(self) -> bytes:
+        return json.dumps(_payload(1, 1, 1)).encode()
+
+    def json(self):
+        return _payload(1, 1, 1)
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return _FakeResponse()
+
+
+def test_default_session_pools_keepalive_connections(monkeypatch):
+    monkeypatch.setenv("USAJOBS_USER_AGENT", "unit@example.com")
+    monkeypatch.setenv("USAJOBS_AUTH_KEY", "unit-key")
+    c = UsaJobsClient(pool_size=6)
+    adapter = c._http.get_adapter(c.base_url)
+    assert adapter._pool_maxsize == 6
+    assert c._headers["Accept-Encoding"].startswith("gzip")
+    c.close()
+
+
+def test_fetch_uses_client_session_and_records_latency(client):
+    session = _FakeSession()
+    client._http = session  # type: ignore[assignment]
+    for page in (1, 2, 3):
+        client.fetch_search_page(keyword="data", page=page)
+    assert [c["params"]["Page"] for c in session.calls] == [1, 2, 3]
+    assert session.calls[0]["headers"]["Authorization-Key"] == "unit-key"
+    stats = client.connection_stats()
+    assert stats["requests"] == 3
+    assert stats["latency_ms_first"] is not None
+    assert stats["latency_ms_avg_warm"] is not None
+
+
+class _ThrottledSession:
+    """429 with Retry-After first, then a normal 200."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            r = _FakeResponse()
+            r.status_code = 429
+            r.headers = {"Retry-After": "2", "Content-Type": "application/json"}
+            return r
+        return _FakeResponse()
+
+
+def test_fetch_retries_429_after_retry_after_without_backoff(monkeypatch, client):
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def _sleep(s: float) -> None:
+        sleeps.append(s)
+        now[0] += s
+
+    limiter = RateLimiter(max_rate=100.0, burst=5, clock=lambda: now[0], sleep=_sleep)
+    client.rate_limiter = limiter
+    client._http = _ThrottledSession()  # type: ignore[assignment]
+    monkeypatch.setattr(time, "sleep", _sleep)
+
+    _, resp = client.fetch_search_page(keyword="data")
+    assert resp["status"] == 200
+    assert client._http.calls == 2
+    # The limiter held the retry for Retry-After; no exponential backoff on top
+    assert sleeps and 1.9 <= sum(sleeps) <= 2.1
+    assert client.connection_stats()["rate_limit"]["throttled"] == 1
+
+
+def test_fetch_sends_date_posted_and_newest_first(client):
+    session = _FakeSession()
+    client._http = session  # type: ignore[assignment]
+    client.fetch_search_page(keyword="data")
+    client.fetch_search_page(keyword="data", date_posted=3, newest_first=True)
+    assert {"DatePosted", "SortField", "SortDirection"}.isdisjoint(session.calls[0]["params"])
+    params = session.calls[1]["params"]
+    assert (params["DatePosted"], params["SortField"], params["SortDirection"]) == (
+        3,
+        "OpenDate",
+        "Desc",
+    )
+
+
+def test_fetch_search_pages_passes_incremental_filters(monkeypatch, client):
+    seen: list[dict] = []
+
+    def _fetch(**kwargs):
+        seen.append(kwargs)
+        return {"params": kwargs}, {"payload": _payload(kwargs["page"], 10, 2)}
+
+    monkeypatch.setattr(client, "fetch_search_page", _fetch)
+    list(client.fetch_search_pages(keyword="data", date_posted=2, newest_first=True))
+    assert [(k["page"], k["date_posted"], k["newest_first"]) for k in seen] == [
+        (1, 2, True),
+        (2, 2, True),
+    ]
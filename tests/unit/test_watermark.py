@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from tasman_etl.db.watermark import date_posted_days, search_key
+
+NOW = datetime(2025, 9, 10, 6, 0, tzinfo=UTC)
+
+
+def test_search_key_normalises_filters():
+    assert search_key(" Data  Engineer ", "Chicago, Illinois", 25) == search_key(
+        "data engineer", "chicago, illinois", 25
+    )
+    assert search_key("data") == "keyword=data|location=|radius="
+    assert search_key("data", radius_miles=25) != search_key("data", radius_miles=50)
+
+
+def test_date_posted_days_from_watermark():
+    assert date_posted_days(None, NOW) is None
+    # A day of overlap on top of the (rounded up) age of the watermark
+    assert date_posted_days(NOW - timedelta(hours=20), NOW) == 2
+    assert date_posted_days(NOW - timedelta(days=3), NOW) == 4
+    assert date_posted_days(NOW + timedelta(hours=1), NOW) == 1
+    # Naive datetimes are taken as UTC
+    assert date_posted_days(datetime(2025, 9, 9, 6, 0), NOW) == 2
+    # Beyond the API's 60-day limit: no filter (full pull, early stop still applies)
+    assert date_posted_days(NOW - timedelta(days=59), NOW) == 60
+    assert date_posted_days(NOW - timedelta(days=60), NOW) is None